@@ -0,0 +1,272 @@
+import os
+import json
+import math
+import time
+import pygame
+from collections import OrderedDict
+import constants
+
+def load_frames_safely(base_path, count, start_from=1):
+    """Safely load animation frames, skip if the file does not exist"""
+    frames = []
+    for i in range(start_from, start_from + count):
+        file_path = f"{base_path}/frame-{i}.png"
+        if os.path.exists(file_path):
+            frames.append(pygame.image.load(file_path).convert_alpha())
+        else:
+            print(f"Warning: {file_path} not found, skipping...")
+    return frames if frames else [pygame.Surface((40, 40))]  # Returns a blank image if no frame is found
+
+# Spritesheets: one image per animation plus a metadata file, both next to the frame-N.png files.
+# Metadata (JSON): {"image": "sheet.png", "start_from": 1, "frame_ms": 10, "frames": [[x, y, w, h], ...]}
+SHEET_METADATA = "sheet.json"
+
+# Animations packed by build_spritesheets(): (base_path, count, start_from, frame_ms)
+ANIMATIONS = [
+    ("assets/img/player", 13, 1, 3),
+    ("assets/img/items/bolt_effect", 7, 1, 35),
+    ("assets/img/enemy", 8, 1, 25),
+    ("assets/img/hit/slash", 12, 0, 50),
+    ("assets/img/hit/freeze", 62, 1, 10),
+]
+
+# Metadata already read, by base_path (None when the folder has no usable sheet)
+sheet_metadata = {}
+
+def read_sheet_metadata(base_path):
+    """Get the spritesheet metadata of an animation folder, or None if it has no sheet"""
+    if base_path in sheet_metadata:
+        return sheet_metadata[base_path]
+    metadata = None
+    path = os.path.join(base_path, SHEET_METADATA)
+    if os.path.exists(path):
+        try:
+            with open(path, "r") as f:
+                metadata = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: could not read {path} ({e}), using frame files")
+    sheet_metadata[base_path] = metadata
+    return metadata
+
+def load_sheet_frames(base_path, count, start_from=1):
+    """
+    Slice an animation out of its spritesheet
+    Returns:
+        List of subsurfaces sharing the sheet's pixels, or None when there is no usable sheet
+    """
+    metadata = read_sheet_metadata(base_path)
+    if metadata is None or metadata.get("start_from") != start_from or len(metadata["frames"]) < count:
+        return None
+    sheet = pygame.image.load(os.path.join(base_path, metadata["image"])).convert_alpha()
+    return [sheet.subsurface(rect) for rect in metadata["frames"][:count]]
+
+def build_spritesheet(base_path, count, start_from=1, frame_ms=None, image_name="sheet.png"):
+    """
+    Pack an animation's frame-N.png files into one sheet and write its metadata
+    Frames are placed in a grid of equal cells (the largest frame's size), top-left aligned.
+    """
+    frames = load_frames_safely(base_path, count, start_from)
+    cell_width = max(frame.get_width() for frame in frames)
+    cell_height = max(frame.get_height() for frame in frames)
+    columns = math.ceil(math.sqrt(len(frames)))
+    rows = math.ceil(len(frames) / columns)
+
+    sheet = pygame.Surface((columns * cell_width, rows * cell_height), pygame.SRCALPHA)
+    rects = []
+    for index, frame in enumerate(frames):
+        x, y = (index % columns) * cell_width, (index // columns) * cell_height
+        sheet.blit(frame, (x, y))
+        rects.append([x, y, frame.get_width(), frame.get_height()])
+
+    pygame.image.save(sheet, os.path.join(base_path, image_name))
+    metadata = {"image": image_name, "start_from": start_from, "frame_ms": frame_ms, "frames": rects}
+    with open(os.path.join(base_path, SHEET_METADATA), "w") as f:
+        json.dump(metadata, f, indent=4)
+    sheet_metadata[base_path] = metadata
+    print(f"{base_path}: {len(frames)} frames -> {image_name} ({sheet.get_width()}x{sheet.get_height()})")
+
+def build_spritesheets():
+    """Rebuild the sheets of every animation in ANIMATIONS (run after editing frame files)"""
+    for base_path, count, start_from, frame_ms in ANIMATIONS:
+        build_spritesheet(base_path, count, start_from, frame_ms)
+
+def animation_timing(base_path, default):
+    """Get the frame duration (ms) stored in an animation's sheet metadata, or default"""
+    metadata = read_sheet_metadata(base_path)
+    if metadata is None or metadata.get("frame_ms") is None:
+        return default
+    return metadata["frame_ms"]
+
+class FrameCache:
+    """
+    Animation frame sets loaded once per process and shared by every sprite
+
+    Frame sets are keyed by (base_path, count, start_from). The first request
+    decodes the animation's spritesheet (or its frame files when there is no
+    sheet); every later Player/Enemy gets the same surfaces, so
+    spawning a sprite costs no disk I/O. Shared frames must be treated as
+    read-only.
+
+    Each set also carries its horizontally flipped frames, built at load time,
+    as a (flipped, frames) pair; indexing the pair with facing_right picks the
+    variant, so turning around never calls pygame.transform.flip.
+
+    Effect animations (freeze, slash, boost) are loaded as evictable sets:
+    once evictable sets take more than ANIMATION_CACHE_BYTES, the least
+    recently used ones are dropped and decoded again on their next use.
+    Sprites reach them through an Animation handle instead of holding the
+    surfaces, so an evicted set is really freed. Body animations are never
+    evicted.
+
+    Instrumentation: loads, hits, evictions, total load time and resident bytes; see stats().
+    """
+    def __init__(self):
+        # (base_path, count, start_from) -> (flipped frames, frames) tuples of Surfaces, least recently used first
+        self.frame_sets = OrderedDict()
+        self.set_bytes = {}  # key -> pixel memory of the set
+        self.evictable = set()  # keys of the sets that may be evicted
+        self.evictable_bytes = 0
+
+        # Instrumentation
+        self.loads = 0
+        self.hits = 0
+        self.evictions = 0
+        self.load_ms = 0.0
+
+    def get(self, base_path, count, start_from=1, evictable=False):
+        """Get a frame set, loading it on first use"""
+        return self.get_variants(base_path, count, start_from, evictable)[1]
+
+    def get_variants(self, base_path, count, start_from=1, evictable=False):
+        """
+        Get a frame set as a (flipped, frames) pair (index it with facing_right), loading it on first use
+        Args:
+            base_path, count, start_from: Animation folder and frame range
+            evictable: Load the set under the ANIMATION_CACHE_BYTES budget (effect animations)
+        """
+        key = (base_path, count, start_from)
+        variants = self.frame_sets.get(key)
+        if variants is not None:
+            self.hits += 1
+            self.frame_sets.move_to_end(key)
+            return variants
+
+        started = time.perf_counter()
+        frames = load_sheet_frames(base_path, count, start_from)
+        if frames is None:
+            frames = load_frames_safely(base_path, count, start_from)
+        frames = tuple(frames)
+        flipped = tuple(pygame.transform.flip(frame, True, False) for frame in frames)
+        self.load_ms += (time.perf_counter() - started) * 1000
+        self.loads += 1
+        variants = self.frame_sets[key] = (flipped, frames)
+        self.set_bytes[key] = frames_bytes(flipped) + frames_bytes(frames)
+        if evictable:
+            self.evictable.add(key)
+            self.evictable_bytes += self.set_bytes[key]
+            self.evict(keep=key)
+        return variants
+
+    def evict(self, keep=None):
+        """Drop least recently used evictable sets (never keep) until they fit in ANIMATION_CACHE_BYTES"""
+        while self.evictable_bytes > constants.ANIMATION_CACHE_BYTES:
+            key = next((key for key in self.frame_sets if key in self.evictable and key != keep), None)
+            if key is None:
+                break  # Only keep is left; a single set larger than the budget stays until replaced
+            self.remove(key)
+            self.evictions += 1
+
+    def remove(self, key):
+        """Forget one frame set"""
+        del self.frame_sets[key]
+        if key in self.evictable:
+            self.evictable.discard(key)
+            self.evictable_bytes -= self.set_bytes[key]
+        del self.set_bytes[key]
+
+    def clear(self):
+        """Forget every frame set (they are reloaded on next use)"""
+        self.frame_sets.clear()
+        self.set_bytes.clear()
+        self.evictable.clear()
+        self.evictable_bytes = 0
+
+    def resident_bytes(self):
+        """Get the pixel memory held by the cached frames (a spritesheet's subsurfaces count their own area)"""
+        return sum(self.set_bytes.values())
+
+    def stats(self):
+        """Get cache counters"""
+        return {
+            "frame_sets": len(self.frame_sets),
+            "frames": sum(len(frames) for flipped, frames in self.frame_sets.values()),
+            "loads": self.loads,
+            "hits": self.hits,
+            "evictions": self.evictions,
+            "load_ms": self.load_ms,
+            "resident_bytes": self.resident_bytes(),
+            "effect_bytes": self.evictable_bytes,
+        }
+
+def frames_bytes(frames):
+    """Get the pixel memory of a sequence of surfaces"""
+    return sum(frame.get_width() * frame.get_height() * frame.get_bytesize() for frame in frames)
+
+# Frame sets shared by all sprites
+frame_cache = FrameCache()
+
+def load_frames(base_path, count, start_from=1):
+    """Get a shared, read-only animation frame set (loaded from disk only the first time)"""
+    return frame_cache.get(base_path, count, start_from)
+
+def load_frame_variants(base_path, count, start_from=1):
+    """Get a shared (flipped, frames) pair of a frame set; variants[facing_right][index] is the frame to draw"""
+    return frame_cache.get_variants(base_path, count, start_from)
+
+def frame_count(base_path, count, start_from=1):
+    """Get the number of frames an animation will load, without decoding it"""
+    metadata = read_sheet_metadata(base_path)
+    if metadata is not None and metadata.get("start_from") == start_from and len(metadata["frames"]) >= count:
+        return count
+    found = sum(os.path.exists(f"{base_path}/frame-{i}.png") for i in range(start_from, start_from + count))
+    return found or 1  # load_frames_safely returns one blank frame when nothing is found
+
+class Animation:
+    """
+    Handle to an effect animation that is decoded on first use
+
+    len() is known up front; indexing, and variants(), go through the frame
+    cache every time, so fetch frames when drawing them and do not keep them.
+    """
+    __slots__ = ("key", "length")
+
+    def __init__(self, base_path, count, start_from=1):
+        self.key = (base_path, count, start_from)
+        self.length = frame_count(base_path, count, start_from)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        return self.variants()[1][index]
+
+    def variants(self):
+        """Get the (flipped, frames) pair, decoding it if it is not resident"""
+        return frame_cache.get_variants(*self.key, evictable=True)
+
+def effect_animation(base_path, count, start_from=1):
+    """Get a lazy handle to an effect animation (decoded on first draw, evictable under ANIMATION_CACHE_BYTES)"""
+    return Animation(base_path, count, start_from)
+
+def memory_report():
+    """Describe the animation memory currently resident, for logs"""
+    stats = frame_cache.stats()
+    return (f"Animation frames: {stats['frame_sets']} sets, {stats['resident_bytes'] / 1024:.0f} KB resident "
+            f"({stats['effect_bytes'] / 1024:.0f} KB effects, budget {constants.ANIMATION_CACHE_BYTES / 1024:.0f} KB, "
+            f"{stats['evictions']} evictions)")
+
+if __name__ == "__main__":
+    # Rebuild the spritesheets: python animations.py
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    build_spritesheets()
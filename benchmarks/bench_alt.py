@@ -0,0 +1,51 @@
+"""
+Benchmark: A* with landmark (ALT) bounds vs. plain Manhattan A* on every built-in level maze
+Run from the project root:  python benchmarks/bench_alt.py
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import maze
+from constants import TILE_SIZE
+
+def random_queries(count):
+    width = maze.MAZE.width
+    tiles = [((index % width) * TILE_SIZE, (index // width) * TILE_SIZE)
+             for index, tile in enumerate(maze.MAZE.cells) if tile == 0]
+    return [tuple(random.sample(tiles, 2)) for _ in range(count)]
+
+def timed(engine, pathfinder, queries):
+    # Per-maze setup (arrays and landmark tables) happens on the first query; keep it out of the timing
+    pathfinder(*queries[0])
+    engine.reset_stats()
+    start = time.perf_counter()
+    paths = [pathfinder(query_start, query_goal) for query_start, query_goal in queries]
+    elapsed = time.perf_counter() - start
+    return paths, engine.nodes_expanded, elapsed
+
+def run(label, queries):
+    a_star_paths, a_star_expanded, a_star_time = timed(maze.a_star_engine, maze.a_star, queries)
+    alt_paths, alt_expanded, alt_time = timed(maze.alt_engine, maze.alt_star, queries)
+
+    for old, new in zip(a_star_paths, alt_paths):
+        assert len(old) == len(new), "ALT path is not a shortest path"
+
+    count = len(queries)
+    saved = 1 - alt_expanded / a_star_expanded if a_star_expanded else 0.0
+    table = maze.alt_engine.landmarks.stats()
+    print(f"{label:>9}: a_star {a_star_expanded / count:7.1f} expanded {a_star_time / count * 1e6:7.1f} us | "
+          f"alt {alt_expanded / count:6.1f} expanded {alt_time / count * 1e6:7.1f} us | "
+          f"{saved * 100:5.1f}% saved | tables {table['memory_bytes'] / 1024:5.1f} KB {table['build_ms']:5.1f} ms")
+
+if __name__ == "__main__":
+    random.seed(0)
+    for level in sorted(maze.LEVEL_DATA):
+        maze.load_level_maze(level)
+        run(f"Level {level}", random_queries(200))
+    maze.regenerate_maze()
+    run("Random", random_queries(200))
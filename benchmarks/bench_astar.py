@@ -0,0 +1,95 @@
+"""
+Benchmark: maze.a_star (AStarEngine) vs. the original dict/tuple A*
+Run from the project root:  python benchmarks/bench_astar.py
+"""
+import os
+import sys
+import time
+import heapq
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import maze
+from constants import TILE_SIZE
+
+def legacy_a_star(start, goal):
+    """The original maze.a_star: tuple keys, dicts, duplicate heap entries, no closed set"""
+    grid = maze.MAZE
+    start_tile = (start[0] // TILE_SIZE, start[1] // TILE_SIZE)
+    goal_tile = (goal[0] // TILE_SIZE, goal[1] // TILE_SIZE)
+    if not grid.is_walkable(*start_tile) or not grid.is_walkable(*goal_tile):
+        return [], 0
+
+    frontier = [(0, start_tile)]
+    came_from = {start_tile: None}
+    cost_so_far = {start_tile: 0}
+    expanded = 0
+
+    while frontier:
+        _, current = heapq.heappop(frontier)
+        if current == goal_tile:
+            break
+        expanded += 1
+        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            neighbor = (current[0] + dx, current[1] + dy)
+            if (0 <= neighbor[1] < len(grid) and 0 <= neighbor[0] < len(grid[0]) and
+                    grid[neighbor[1]][neighbor[0]] == 0):
+                new_cost = cost_so_far[current] + 1
+                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
+                    cost_so_far[neighbor] = new_cost
+                    priority = new_cost + maze.heuristic(goal_tile, neighbor)
+                    heapq.heappush(frontier, (priority, neighbor))
+                    came_from[neighbor] = current
+
+    path = []
+    if goal_tile in came_from:
+        current = goal_tile
+        while current != start_tile:
+            path.append((current[0] * TILE_SIZE, current[1] * TILE_SIZE))
+            current = came_from[current]
+        path.reverse()
+    return path, expanded
+
+def random_queries(count):
+    queries = []
+    for _ in range(count):
+        queries.append((maze.random_walkable_position(), maze.random_walkable_position()))
+    # random_walkable_position samples the default 31x31 area, so add some full-map queries
+    walkable = [(index % maze.MAZE.width, index // maze.MAZE.width)
+                for index, tile in enumerate(maze.MAZE.cells) if tile == 0]
+    for _ in range(count):
+        (sc, sr), (gc, gr) = random.sample(walkable, 2)
+        queries.append(((sc * TILE_SIZE, sr * TILE_SIZE), (gc * TILE_SIZE, gr * TILE_SIZE)))
+    return queries
+
+def run(level_number, count=200):
+    maze.load_level_maze(level_number)
+    queries = random_queries(count)
+
+    legacy_expanded = 0
+    start = time.perf_counter()
+    legacy_paths = []
+    for query_start, query_goal in queries:
+        path, expanded = legacy_a_star(query_start, query_goal)
+        legacy_paths.append(path)
+        legacy_expanded += expanded
+    legacy_time = time.perf_counter() - start
+
+    maze.a_star_engine.reset_stats()
+    new_paths = [maze.a_star(query_start, query_goal) for query_start, query_goal in queries]
+    stats = maze.a_star_engine.stats()
+
+    for old, new in zip(legacy_paths, new_paths):
+        assert len(old) == len(new), "Path lengths differ"
+
+    legacy_us = legacy_time / len(queries) * 1e6
+    print(f"Level {level_number:2d}: legacy {legacy_us:8.1f} us/query, {legacy_expanded / len(queries):7.1f} expanded | "
+          f"engine {stats['us_per_query']:8.1f} us/query, {stats['nodes_expanded'] / len(queries):7.1f} expanded | "
+          f"x{legacy_us / stats['us_per_query']:.2f}")
+
+if __name__ == "__main__":
+    random.seed(0)
+    for level in (1, 5, 10, 15):
+        run(level)
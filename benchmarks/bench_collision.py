@@ -0,0 +1,62 @@
+"""
+Benchmark: tile-grid collision queries vs. the linear scan over maze.walls
+(one rect per wall tile, and greedily merged wall rects)
+Run from the project root:  python benchmarks/bench_collision.py
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+import maze
+import collision
+
+def linear_collides(rect):
+    """The loop used by Enemy.direct_chase before the collision module existed"""
+    for wall in maze.walls:
+        if rect.colliderect(wall):
+            return True
+    return False
+
+def sample_rects(count, size):
+    """Random rects around walkable tiles, so both hits and misses are measured"""
+    rects = []
+    for _ in range(count):
+        x, y = maze.random_walkable_position()
+        rects.append(pygame.Rect(x + random.randint(-size, size), y + random.randint(-size, size), size, size))
+    return rects
+
+def time_linear(rects):
+    start = time.perf_counter()
+    results = [linear_collides(rect) for rect in rects]
+    return results, time.perf_counter() - start
+
+def run(level_number, count=2000):
+    maze.load_level_maze(level_number)
+    rects = sample_rects(count, constants.TILE_SIZE // 2)
+
+    merged, merged_time = time_linear(rects)
+    merged_walls = len(maze.walls)
+    maze.update_walls(merge=False)
+    linear, linear_time = time_linear(rects)
+
+    start = time.perf_counter()
+    grid = [collision.collides(rect) for rect in rects]
+    grid_time = time.perf_counter() - start
+
+    assert linear == grid == merged, "Tile-grid collision disagrees with the linear scan"
+    print(f"Level {level_number:2d}: {len(maze.walls):5d} walls | "
+          f"linear {linear_time / count * 1e6:8.2f} us/query | "
+          f"merged ({merged_walls:3d} rects) {merged_time / count * 1e6:6.2f} us/query | "
+          f"grid {grid_time / count * 1e6:6.2f} us/query | "
+          f"x{linear_time / grid_time:.1f}")
+
+if __name__ == "__main__":
+    random.seed(0)
+    for level in (1, 5, 10, 15):
+        run(level)
@@ -0,0 +1,107 @@
+"""
+Benchmark: per-frame cost of hundreds of items and animated pickups, sprite objects vs. the ECS world
+The sprite path is the pre-ECS one: a Key.update() per animated pickup, spritecollide against the
+player and a camera-culled blit per sprite. The ECS path is world.update() plus world.render().
+Run from the project root:  python benchmarks/bench_ecs.py
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+from camera import Camera
+
+FRAMES = 120
+COUNTS = [100, 500, 2000]
+WORLD_TILES = 61  # Entities are scattered over a Level 15 sized area
+
+class LegacyItem(pygame.sprite.Sprite):
+    """Item as it was before the ECS"""
+    def __init__(self, image, pos):
+        super().__init__()
+        self.image = image
+        self.rect = self.image.get_rect(topleft=pos)
+
+class LegacyKey(pygame.sprite.Sprite):
+    """Key as it was before the ECS (animated through its own update)"""
+    def __init__(self, images, pos):
+        super().__init__()
+        self.images = images
+        self.current_frame = 0
+        self.image = self.images[0]
+        self.rect = self.image.get_rect(topleft=pos)
+        self.animation_timer = 0
+        self.animation_speed = 200
+
+    def update(self):
+        now = pygame.time.get_ticks()
+        if now - self.animation_timer > self.animation_speed:
+            self.animation_timer = now
+            self.current_frame = (self.current_frame + 1) % len(self.images)
+            self.image = self.images[self.current_frame]
+
+def positions(count):
+    random.seed(1)
+    limit = (WORLD_TILES - 1) * constants.TILE_SIZE
+    return [(random.randrange(limit), random.randrange(limit)) for _ in range(count)]
+
+def sprite_frame_ms(screen, camera, player, image, images, count):
+    items = pygame.sprite.Group()
+    keys = pygame.sprite.Group()
+    for index, pos in enumerate(positions(count)):
+        if index % 2:
+            keys.add(LegacyKey(images, pos))
+        else:
+            items.add(LegacyItem(image, pos))
+    bounds = pygame.Rect(0, 0, constants.WIDTH, constants.HEIGHT)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for key in keys:
+            key.update()
+        pygame.sprite.spritecollide(player, items, False)
+        pygame.sprite.spritecollide(player, keys, False)
+        for group in (items, keys):
+            for sprite in group:
+                screen_rect = camera.apply(sprite.rect)
+                if screen_rect.colliderect(bounds):
+                    screen.blit(sprite.image, screen_rect.topleft)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+def ecs_frame_ms(screen, camera, player, image, images, count):
+    from ecs import world
+    from game_objects import Item, Key
+    world.clear()
+    for index, pos in enumerate(positions(count)):
+        if index % 2:
+            Key(images, pos)
+        else:
+            Item(image, pos, "red")
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        world.update(frame * 16, player.rect)
+        world.render(screen, camera)
+    elapsed = (time.perf_counter() - start) / FRAMES * 1000
+    world.clear()
+    return elapsed
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((constants.WIDTH, constants.HEIGHT))
+    image = pygame.Surface((constants.TILE_SIZE, constants.TILE_SIZE))
+    images = [pygame.Surface((constants.TILE_SIZE, constants.TILE_SIZE)) for _ in range(4)]
+
+    player = LegacyItem(image, (30 * constants.TILE_SIZE, 30 * constants.TILE_SIZE))
+    camera = Camera(constants.WIDTH, constants.HEIGHT)
+    camera.update(player)
+
+    print(f"Per-frame cost over {FRAMES} frames (half static items, half animated keys)")
+    for count in COUNTS:
+        sprites = sprite_frame_ms(screen, camera, player, image, images, count)
+        entities = ecs_frame_ms(screen, camera, player, image, images, count)
+        print(f"{count:5d} entities: sprites {sprites:6.2f} ms | ECS {entities:6.2f} ms ({sprites / entities:4.1f}x)")
@@ -0,0 +1,77 @@
+"""
+Benchmark: Enemy()/Player() construction with per-instance frame loading vs. the shared frame cache,
+and resident animation memory with lazily decoded effect animations
+Run from the project root:  python benchmarks/bench_frame_cache.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+import animations
+
+SPAWNS = 10
+
+def spawn_ms(make):
+    start = time.perf_counter()
+    for _ in range(SPAWNS):
+        make()
+    return (time.perf_counter() - start) / SPAWNS * 1000
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((constants.WIDTH, constants.HEIGHT))
+    import game_objects
+    from game_objects import Player, Enemy
+
+    # Per-instance loading, as before the cache: every call decodes the files again
+    def uncached_frames(base_path, count, start_from=1):
+        return tuple(animations.load_frames_safely(base_path, count, start_from))
+
+    def uncached_variants(base_path, count, start_from=1):
+        frames = uncached_frames(base_path, count, start_from)
+        return tuple(pygame.transform.flip(frame, True, False) for frame in frames), frames
+
+    game_objects.load_frame_variants = uncached_variants
+    game_objects.effect_animation = uncached_frames  # Effects decoded eagerly in __init__ (spawn timing only)
+    uncached_enemy = spawn_ms(lambda: Enemy((constants.TILE_SIZE, constants.TILE_SIZE)))
+    uncached_player = spawn_ms(lambda: Player((constants.TILE_SIZE, constants.TILE_SIZE)))
+
+    game_objects.load_frame_variants = animations.load_frame_variants
+    game_objects.effect_animation = animations.effect_animation
+    cached_enemy = spawn_ms(lambda: Enemy((constants.TILE_SIZE, constants.TILE_SIZE)))
+    cached_player = spawn_ms(lambda: Player((constants.TILE_SIZE, constants.TILE_SIZE)))
+
+    print(f"Enemy():  uncached {uncached_enemy:7.2f} ms | cached {cached_enemy:6.3f} ms (first load included, {SPAWNS} spawns)")
+    print(f"Player(): uncached {uncached_player:7.2f} ms | cached {cached_player:6.3f} ms")
+    stats = animations.frame_cache.stats()
+    print(f"Frame cache: {stats['frame_sets']} sets, {stats['frames']} frames, {stats['loads']} loads in {stats['load_ms']:.1f} ms, "
+          f"{stats['hits']} hits, {stats['resident_bytes'] / 1048576:.1f} MB resident")
+
+    # Boss level: 4 enemies and a player, before and after the effects are first drawn
+    animations.frame_cache.clear()
+    sprites = [Enemy((constants.TILE_SIZE, constants.TILE_SIZE)) for _ in range(4)]
+    player = Player((constants.TILE_SIZE, constants.TILE_SIZE))
+    idle_bytes = animations.frame_cache.resident_bytes()
+    screen = pygame.display.get_surface()
+    for enemy in sprites:
+        enemy.frozen = enemy.attacking = True
+        enemy.draw(screen)
+    player.is_boost = True
+    player.draw(screen)
+    effect_bytes = animations.frame_cache.resident_bytes()
+    print(f"Resident (4 enemies + player): before any effect {idle_bytes / 1024:6.0f} KB | "
+          f"after every effect was drawn {effect_bytes / 1024:6.0f} KB")
+
+    # Budget smaller than the effects: the least recently used set is evicted and decoded again on its next draw
+    constants.ANIMATION_CACHE_BYTES = 512 * 1024
+    animations.frame_cache.evict()
+    for _ in range(10):
+        sprites[0].draw(screen)
+        player.draw(screen)
+    print(animations.memory_report())
@@ -0,0 +1,76 @@
+"""
+Benchmark: frame time (update + draw) as the enemy count grows, Enemy sprites vs. the NumPy horde
+Runs on the Level 15 maze (61x61) with the camera on the player; needs NumPy.
+Run from the project root:  python benchmarks/bench_horde.py
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+import renderer
+import maze
+from camera import Camera
+
+FRAMES = 60
+COUNTS = [4, 50, 100, 200, 400, 800]
+SPRITE_LIMIT = 400  # Enemy sprites get too slow to be worth timing past this
+
+def walkable_tiles(count):
+    grid = maze.MAZE
+    tiles = [(col, row) for row in range(grid.height) for col in range(grid.width) if grid.get(col, row) == 0]
+    random.seed(1)
+    return [random.choice(tiles) for _ in range(count)]
+
+def sprite_frame_ms(player, camera, tiles):
+    from game_objects import Enemy
+    enemies = [Enemy((col * constants.TILE_SIZE, row * constants.TILE_SIZE)) for col, row in tiles]
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for enemy in enemies:
+            enemy.update(player)
+        renderer.draw_enemies(camera, enemies)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+def horde_frame_ms(player, camera, tiles):
+    from horde import Horde
+    horde = Horde(len(tiles))
+    horde.spawn(tiles)
+    target = (player.rect.centerx // constants.TILE_SIZE, player.rect.centery // constants.TILE_SIZE)
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        horde.update(target, frame * 16)
+        horde.draw(renderer.screen, camera)
+    return (time.perf_counter() - start) / FRAMES * 1000, horde.drawn
+
+if __name__ == "__main__":
+    from horde import NUMPY_AVAILABLE
+    if not NUMPY_AVAILABLE:
+        sys.exit("NumPy is required for horde mode")
+    pygame.init()
+    renderer.screen = pygame.display.set_mode((constants.WIDTH, constants.HEIGHT))
+    constants.ENEMY_PATHFINDING = "flow_field"
+    maze.load_level_maze(15)
+    from game_objects import Player
+
+    player = Player((31 * constants.TILE_SIZE, 31 * constants.TILE_SIZE))
+    for col, row in walkable_tiles(1):
+        player.rect.topleft = (col * constants.TILE_SIZE, row * constants.TILE_SIZE)
+    camera = Camera(constants.WIDTH, constants.HEIGHT)
+    camera.update(player)
+
+    print(f"Frame time over {FRAMES} frames (update + draw), Level 15, {constants.WIDTH}x{constants.HEIGHT}")
+    for count in COUNTS:
+        tiles = walkable_tiles(count)
+        horde_ms, drawn = horde_frame_ms(player, camera, tiles)
+        if count <= SPRITE_LIMIT:
+            sprites = f"{sprite_frame_ms(player, camera, tiles):8.2f} ms"
+        else:
+            sprites = "       -   "
+        print(f"{count:4d} enemies: sprites {sprites} | horde {horde_ms:6.2f} ms ({drawn} on screen)")
@@ -0,0 +1,52 @@
+"""
+Benchmark: HPA* next-segment queries vs. full A* as the maze grows
+Run from the project root:  python benchmarks/bench_hpa.py
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import maze
+from constants import TILE_SIZE
+
+def long_queries(count):
+    """Start/goal pairs far apart, as when an enemy spawns across the map"""
+    width, height = maze.MAZE.width, maze.MAZE.height
+    tiles = [(index % width, index // width) for index, tile in enumerate(maze.MAZE.cells) if tile == 0]
+    near = [tile for tile in tiles if tile[0] < width // 3 and tile[1] < height // 3]
+    far = [tile for tile in tiles if tile[0] > width * 2 // 3 and tile[1] > height * 2 // 3]
+    queries = []
+    for _ in range(count):
+        (sc, sr), (gc, gr) = random.choice(near), random.choice(far)
+        queries.append(((sc * TILE_SIZE, sr * TILE_SIZE), (gc * TILE_SIZE, gr * TILE_SIZE)))
+    return queries
+
+def run(size, count=50):
+    maze.MAZE = maze.MazeGrid.from_rows(maze.generate_maze(size, size))
+    queries = long_queries(count)
+
+    maze.a_star(*queries[0])
+    start = time.perf_counter()
+    for query_start, query_goal in queries:
+        maze.a_star(query_start, query_goal)
+    a_star_us = (time.perf_counter() - start) / count * 1e6
+
+    maze.hpa_pathfinder.build(maze.MAZE)
+    stats = maze.hpa_pathfinder.stats()
+    start = time.perf_counter()
+    for query_start, query_goal in queries:
+        maze.hpa_star(query_start, query_goal)
+    hpa_us = (time.perf_counter() - start) / count * 1e6
+
+    print(f"{size:3d}x{size:<3d}: a_star {a_star_us:8.1f} us/query | "
+          f"hpa {hpa_us:7.1f} us/query ({stats['abstract_nodes']} abstract nodes, built in {stats['build_ms']:.1f} ms) | "
+          f"x{a_star_us / hpa_us:.1f}")
+
+if __name__ == "__main__":
+    random.seed(0)
+    for size in (31, 41, 51, 61, 101, 151):
+        run(size)
@@ -0,0 +1,78 @@
+"""
+Benchmark: replanning a chase with a fresh a_star per replan vs. the per-enemy IncrementalPlanner
+A player trajectory is replayed tile by tile while an enemy chases it and replans after every player step.
+Run from the project root:  python benchmarks/bench_incremental.py
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import maze
+from constants import TILE_SIZE
+
+def walkable_tiles():
+    width = maze.MAZE.width
+    return [((index % width) * TILE_SIZE, (index // width) * TILE_SIZE)
+            for index, tile in enumerate(maze.MAZE.cells) if tile == 0]
+
+def player_trajectory(steps):
+    """Player wanders between random walkable tiles, one tile per step"""
+    tiles = walkable_tiles()
+    position = random.choice(tiles)
+    trajectory = [position]
+    while len(trajectory) < steps:
+        trajectory.extend(maze.a_star(trajectory[-1], random.choice(tiles)))
+    return trajectory[:steps]
+
+def farthest_spawn(player_pos, tiles):
+    """Farthest tile (by maze distance) that can still reach the player"""
+    maze.flow_field.update((player_pos[0] // TILE_SIZE, player_pos[1] // TILE_SIZE))
+    return max(tiles, key=lambda tile: maze.flow_field.distance(tile[0] // TILE_SIZE, tile[1] // TILE_SIZE))
+
+def run(level_number, steps=1500, enemy_step_every=2):
+    """Replay one trajectory; expansions are summed over every enemy spawned"""
+    maze.load_level_maze(level_number)
+    tiles = walkable_tiles()
+    trajectory = player_trajectory(steps)
+
+    maze.a_star_engine.reset_stats()
+    planner = maze.IncrementalPlanner()
+    incremental_expanded = 0
+    reroots = 0
+    a_star_time = planner_time = 0.0
+    enemy = farthest_spawn(trajectory[0], tiles)
+
+    for step, player in enumerate(trajectory):
+        start = time.perf_counter()
+        full_path = maze.a_star(enemy, player)
+        a_star_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        path = planner.plan(enemy, player)
+        planner_time += time.perf_counter() - start
+        assert len(path) == len(full_path), "Incremental path is not a shortest path"
+
+        if not path:
+            incremental_expanded += planner.nodes_expanded
+            reroots += planner.reroots
+            planner = maze.IncrementalPlanner()
+            enemy = farthest_spawn(player, tiles)
+        elif step % enemy_step_every == 0:
+            enemy = path[0]
+
+    incremental_expanded += planner.nodes_expanded
+    reroots += planner.reroots
+    a_star_expanded = maze.a_star_engine.stats()["nodes_expanded"]
+    print(f"Level {level_number:2d}: {steps} replans | "
+          f"a_star {a_star_expanded:8d} expanded, {a_star_time * 1000:7.1f} ms | "
+          f"incremental {incremental_expanded:7d} expanded ({reroots} re-roots), {planner_time * 1000:7.1f} ms | "
+          f"x{a_star_expanded / max(1, incremental_expanded):.1f} fewer expansions")
+
+if __name__ == "__main__":
+    random.seed(0)
+    for level in (1, 5, 10, 15):
+        run(level)
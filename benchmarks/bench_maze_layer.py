@@ -0,0 +1,77 @@
+"""
+Benchmark: per-tile draw.rect floor vs. blits from the cached floor chunks
+Covers the built-in levels and a 201x201 random maze; also checks both draw the same pixels.
+Run from the project root:  python benchmarks/bench_maze_layer.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+import maze
+import renderer
+from camera import Camera
+
+FRAMES = 300
+
+def per_tile_floor(surface, camera):
+    """The original floor loop from draw_game_screen"""
+    grid = maze.MAZE
+    tile_size = constants.TILE_SIZE
+    visible_area = camera.get_visible_area()
+    start_col = max(0, visible_area.left // tile_size)
+    end_col = min(grid.width, visible_area.right // tile_size + 1)
+    start_row = max(0, visible_area.top // tile_size)
+    end_row = min(grid.height, visible_area.bottom // tile_size + 1)
+    for row in range(start_row, end_row):
+        for col in range(start_col, end_col):
+            color = constants.GRAY if grid.cells[row * grid.width + col] == 0 else constants.BLACK
+            world_rect = pygame.Rect(col * tile_size, row * tile_size, tile_size, tile_size)
+            pygame.draw.rect(surface, color, camera.apply(world_rect))
+
+def chunked_floor(surface, camera):
+    renderer.maze_chunks.draw(surface, camera, maze.MAZE)
+
+def timed(draw, surface, camera):
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        camera.x = frame * 7
+        camera.y = frame * 5
+        draw(surface, camera)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+def same_pixels(camera):
+    expected = pygame.Surface((constants.WIDTH, constants.HEIGHT))
+    actual = pygame.Surface((constants.WIDTH, constants.HEIGHT))
+    for camera.x, camera.y in ((0, 0), (-300, -200), (1000, 700), (137, -41)):
+        expected.fill(constants.BLACK)
+        actual.fill(constants.BLACK)
+        per_tile_floor(expected, camera)
+        chunked_floor(actual, camera)
+        if pygame.image.tobytes(expected, "RGB") != pygame.image.tobytes(actual, "RGB"):
+            return False
+    return True
+
+def run(label, screen, camera):
+    assert same_pixels(camera), "chunked floor differs from the per-tile floor"
+    tile_ms = timed(per_tile_floor, screen, camera)
+    chunk_ms = timed(chunked_floor, screen, camera)
+    stats = renderer.maze_chunks.stats()
+    print(f"{label:>9}: per-tile {tile_ms:6.2f} ms/frame | chunks {chunk_ms:5.2f} ms/frame | x{tile_ms / chunk_ms:4.1f} | "
+          f"{stats['chunks']:3d} chunks {stats['resident_bytes'] / 1048576:5.1f} MB, hit rate {stats['hit_rate'] * 100:5.1f}%")
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((constants.WIDTH, constants.HEIGHT))
+    camera = Camera(constants.WIDTH, constants.HEIGHT)
+    for level in (1, 5, 10, 15):
+        maze.load_level_maze(level)
+        run(f"Level {level}", screen, camera)
+    maze.MAZE = maze.MazeGrid.from_rows(maze.generate_maze(201, 201))
+    run("201x201", screen, camera)
+    stats = renderer.maze_chunks.stats()
+    print(f"Chunk cache totals: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
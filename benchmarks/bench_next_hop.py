@@ -0,0 +1,55 @@
+"""
+Benchmark: next-hop table lookups vs. A* on every built-in level maze
+Reports table build time, cache load time and memory per level.
+Run from the project root:  python benchmarks/bench_next_hop.py
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import constants
+import maze
+from constants import TILE_SIZE
+
+def random_queries(count):
+    width = maze.MAZE.width
+    tiles = [((index % width) * TILE_SIZE, (index // width) * TILE_SIZE)
+             for index, tile in enumerate(maze.MAZE.cells) if tile == 0]
+    return [tuple(random.sample(tiles, 2)) for _ in range(count)]
+
+def timed(pathfinder, queries):
+    start = time.perf_counter()
+    paths = [pathfinder(query_start, query_goal) for query_start, query_goal in queries]
+    return paths, time.perf_counter() - start
+
+def run(level):
+    maze.load_level_maze(level)
+    build_ms = maze.next_hop_table.stats()["build_ms"]
+    maze.load_level_maze(level)  # Second load comes from the cache file
+    stats = maze.next_hop_table.stats()
+    assert stats["from_cache"], "next-hop cache was not used"
+
+    queries = random_queries(200)
+    maze.a_star(*queries[0])
+    a_star_paths, a_star_time = timed(maze.a_star, queries)
+    table_paths, table_time = timed(maze.next_hop_path, queries)
+    for old, new in zip(a_star_paths, table_paths):
+        assert len(old) == len(new), "next-hop path is not a shortest path"
+
+    count = len(queries)
+    print(f"Level {level:>2}: {stats['walkable_tiles']:5d} tiles {stats['memory_bytes'] / 1048576:5.2f} MB | "
+          f"build {build_ms:7.1f} ms, cached {stats['build_ms']:5.1f} ms | "
+          f"a_star {a_star_time / count * 1e6:7.1f} us, table {table_time / count * 1e6:6.1f} us per path")
+
+if __name__ == "__main__":
+    random.seed(0)
+    constants.ENEMY_PATHFINDING = "next_hop"
+    with tempfile.TemporaryDirectory() as cache_dir:
+        constants.NEXT_HOP_CACHE_DIR = cache_dir
+        for level in sorted(maze.LEVEL_DATA):
+            run(level)
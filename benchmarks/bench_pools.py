@@ -0,0 +1,85 @@
+"""
+Benchmark: enemy respawns and item/key resets, constructing new sprites vs. recycling them from the pools
+Reports time per respawn or reset, garbage collections triggered (allocation pressure) and pool hit rates.
+Run from the project root:  python benchmarks/bench_pools.py
+"""
+import os
+import sys
+import gc
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+
+RESPAWNS = 500
+RESETS = 200
+
+def measure(run, count):
+    """Run run() count times; returns (ms per call, gen-0 collections during the run)"""
+    gc.collect()
+    collections = gc.get_stats()[0]["collections"]
+    start = time.perf_counter()
+    for _ in range(count):
+        run()
+    elapsed = time.perf_counter() - start
+    return elapsed / count * 1000, gc.get_stats()[0]["collections"] - collections
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((constants.WIDTH, constants.HEIGHT))
+    from game_objects import Enemy, Item, Key, enemy_pool, item_pool, key_pool
+    from ecs import world
+
+    group = pygame.sprite.Group()
+    key_group = pygame.sprite.Group()
+    image = pygame.Surface((constants.TILE_SIZE, constants.TILE_SIZE))
+    key_images = [pygame.Surface((constants.TILE_SIZE, constants.TILE_SIZE)) for _ in range(4)]
+    pos = (constants.TILE_SIZE, constants.TILE_SIZE)
+    Enemy(pos)  # Load the shared frames before timing
+
+    def construct_respawn():
+        for enemy in group.sprites():
+            enemy.kill()
+        group.add(Enemy(pos))
+
+    def pooled_respawn():
+        enemy_pool.release_all(group)
+        group.add(enemy_pool.acquire(pos))
+
+    def construct_reset():
+        for sprite in group.sprites() + key_group.sprites():
+            sprite.kill()
+        for _ in range(constants.SPAWN_ITEMS_TIMES * 3):
+            group.add(Item(image, pos, "red"))
+        key_group.add(Key(key_images, pos))
+
+    def pooled_reset():
+        item_pool.release_all(group)
+        key_pool.release_all(key_group)
+        for _ in range(constants.SPAWN_ITEMS_TIMES * 3):
+            group.add(item_pool.acquire(image, pos, "red"))
+        key_group.add(key_pool.acquire(key_images, pos))
+
+    def report(label, construct, pooled, count):
+        construct_ms, construct_gc = measure(construct, count)
+        group.empty()
+        key_group.empty()
+        world.clear()
+        pooled()  # Fill the pools
+        pooled_ms, pooled_gc = measure(pooled, count)
+        group.empty()
+        key_group.empty()
+        world.clear()
+        print(f"{label:26s} new {construct_ms:6.3f} ms, {construct_gc:4d} gen-0 GCs | "
+              f"pooled {pooled_ms:6.3f} ms, {pooled_gc:4d} gen-0 GCs")
+
+    print("Time per call; gen-0 garbage collections over the whole run")
+    report(f"Enemy respawn ({RESPAWNS}x):", construct_respawn, pooled_respawn, RESPAWNS)
+    report(f"Item/key reset ({RESETS}x):", construct_reset, pooled_reset, RESETS)
+    for name, pool in (("enemies", enemy_pool), ("items", item_pool), ("keys", key_pool)):
+        stats = pool.stats()
+        print(f"{name:8s} pool: {stats['hits']} hits, {stats['misses']} misses, hit rate {stats['hit_rate']:.1%}")
@@ -0,0 +1,61 @@
+"""
+Benchmark: a wave of enemies replanning on the same frame, with and without the path scheduler
+Prints the worst frame spent on pathfinding and how many frames the wave took to finish.
+Run from the project root:  python benchmarks/bench_scheduler.py
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import constants
+import maze
+from constants import TILE_SIZE
+
+WAVE_SIZE = 20
+
+def random_queries(count):
+    width = maze.MAZE.width
+    tiles = [((index % width) * TILE_SIZE, (index // width) * TILE_SIZE)
+             for index, tile in enumerate(maze.MAZE.cells) if tile == 0]
+    goal = random.choice(tiles)
+    return [(random.choice(tiles), goal) for _ in range(count)]
+
+def immediate(queries):
+    start = time.perf_counter()
+    paths = [maze.a_star(query_start, query_goal) for query_start, query_goal in queries]
+    return paths, (time.perf_counter() - start) * 1000000
+
+def scheduled(queries):
+    scheduler = maze.path_scheduler
+    scheduler.clear()
+    scheduler.reset_stats()
+    for owner, (query_start, query_goal) in enumerate(queries):
+        scheduler.request(owner, query_start, query_goal, "a_star")
+    paths = {}
+    while len(paths) < len(queries):
+        scheduler.run()
+        for owner in range(len(queries)):
+            path = scheduler.result(owner)
+            if path is not None:
+                paths[owner] = path
+    return [paths[owner] for owner in range(len(queries))], scheduler.stats()
+
+def run(label, queries):
+    immediate_paths, immediate_us = immediate(queries)
+    scheduled_paths, stats = scheduled(queries)
+    for old, new in zip(immediate_paths, scheduled_paths):
+        assert old == new, "scheduled search returned a different path"
+    print(f"{label:>9}: immediate {immediate_us / 1000:6.2f} ms in 1 frame | "
+          f"scheduled worst frame {stats['max_frame_us'] / 1000:5.2f} ms over {stats['frames']:2d} frames, "
+          f"{stats['overruns']} overruns, wait <= {stats['max_wait_ms']:5.1f} ms")
+
+if __name__ == "__main__":
+    random.seed(0)
+    print(f"{WAVE_SIZE} searches per wave, budget {constants.PATHFINDING_BUDGET_US} us per frame")
+    for level in sorted(maze.LEVEL_DATA):
+        maze.load_level_maze(level)
+        run(f"Level {level}", random_queries(WAVE_SIZE))
@@ -0,0 +1,88 @@
+"""
+Benchmark: enemy/player drawing through per-frame SRCALPHA temp surfaces vs. straight onto the screen
+Counts pygame.Surface allocations and transform.flip calls per frame for both paths.
+Run from the project root:  python benchmarks/bench_sprite_draw.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+import renderer
+from camera import Camera
+
+FRAMES = 300
+ENEMIES = 20
+
+allocations = 0
+
+class CountingSurface(pygame.Surface):
+    """pygame.Surface that counts how many times it is constructed"""
+    def __init__(self, *args, **kwargs):
+        global allocations
+        allocations += 1
+        super().__init__(*args, **kwargs)
+
+original_flip = pygame.transform.flip
+
+def counting_flip(*args, **kwargs):
+    global allocations
+    allocations += 1
+    return original_flip(*args, **kwargs)
+
+def legacy_draw(camera, enemies, player):
+    """The original enemy/player drawing from draw_game_screen"""
+    screen = renderer.screen
+    for enemy in enemies:
+        enemy_screen_rect = camera.apply(enemy.rect)
+        if enemy_screen_rect.colliderect(pygame.Rect(0, 0, constants.WIDTH, constants.HEIGHT)):
+            temp_surface = pygame.Surface((enemy.rect.width, enemy.rect.height), pygame.SRCALPHA)
+            enemy.draw(temp_surface)
+            screen.blit(temp_surface, enemy_screen_rect.topleft)
+
+    player_screen_rect = camera.apply(player.rect)
+    temp_surface = pygame.Surface((player.rect.width, player.rect.height + 20), pygame.SRCALPHA)
+    temp_surface.blit(player.image, (0, 20))
+    if player.is_boost and len(player.boost_frames) > 0:
+        temp_surface.blit(player.boost_frames[player.boost_current_frame], (0, 20))
+    player.draw_stamina_bar_at_top(temp_surface)
+    screen.blit(temp_surface, (player_screen_rect.x, player_screen_rect.y - 20))
+
+def direct_draw(camera, enemies, player):
+    renderer.draw_enemies(camera, enemies)
+    renderer.draw_player(camera, player)
+
+def timed(draw, camera, enemies, player):
+    global allocations
+    allocations = 0
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        draw(camera, enemies, player)
+    elapsed = time.perf_counter() - start
+    return elapsed / FRAMES * 1000, allocations / FRAMES
+
+if __name__ == "__main__":
+    pygame.init()
+    renderer.screen = pygame.display.set_mode((constants.WIDTH, constants.HEIGHT))
+    from game_objects import Player, Enemy
+
+    player = Player((constants.WIDTH // 2, constants.HEIGHT // 2))
+    player.is_boost = True
+    enemies = [Enemy((100 + index * 60, 200 + (index % 4) * 60)) for index in range(ENEMIES)]
+    camera = Camera(constants.WIDTH, constants.HEIGHT)
+
+    pygame.Surface = CountingSurface
+    pygame.transform.flip = counting_flip
+    for label, facing_right in (("facing right", True), ("facing left", False)):
+        for enemy in enemies:
+            enemy.facing_right = facing_right
+            enemy.frozen = True
+        legacy_ms, legacy_allocations = timed(legacy_draw, camera, enemies, player)
+        direct_ms, direct_allocations = timed(direct_draw, camera, enemies, player)
+        print(f"{ENEMIES} frozen enemies {label:>12}: temp surfaces {legacy_ms:5.2f} ms, {legacy_allocations:4.1f} allocations/frame | "
+              f"direct {direct_ms:5.2f} ms, {direct_allocations:4.1f} allocations/frame")
@@ -0,0 +1,81 @@
+"""
+Benchmark: HUD text with font.render every frame vs. the shared text cache vs. glyph atlases for countdowns
+Simulates 60 seconds of HUD at 60 FPS (countdowns change once per second).
+Run from the project root:  python benchmarks/bench_text_cache.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+from text_cache import text_cache, render_text, get_font, get_atlas
+from translations import translations
+
+FRAMES = 60 * 60
+
+def hud_strings(frame, labels):
+    """The strings draw_ui/draw_effects_ui would render on this frame"""
+    seconds_left = max(0, 60 - frame // 60)
+    return [
+        (f"{labels['invisible_time']} {seconds_left}s", constants.YELLOW),
+        (f"{labels['level']} 15", constants.WHITE),
+        (labels["is_key_obtained"], constants.GREEN),
+        (f"{labels['stamina']}: ", constants.WHITE),
+        (f"{labels['invincible_time']}{seconds_left % 4}s", constants.RED),
+        (f"{labels['red_time']}{seconds_left % 10}s", constants.RED),
+    ]
+
+def countdowns(frame, labels):
+    """(label, value, color) of the countdowns drawn by draw_ui/draw_effects_ui on this frame"""
+    seconds_left = max(0, 60 - frame // 60)
+    return [
+        (f"{labels['invisible_time']} ", seconds_left, constants.YELLOW),
+        (labels["invincible_time"], seconds_left % 4, constants.RED),
+        (labels["red_time"], seconds_left % 10, constants.RED),
+    ]
+
+def timed_countdowns(draw, font, labels, screen):
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        for label, value, color in countdowns(frame, labels):
+            draw(font, label, value, color, screen)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+def cached_countdown(font, label, value, color, screen):
+    screen.blit(render_text(font, f"{label}{value}s", color), (10, 10))
+
+def atlas_countdown(font, label, value, color, screen):
+    get_atlas(font, color).draw(screen, (10, 10), label, value, "s")
+
+def timed(render, font, labels):
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        for text, color in hud_strings(frame, labels):
+            render(font, text, color)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+if __name__ == "__main__":
+    pygame.init()
+    font = get_font("assets/Cubic_11.ttf", 18)
+    for language, labels in translations.items():
+        text_cache.clear()
+        uncached_ms = timed(lambda font, text, color: font.render(text, True, color), font, labels)
+        cached_ms = timed(render_text, font, labels)
+        print(f"{language:>6}: font.render {uncached_ms:6.3f} ms/frame | cached {cached_ms:6.3f} ms/frame | x{uncached_ms / cached_ms:5.1f}")
+    stats = text_cache.stats()
+    print(f"Hit rate {stats['hit_rate'] * 100:.1f}%, {stats['entries']} entries, {stats['cached_bytes'] / 1024:.0f} KB")
+
+    screen = pygame.Surface((constants.WIDTH, constants.HEIGHT))
+    for language, labels in translations.items():
+        text_cache.clear()
+        misses = text_cache.misses
+        cached_ms = timed_countdowns(cached_countdown, font, labels, screen)
+        cache_misses = text_cache.misses - misses
+        atlas_ms = timed_countdowns(atlas_countdown, font, labels, screen)
+        print(f"{language:>6} countdowns: text cache {cached_ms:6.3f} ms/frame ({cache_misses} renders) | "
+              f"atlas {atlas_ms:6.3f} ms/frame (no renders after warm-up)")
@@ -0,0 +1,59 @@
+"""
+Benchmark: how far the player walks in half a second of game time at different frame rates,
+one update per rendered frame (the old loop) vs. fixed simulation steps (game_logic.main_game_loop)
+Frame times are scripted, so the result does not depend on this machine's speed.
+Run from the project root:  python benchmarks/bench_timestep.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+
+GAME_MS = 500
+FRAME_RATES = [30, 60, 120, 240]  # 240 stands in for uncapped
+
+class HeldKeys:
+    """pygame.key.get_pressed() stand-in with only the right arrow held"""
+    def __getitem__(self, key):
+        return key == pygame.K_RIGHT
+
+def walk(fps, fixed_step):
+    """Walk right for GAME_MS at fps rendered frames per second; returns (pixels walked, steps run)"""
+    from game_state import initialize_game_state, game_state
+    from game_logic import simulation_step
+    initialize_game_state(True, "level", 5)
+    start_x = game_state.player.rect.x
+    keys = HeldKeys()
+    frame_ms = 1000 / fps
+    step_ms = 1000 / constants.SIMULATION_HZ
+    accumulator = 0.0
+    steps = 0
+    for _ in range(round(GAME_MS / frame_ms)):
+        if fixed_step:
+            accumulator += frame_ms
+            while accumulator >= step_ms:
+                accumulator -= step_ms
+                simulation_step(keys)
+                steps += 1
+        else:
+            simulation_step(keys)
+            steps += 1
+    return game_state.player.rect.x - start_x, steps
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((constants.WIDTH, constants.HEIGHT))
+    from assets import load_images
+    load_images()
+
+    print(f"Player walk over {GAME_MS} ms of game time (simulation at {constants.SIMULATION_HZ} Hz)")
+    for fps in FRAME_RATES:
+        per_frame, frame_steps = walk(fps, False)
+        fixed, fixed_steps = walk(fps, True)
+        print(f"{fps:4d} fps: per-frame update {per_frame:4d} px ({frame_steps:3d} updates) | "
+              f"fixed step {fixed:4d} px ({fixed_steps:3d} steps)")
@@ -0,0 +1,69 @@
+"""
+Benchmark: main-thread cost of a 20-enemy replanning wave, inline vs. the background pathfinding worker
+Run from the project root:  python benchmarks/bench_worker.py
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import constants
+import maze
+from constants import TILE_SIZE
+from path_worker import path_worker
+
+WAVE_SIZE = 20
+FRAME_SECONDS = 1 / 60
+
+def random_queries(count):
+    width = maze.MAZE.width
+    tiles = [((index % width) * TILE_SIZE, (index // width) * TILE_SIZE)
+             for index, tile in enumerate(maze.MAZE.cells) if tile == 0]
+    goal = random.choice(tiles)
+    return [(random.choice(tiles), goal) for _ in range(count)]
+
+def inline(queries):
+    start = time.perf_counter()
+    paths = [maze.a_star(query_start, query_goal) for query_start, query_goal in queries]
+    return paths, (time.perf_counter() - start) * 1000
+
+def offloaded(queries):
+    # Submit everything on one frame, then poll once per simulated frame like Enemy.update_path does
+    frame_ms = []
+    paths = {}
+    start = time.perf_counter()
+    for owner, (query_start, query_goal) in enumerate(queries):
+        path_worker.submit(owner, query_start, query_goal)
+    path_worker.flush()
+    frame_ms.append((time.perf_counter() - start) * 1000)
+    frames = 1
+    while len(paths) < len(queries):
+        time.sleep(FRAME_SECONDS)
+        start = time.perf_counter()
+        for owner in range(len(queries)):
+            path = path_worker.result(owner)
+            if path is not None:
+                paths[owner] = path
+        frame_ms.append((time.perf_counter() - start) * 1000)
+        frames += 1
+    return [paths[owner] for owner in range(len(queries))], max(frame_ms), frames
+
+def run(label, queries):
+    inline_paths, inline_ms = inline(queries)
+    worker_paths, worst_frame_ms, frames = offloaded(queries)
+    for old, new in zip(inline_paths, worker_paths):
+        assert len(old) == len(new), "worker returned a different path length"
+    print(f"{label:>9}: inline {inline_ms:6.2f} ms on the main thread | "
+          f"worker worst frame {worst_frame_ms:5.2f} ms, results after {frames} frames")
+
+if __name__ == "__main__":
+    random.seed(0)
+    constants.ENEMY_PATHFINDING = "a_star"
+    constants.PATHFINDING_WORKER = True
+    for level in sorted(maze.LEVEL_DATA):
+        maze.load_level_maze(level)  # Publishes the maze to the worker
+        run(f"Level {level}", random_queries(WAVE_SIZE))
+    path_worker.stop()
@@ -9,17 +9,22 @@ class Camera:
         self.x = 0
         self.y = 0
         
-    def update(self, target):
-        """Update the camera position to follow the target (usually the player)"""
-        # Center the lens on the target
-        self.x = target.rect.centerx - self.width // 2
-        self.y = target.rect.centery - self.height // 2
+    def update(self, target, alpha=1.0):
+        """Update the camera position to follow the target (usually the player), alpha of the way along its last step"""
+        # Center the lens on the target where it is drawn, so it does not jitter against the maze
+        x, y = interpolate(target, alpha)
+        self.center_on((x + target.rect.width // 2, y + target.rect.height // 2))
         
         # Make sure the camera doesn't go outside the maze boundaries (if necessary)
         # Here you can limit the size of the maze
         # self.x = max(0, min(self.x, maze_width - self.width))
         # self.y = max(0, min(self.y, maze_height - self.height))
         
+    def center_on(self, center):
+        """Center the camera on a world position"""
+        self.x = center[0] - self.width // 2
+        self.y = center[1] - self.height // 2
+        
     def apply(self, rect):
         """Convert world coordinates to screen coordinates"""
         return pygame.Rect(rect.x - self.x, rect.y - self.y, rect.width, rect.height)
@@ -38,4 +43,10 @@ class Camera:
     
     def get_visible_area(self):
         """Get the world coordinate range of the visible area"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
\ No newline at end of file
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+def interpolate(sprite, alpha):
+    """Get a sprite's world position alpha of the way from previous_pos to its rect"""
+    x, y = sprite.rect.topleft
+    previous_x, previous_y = getattr(sprite, "previous_pos", (x, y))
+    return (round(previous_x + (x - previous_x) * alpha), round(previous_y + (y - previous_y) * alpha))
\ No newline at end of file
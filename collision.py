@@ -0,0 +1,85 @@
+import pygame
+import constants
+import maze
+
+# Tile-grid collision queries.
+# Instead of testing a rect against every wall in maze.walls, these helpers
+# look up only the tiles a rect actually covers in the MazeGrid, so the cost
+# depends on the size of the moving rect and not on the size of the maze.
+
+def tile_range(rect):
+    """Get the (first_col, last_col, first_row, last_row) tile span covered by a rect"""
+    tile_size = constants.TILE_SIZE
+    first_col = rect.left // tile_size
+    last_col = (rect.right - 1) // tile_size
+    first_row = rect.top // tile_size
+    last_row = (rect.bottom - 1) // tile_size
+    return first_col, last_col, first_row, last_row
+
+def tile_rect(col, row):
+    """Get the world rect of a tile"""
+    return pygame.Rect(col * constants.TILE_SIZE, row * constants.TILE_SIZE, constants.TILE_SIZE, constants.TILE_SIZE)
+
+def solid_tiles(rect):
+    """Get the (col, row) of every wall tile overlapped by rect, in row-major order"""
+    grid = maze.MAZE
+    if grid is None or rect.width <= 0 or rect.height <= 0:
+        return []
+
+    cells, width = grid.cells, grid.width
+    first_col, last_col, first_row, last_row = tile_range(rect)
+    first_col = max(0, first_col)
+    last_col = min(width - 1, last_col)
+    first_row = max(0, first_row)
+    last_row = min(grid.height - 1, last_row)
+
+    tiles = []
+    for row in range(first_row, last_row + 1):
+        row_start = row * width
+        for col in range(first_col, last_col + 1):
+            if cells[row_start + col] == 1:
+                tiles.append((col, row))
+    return tiles
+
+def collides(rect):
+    """Check whether rect overlaps any wall tile"""
+    grid = maze.MAZE
+    if grid is None or rect.width <= 0 or rect.height <= 0:
+        return False
+
+    cells, width = grid.cells, grid.width
+    first_col, last_col, first_row, last_row = tile_range(rect)
+    first_col = max(0, first_col)
+    last_col = min(width - 1, last_col)
+    for row in range(max(0, first_row), min(grid.height - 1, last_row) + 1):
+        row_start = row * width
+        for col in range(first_col, last_col + 1):
+            if cells[row_start + col] == 1:
+                return True
+    return False
+
+def move_axis(rect, dx, dy):
+    """
+    Move rect along a single axis and push it out of any wall it runs into
+    Args:
+        rect: pygame.Rect to move (not modified)
+        dx: horizontal movement in pixels (use 0 when moving vertically)
+        dy: vertical movement in pixels (use 0 when moving horizontally)
+    Returns:
+        New pygame.Rect flush against the nearest wall hit, or simply moved if nothing was hit
+    """
+    new_rect = rect.move(dx, dy)
+    tiles = solid_tiles(new_rect)
+    if not tiles:
+        return new_rect
+
+    tile_size = constants.TILE_SIZE
+    if dx > 0:
+        new_rect.right = min(col for col, row in tiles) * tile_size
+    elif dx < 0:
+        new_rect.left = (max(col for col, row in tiles) + 1) * tile_size
+    elif dy > 0:
+        new_rect.bottom = min(row for col, row in tiles) * tile_size
+    elif dy < 0:
+        new_rect.top = (max(row for col, row in tiles) + 1) * tile_size
+    return new_rect
@@ -13,6 +13,7 @@ default_config = {
     "resolution_width" : 1600,
     "resolution_height" : 900,
     "fullscreen" : False,
+    "frame_cap" : 60,  # Frames per second: 30, 60, 120 or 0 (uncapped)
     "game_mode" : "random",  # "level" or "random"
     "current_level" : 1,  # Current level for level mode
     "unlocked_levels" : [1],  # List of unlocked levels (start with level 1)
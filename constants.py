@@ -5,6 +5,11 @@ config = load_config()
 # Game window settings
 WIDTH, HEIGHT = config["resolution_width"], config["resolution_height"]
 TILE_SIZE = 40
+CHUNK_TILES = 16  # Maze floor chunk width/height in tiles (renderer.MazeChunkCache)
+CHUNK_CACHE_BYTES = 64 * 1024 * 1024  # Memory cap for cached floor chunks
+TEXT_CACHE_BYTES = 8 * 1024 * 1024  # Memory cap for cached HUD and menu text (text_cache.py)
+ANIMATION_CACHE_BYTES = 1024 * 1024  # Memory cap for decoded effect animations (animations.FrameCache)
+DEBUG_REPORTS = False  # Print cache, pool and wall-merge diagnostics on every level load
 MAZE_COLS, MAZE_ROWS = 31, 31  # Default maze size, can be updated dynamically
 
 # Level 5 (Boss level) uses 41x41 maze
@@ -16,12 +21,38 @@ FINAL_BOSS_MAZE_COLS, FINAL_BOSS_MAZE_ROWS = 51, 51
 # Level 15 (Ultimate Boss level) uses 61x61 maze
 ULTIMATE_BOSS_MAZE_COLS, ULTIMATE_BOSS_MAZE_ROWS = 61, 61
 
+# Frame timing: the game logic runs in fixed steps, rendering at up to FRAME_CAP fps in between
+SIMULATION_HZ = 60  # Logic steps per second (all speeds below are pixels per step)
+FRAME_CAP = config["frame_cap"]  # 0 renders as fast as possible
+FRAME_CAP_OPTIONS = [30, 60, 120, 0]
+MAX_FRAME_MS = 250  # Longer frames are cut short, so a hitch cannot queue up a burst of steps
+
 # Game mechanics
 PLAYER_SPEED = 2
 BOOST_SPEED = 2
 ENEMY_SPEED = 3
 HATE_VALUE = 0
 
+# Enemy pathfinding: "flow_field" (one shared BFS per player tile), "a_star" (one search per enemy),
+# "jps" (Jump Point Search per enemy), "hpa" (hierarchical search over maze clusters),
+# "alt" (A* with landmark distance bounds), "next_hop" (precomputed all-pairs table, level mazes only)
+# or "incremental" (per-enemy search state repaired as the player moves)
+ENEMY_PATHFINDING = "flow_field"
+HPA_CLUSTER_SIZE = 10  # Cluster width/height in tiles for "hpa"
+ALT_LANDMARKS = 8  # Landmarks precomputed per maze for "alt"
+ALT_ACTIVE_LANDMARKS = 3  # Landmarks consulted per search node for "alt"
+NEXT_HOP_CACHE_DIR = "cache"  # Saved next-hop tables for "next_hop"
+NEXT_HOP_MAX_BYTES = 16 * 1024 * 1024  # Larger mazes use NEXT_HOP_FALLBACK instead
+NEXT_HOP_FALLBACK = "a_star"  # Pathfinder for random mazes under "next_hop"
+PATHFINDING_BUDGET_US = 2000  # Per-frame time for queued enemy path searches (0 searches immediately)
+PATHFINDING_SLICE_EXPANSIONS = 32  # Tiles expanded between budget checks in a resumable search
+PATHFINDING_WORKER = False  # Run enemy path searches in a background process (see path_worker.py)
+
+# Horde mode (needs NumPy, see horde.py)
+HORDE_SIZE = 300  # Pursuers kept on the map
+HORDE_SPEED = 1  # Pixels per step
+HORDE_SPAWN_DISTANCE = 15  # Minimum steps between a (re)spawned pursuer and the player
+
 # Durations (in milliseconds)
 BOOST_DURATION = 5000
 FREEZE_DURATION = 3000
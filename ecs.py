@@ -0,0 +1,263 @@
+import time
+import collision
+
+# Entity-component-system core.
+# An entity is just an int. Each component type lives in its own
+# ComponentStore: records packed densely in a list, so every system is a
+# single loop over one list per frame instead of one method call per sprite.
+# Player, Item and Key keep their pygame.sprite.Sprite classes as thin
+# facades that own an entity and hold references to its records.
+
+# === Components ===
+
+class Transform:
+    """World-space rect of an entity (shared with its facade's .rect)"""
+    __slots__ = ("rect",)
+
+    def __init__(self, rect):
+        self.rect = rect
+
+class Motion:
+    """
+    Movement for this frame in pixels
+    body is the rect pushed out of walls (None to move the transform freely)
+    """
+    __slots__ = ("dx", "dy", "body")
+
+    def __init__(self, dx=0, dy=0, body=None):
+        self.dx = dx
+        self.dy = dy
+        self.body = body
+
+class Renderable:
+    """Image drawn at the entity's transform"""
+    __slots__ = ("image",)
+
+    def __init__(self, image):
+        self.image = image
+
+class Animated:
+    """Looping animation that sets the entity's Renderable image"""
+    __slots__ = ("frames", "frame_ms", "index", "next_ms")
+
+    def __init__(self, frames, frame_ms):
+        self.frames = frames
+        self.frame_ms = frame_ms
+        self.index = 0
+        self.next_ms = 0  # Game time of the next frame change
+
+class Effects:
+    """
+    Timed effects: names in active expire once durations[name]() ms have passed since their start time
+    starts keeps the last start time of every effect, active or not; durations are
+    functions so that settings changed later (difficulty) still apply
+    """
+    __slots__ = ("active", "starts", "durations")
+
+    def __init__(self, durations):
+        self.active = set()
+        self.starts = {}
+        self.durations = durations
+
+class Collider:
+    """Pickup area tested against the collision target (the player) every frame"""
+    __slots__ = ("kind", "rect", "owner")
+
+    def __init__(self, kind, rect, owner=None):
+        self.kind = kind
+        self.rect = rect
+        self.owner = owner  # Facade sprite handed back with the collision
+
+COMPONENTS = (Transform, Motion, Renderable, Animated, Effects, Collider)
+
+# === Storage ===
+
+class ComponentStore:
+    """
+    Dense storage for one component type
+
+    records[i] belongs to entities[i]; slots maps an entity to i. Removal
+    moves the last record into the hole, so the lists never have gaps.
+    """
+    __slots__ = ("entities", "records", "slots")
+
+    def __init__(self):
+        self.entities = []
+        self.records = []
+        self.slots = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def add(self, entity, record):
+        """Attach record to entity (replacing any record of the same type)"""
+        slot = self.slots.get(entity)
+        if slot is not None:
+            self.records[slot] = record
+            return
+        self.slots[entity] = len(self.records)
+        self.entities.append(entity)
+        self.records.append(record)
+
+    def get(self, entity):
+        """Get the record of entity, or None"""
+        slot = self.slots.get(entity)
+        return None if slot is None else self.records[slot]
+
+    def remove(self, entity):
+        """Detach the record of entity, if any"""
+        slot = self.slots.pop(entity, None)
+        if slot is None:
+            return
+        last_entity = self.entities.pop()
+        last_record = self.records.pop()
+        if last_entity != entity:
+            self.entities[slot] = last_entity
+            self.records[slot] = last_record
+            self.slots[last_entity] = slot
+
+    def clear(self):
+        """Detach every record"""
+        self.entities.clear()
+        self.records.clear()
+        self.slots.clear()
+
+class World:
+    """
+    All entities and their components, plus the per-frame system passes
+
+    update() runs movement, animation, effects and collision once each;
+    render() draws every Renderable in one blits call.
+
+    Instrumentation: entity count, records per component and time per update; see stats().
+    """
+    def __init__(self):
+        self.stores = {component: ComponentStore() for component in COMPONENTS}
+        self.next_entity = 1
+        self.entities = set()
+        self.collisions = []  # Colliders touching the target during the last update
+
+        # Instrumentation
+        self.updates = 0
+        self.update_ms = 0.0
+
+    def create(self, *records):
+        """Create an entity with the given component records. Returns the entity."""
+        entity = self.next_entity
+        self.next_entity += 1
+        self.entities.add(entity)
+        for record in records:
+            self.stores[type(record)].add(entity, record)
+        return entity
+
+    def add(self, entity, record):
+        """Attach a component record to an entity"""
+        self.stores[type(record)].add(entity, record)
+
+    def get(self, entity, component):
+        """Get an entity's record of a component type, or None"""
+        return self.stores[component].get(entity)
+
+    def destroy(self, entity):
+        """Remove an entity and all of its components"""
+        if entity not in self.entities:
+            return
+        self.entities.discard(entity)
+        for store in self.stores.values():
+            store.remove(entity)
+
+    def clear(self):
+        """Remove every entity"""
+        self.entities.clear()
+        for store in self.stores.values():
+            store.clear()
+        self.collisions = []
+
+    def update(self, now, target=None):
+        """
+        Run one pass of every gameplay system
+        Args:
+            now: Game time in milliseconds (pause-adjusted)
+            target: Rect that colliders are tested against (the player's), or None
+        """
+        started = time.perf_counter()
+        movement_system(self)
+        animation_system(self, now)
+        effects_system(self, now)
+        self.collisions = collision_system(self, target) if target is not None else []
+        self.updates += 1
+        self.update_ms += (time.perf_counter() - started) * 1000
+
+    def render(self, surface, camera):
+        """Draw every Renderable entity inside the camera's view"""
+        render_system(self, surface, camera)
+
+    def stats(self):
+        """Get world counters"""
+        stats = {component.__name__: len(store) for component, store in self.stores.items()}
+        stats["entities"] = len(self.entities)
+        stats["avg_update_ms"] = self.update_ms / self.updates if self.updates else 0.0
+        return stats
+
+# === Systems ===
+
+def movement_system(world):
+    """Apply every Motion to its Transform, sliding bodies along walls"""
+    transforms = world.stores[Transform]
+    for entity, motion in zip(world.stores[Motion].entities, world.stores[Motion].records):
+        if not motion.dx and not motion.dy:
+            continue
+        rect = transforms.get(entity).rect
+        body = motion.body
+        if body is None:
+            rect.move_ip(motion.dx, motion.dy)
+            continue
+        if motion.dx:
+            body.x = collision.move_axis(body, motion.dx, 0).x
+        if motion.dy:
+            body.y = collision.move_axis(body, 0, motion.dy).y
+        rect.center = body.center
+
+def animation_system(world, now):
+    """Advance every Animated whose frame time is up and show the frame"""
+    renderables = world.stores[Renderable]
+    for entity, animation in zip(world.stores[Animated].entities, world.stores[Animated].records):
+        if now < animation.next_ms:
+            continue
+        animation.next_ms = now + animation.frame_ms
+        animation.index = (animation.index + 1) % len(animation.frames)
+        renderables.get(entity).image = animation.frames[animation.index]
+
+def effects_system(world, now):
+    """End every timed effect whose duration has passed"""
+    for effects in world.stores[Effects].records:
+        if effects.active:
+            starts, durations = effects.starts, effects.durations
+            effects.active = {name for name in effects.active if now - starts.get(name, 0) <= durations[name]()}
+
+def collision_system(world, target):
+    """Get the Colliders overlapping target"""
+    colliders = world.stores[Collider].records
+    return [colliders[index] for index in target.collidelistall([collider.rect for collider in colliders])]
+
+def render_system(world, surface, camera):
+    """Blit every Renderable overlapping the camera's view, in creation order, with one blits call"""
+    view = camera.get_visible_area()
+    transforms = world.stores[Transform]
+    renderables = world.stores[Renderable]
+    offset_x, offset_y = camera.x, camera.y
+    visible = []
+    for entity, renderable in zip(renderables.entities, renderables.records):
+        rect = transforms.get(entity).rect
+        if rect.colliderect(view):
+            visible.append((entity, renderable.image, (rect.x - offset_x, rect.y - offset_y)))
+    # Removals reorder the store; sorting what is on screen keeps later entities on top
+    visible.sort(key=first)
+    surface.blits([(image, position) for entity, image, position in visible], doreturn=False)
+
+def first(item):
+    """Sort key: the entity of a tuple that starts with one"""
+    return item[0]
+
+# Entities of the current game
+world = World()
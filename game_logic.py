@@ -1,7 +1,10 @@
 import pygame
 import constants
 from assets import *
-from game_objects import Enemy
+from game_objects import enemy_pool, item_pool, key_pool
+from maze import path_scheduler
+from path_worker import path_worker
+from ecs import world
 from music_manager import setup_game_music, setup_menu_music
 from renderer import draw_game_screen
 
@@ -27,8 +30,15 @@ def main_game_loop():
     """Main game loop"""
     setup_game_music()
     
+    # Fixed-timestep loop: real time is fed to the simulation in steps of 1 / SIMULATION_HZ seconds,
+    # so speeds do not depend on the frame rate; rendering interpolates between the last two steps
+    step_ms = 1000 / constants.SIMULATION_HZ
+    accumulator = 0.0
+    clock.tick()  # Do not count the time spent in the menus
+    
     while game_state.running:
-        dt = clock.tick(60)
+        # Frames longer than MAX_FRAME_MS are cut short (the game slows down instead of freezing)
+        accumulator += min(clock.tick(constants.FRAME_CAP), constants.MAX_FRAME_MS)
         screen.fill(constants.BLACK)
         keys = pygame.key.get_pressed()
 
@@ -53,160 +63,216 @@ def main_game_loop():
             elif action == "resume" or action is None:
                 game_state.resume_game()
                 setup_game_music()
+            clock.tick()  # The pause does not need catching up
+            accumulator = 0.0
             continue
 
-        if game_state.spawn_enemy_after_delay:
-            game_state.enemy_group.add(Enemy((constants.TILE_SIZE, constants.TILE_SIZE)))
-            game_state.spawn_enemy_after_delay = False
+        while accumulator >= step_ms:
+            accumulator -= step_ms
+            if simulation_step(keys) is not None:
+                return "main_menu"
 
-        game_state.player.update(keys)
+        # Spend this frame's pathfinding budget on the searches queued by the steps above
+        # (or hand them to the background worker in one batch); once per frame, however many steps ran
+        if path_worker.enabled():
+            path_worker.flush()
+        else:
+            path_scheduler.run()
 
-        # Handle enemy spawning based on game mode
-        if game_state.game_mode == "level" and game_state.current_level == 15:
-            # Ultimate Boss level (Level 15) - maintain 4 enemies max, but wait for invisible duration
-            alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
-            if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
-                # Respawn all four enemies for ultimate boss level
-                game_state.spawn_ultimate_boss_enemies()
+        # Draw everything, part of the way from the previous step to the current one
+        draw_game_screen(accumulator / step_ms)
+    
+    return "main_menu"
+
+def simulation_step(keys):
+    """
+    Advance the game by one fixed step (1 / SIMULATION_HZ seconds); speeds are in pixels per step
+    Returns:
+        "main_menu" when the run ended during this step, otherwise None
+    """
+    game_state = get_game_state()
+    remember_positions(game_state)
+
+    if game_state.spawn_enemy_after_delay:
+        game_state.enemy_group.add(enemy_pool.acquire((constants.TILE_SIZE, constants.TILE_SIZE)))
+        game_state.spawn_enemy_after_delay = False
+
+    game_state.player.update(keys)
+    
+    # One pass of each ECS system: player movement, key animation, effect timers, pickups
+    world.update(game_state.get_adjusted_time(), game_state.player.rect)
+
+    # Handle enemy spawning based on game mode
+    if game_state.game_mode == "level" and game_state.current_level == 15:
+        # Ultimate Boss level (Level 15) - maintain 4 enemies max, but wait for invisible duration
+        alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
+        if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
+            # Respawn all four enemies for ultimate boss level
+            game_state.spawn_ultimate_boss_enemies()
+    elif game_state.game_mode == "level" and game_state.current_level == 10:
+        # Final Boss level (Level 10) - maintain 3 enemies max, but wait for invisible duration
+        alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
+        if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
+            # Respawn all three enemies for final boss level
+            game_state.spawn_final_boss_enemies()
+    elif game_state.game_mode == "level" and game_state.current_level == 5:
+        # Boss level (Level 5) - maintain 2 enemies max, but wait for invisible duration
+        alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
+        if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
+            # Respawn both enemies for boss level
+            game_state.spawn_boss_enemies()
+    elif game_state.game_mode == "level" and game_state.current_level >= 11 and game_state.current_level <= 14:
+        # Levels 11-14 - spawn 2 enemies with special positioning
+        alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
+        if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
+            game_state.spawn_level_11_14_enemies()
+    elif game_state.game_mode == "level" and game_state.current_level >= 6:
+        # Advanced levels (6-9) - spawn single enemy with special positioning
+        alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
+        if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
+            game_state.spawn_single_enemy()
+    elif game_state.game_mode == "level":
+        # Standard level mode (1-4) - spawn single enemy after invisible duration  
+        alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
+        if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
+            new_enemy = enemy_pool.acquire((constants.TILE_SIZE, constants.TILE_SIZE))
+            new_enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
+            game_state.enemy_group.add(new_enemy)
+    elif game_state.game_mode == "horde":
+        # Horde mode - keep the horde at full size after invisible duration (the fallen return far away)
+        horde = game_state.horde
+        if game_state.get_elapsed_time() > constants.INVISIBLE_DURATION and horde.count < constants.HORDE_SIZE:
+            horde.spawn_away(constants.HORDE_SIZE - horde.count, player_tile(game_state.player))
+    else:
+        # Random mode - spawn single enemy after invisible duration
+        if game_state.get_elapsed_time() > constants.INVISIBLE_DURATION and len(game_state.enemy_group) == 0:
+            new_enemy = enemy_pool.acquire((constants.TILE_SIZE, constants.TILE_SIZE))
+            new_enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
+            game_state.enemy_group.add(new_enemy)
+
+    # Update enemies and remove completed death animations
+    enemies_to_remove = []
+    for enemy in game_state.enemy_group:
+        enemy.update(game_state.player)
+        
+        # Check if the death animation is complete
+        if enemy.dying and enemy.is_death_animation_complete():
+            enemies_to_remove.append(enemy)
+    
+    if game_state.horde is not None:
+        game_state.horde.update(player_tile(game_state.player), game_state.get_adjusted_time())
+    
+    # Remove enemies whose death animations have completed
+    # (back into the pool, so the respawns below reuse them)
+    for enemy in enemies_to_remove:
+        enemy_pool.release(enemy)
+        path_scheduler.cancel(enemy)
+        path_worker.cancel(enemy)
+        
+    # Handle enemy respawning based on game mode
+    if enemies_to_remove:
+        if game_state.game_mode == "random":
+            # Random mode - respawn immediately
+            for _ in enemies_to_remove:
+                new_enemy = enemy_pool.acquire((constants.TILE_SIZE, constants.TILE_SIZE))
+                new_enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
+                game_state.enemy_group.add(new_enemy)
         elif game_state.game_mode == "level" and game_state.current_level == 10:
-            # Final Boss level (Level 10) - maintain 3 enemies max, but wait for invisible duration
-            alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
-            if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
-                # Respawn all three enemies for final boss level
-                game_state.spawn_final_boss_enemies()
+            # Final Boss level (Level 10) - maintain 3 enemies, respawn immediately after death
+            current_alive_enemies = len([enemy for enemy in game_state.enemy_group if not enemy.dying])
+            for _ in enemies_to_remove:
+                # Spawn new enemy at different positions to avoid overlap (51x51 map)
+                spawn_positions = [
+                    (5 * constants.TILE_SIZE, 5 * constants.TILE_SIZE),
+                    (45 * constants.TILE_SIZE, 45 * constants.TILE_SIZE),
+                    (5 * constants.TILE_SIZE, 45 * constants.TILE_SIZE),
+                    (45 * constants.TILE_SIZE, 5 * constants.TILE_SIZE),
+                    (25 * constants.TILE_SIZE, 25 * constants.TILE_SIZE),
+                    (15 * constants.TILE_SIZE, 35 * constants.TILE_SIZE)
+                ]
+                spawn_pos = spawn_positions[current_alive_enemies % len(spawn_positions)]
+                new_enemy = enemy_pool.acquire(spawn_pos)
+                new_enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
+                game_state.enemy_group.add(new_enemy)
+                current_alive_enemies += 1
+            print(f"Final Boss level: Enemy respawned, total enemies: {len([e for e in game_state.enemy_group if not e.dying])}")
         elif game_state.game_mode == "level" and game_state.current_level == 5:
-            # Boss level (Level 5) - maintain 2 enemies max, but wait for invisible duration
-            alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
-            if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
-                # Respawn both enemies for boss level
-                game_state.spawn_boss_enemies()
-        elif game_state.game_mode == "level" and game_state.current_level >= 11 and game_state.current_level <= 14:
-            # Levels 11-14 - spawn 2 enemies with special positioning
-            alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
-            if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
-                game_state.spawn_level_11_14_enemies()
-        elif game_state.game_mode == "level" and game_state.current_level >= 6:
-            # Advanced levels (6-9) - spawn single enemy with special positioning
-            alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
-            if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
-                game_state.spawn_single_enemy()
-        elif game_state.game_mode == "level":
-            # Standard level mode (1-4) - spawn single enemy after invisible duration  
-            alive_enemies = [enemy for enemy in game_state.enemy_group if not enemy.dying]
-            if len(alive_enemies) == 0 and game_state.get_elapsed_time() > constants.INVISIBLE_DURATION:
-                new_enemy = Enemy((constants.TILE_SIZE, constants.TILE_SIZE))
+            # Boss level (Level 5) - maintain 2 enemies, respawn immediately after death
+            current_alive_enemies = len([enemy for enemy in game_state.enemy_group if not enemy.dying])
+            for _ in enemies_to_remove:
+                # Spawn new enemy at different positions to avoid overlap
+                spawn_positions = [
+                    (5 * constants.TILE_SIZE, 5 * constants.TILE_SIZE),
+                    (39 * constants.TILE_SIZE, 39 * constants.TILE_SIZE),
+                    (5 * constants.TILE_SIZE, 39 * constants.TILE_SIZE),
+                    (39 * constants.TILE_SIZE, 5 * constants.TILE_SIZE)
+                ]
+                spawn_pos = spawn_positions[current_alive_enemies % len(spawn_positions)]
+                new_enemy = enemy_pool.acquire(spawn_pos)
                 new_enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
                 game_state.enemy_group.add(new_enemy)
-        else:
-            # Random mode - spawn single enemy after invisible duration
-            if game_state.get_elapsed_time() > constants.INVISIBLE_DURATION and len(game_state.enemy_group) == 0:
-                new_enemy = Enemy((constants.TILE_SIZE, constants.TILE_SIZE))
+                current_alive_enemies += 1
+            print(f"Boss level: Enemy respawned, total enemies: {len([e for e in game_state.enemy_group if not e.dying])}")
+        elif game_state.game_mode == "level" and game_state.current_level >= 11 and game_state.current_level <= 14:
+            # Levels 11-14 - maintain 2 enemies, respawn immediately after death
+            current_alive_enemies = len([enemy for enemy in game_state.enemy_group if not enemy.dying])
+            for _ in enemies_to_remove:
+                # Spawn new enemy at different positions to avoid overlap (51x51 map)
+                spawn_positions = [
+                    (7 * constants.TILE_SIZE, 7 * constants.TILE_SIZE),
+                    (43 * constants.TILE_SIZE, 43 * constants.TILE_SIZE),
+                    (7 * constants.TILE_SIZE, 43 * constants.TILE_SIZE),
+                    (43 * constants.TILE_SIZE, 7 * constants.TILE_SIZE),
+                    (25 * constants.TILE_SIZE, 25 * constants.TILE_SIZE),
+                    (15 * constants.TILE_SIZE, 35 * constants.TILE_SIZE)
+                ]
+                spawn_pos = spawn_positions[current_alive_enemies % len(spawn_positions)]
+                new_enemy = enemy_pool.acquire(spawn_pos)
                 new_enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
                 game_state.enemy_group.add(new_enemy)
+                current_alive_enemies += 1
+            print(f"Level {game_state.current_level}: Enemy respawned, total enemies: {len([e for e in game_state.enemy_group if not e.dying])}")
 
-        # Update enemies and remove completed death animations
-        enemies_to_remove = []
-        for enemy in game_state.enemy_group:
-            enemy.update(game_state.player)
-            
-            # Check if the death animation is complete
-            if enemy.dying and enemy.is_death_animation_complete():
-                enemies_to_remove.append(enemy)
-        
-        # Remove enemies whose death animations have completed
-        for enemy in enemies_to_remove:
-            enemy.kill()
-            
-        # Handle enemy respawning based on game mode
-        if enemies_to_remove:
-            if game_state.game_mode == "random":
-                # Random mode - respawn immediately
-                for _ in enemies_to_remove:
-                    new_enemy = Enemy((constants.TILE_SIZE, constants.TILE_SIZE))
-                    new_enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
-                    game_state.enemy_group.add(new_enemy)
-            elif game_state.game_mode == "level" and game_state.current_level == 10:
-                # Final Boss level (Level 10) - maintain 3 enemies, respawn immediately after death
-                current_alive_enemies = len([enemy for enemy in game_state.enemy_group if not enemy.dying])
-                for _ in enemies_to_remove:
-                    # Spawn new enemy at different positions to avoid overlap (51x51 map)
-                    spawn_positions = [
-                        (5 * constants.TILE_SIZE, 5 * constants.TILE_SIZE),
-                        (45 * constants.TILE_SIZE, 45 * constants.TILE_SIZE),
-                        (5 * constants.TILE_SIZE, 45 * constants.TILE_SIZE),
-                        (45 * constants.TILE_SIZE, 5 * constants.TILE_SIZE),
-                        (25 * constants.TILE_SIZE, 25 * constants.TILE_SIZE),
-                        (15 * constants.TILE_SIZE, 35 * constants.TILE_SIZE)
-                    ]
-                    spawn_pos = spawn_positions[current_alive_enemies % len(spawn_positions)]
-                    new_enemy = Enemy(spawn_pos)
-                    new_enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
-                    game_state.enemy_group.add(new_enemy)
-                    current_alive_enemies += 1
-                print(f"Final Boss level: Enemy respawned, total enemies: {len([e for e in game_state.enemy_group if not e.dying])}")
-            elif game_state.game_mode == "level" and game_state.current_level == 5:
-                # Boss level (Level 5) - maintain 2 enemies, respawn immediately after death
-                current_alive_enemies = len([enemy for enemy in game_state.enemy_group if not enemy.dying])
-                for _ in enemies_to_remove:
-                    # Spawn new enemy at different positions to avoid overlap
-                    spawn_positions = [
-                        (5 * constants.TILE_SIZE, 5 * constants.TILE_SIZE),
-                        (39 * constants.TILE_SIZE, 39 * constants.TILE_SIZE),
-                        (5 * constants.TILE_SIZE, 39 * constants.TILE_SIZE),
-                        (39 * constants.TILE_SIZE, 5 * constants.TILE_SIZE)
-                    ]
-                    spawn_pos = spawn_positions[current_alive_enemies % len(spawn_positions)]
-                    new_enemy = Enemy(spawn_pos)
-                    new_enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
-                    game_state.enemy_group.add(new_enemy)
-                    current_alive_enemies += 1
-                print(f"Boss level: Enemy respawned, total enemies: {len([e for e in game_state.enemy_group if not e.dying])}")
-            elif game_state.game_mode == "level" and game_state.current_level >= 11 and game_state.current_level <= 14:
-                # Levels 11-14 - maintain 2 enemies, respawn immediately after death
-                current_alive_enemies = len([enemy for enemy in game_state.enemy_group if not enemy.dying])
-                for _ in enemies_to_remove:
-                    # Spawn new enemy at different positions to avoid overlap (51x51 map)
-                    spawn_positions = [
-                        (7 * constants.TILE_SIZE, 7 * constants.TILE_SIZE),
-                        (43 * constants.TILE_SIZE, 43 * constants.TILE_SIZE),
-                        (7 * constants.TILE_SIZE, 43 * constants.TILE_SIZE),
-                        (43 * constants.TILE_SIZE, 7 * constants.TILE_SIZE),
-                        (25 * constants.TILE_SIZE, 25 * constants.TILE_SIZE),
-                        (15 * constants.TILE_SIZE, 35 * constants.TILE_SIZE)
-                    ]
-                    spawn_pos = spawn_positions[current_alive_enemies % len(spawn_positions)]
-                    new_enemy = Enemy(spawn_pos)
-                    new_enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
-                    game_state.enemy_group.add(new_enemy)
-                    current_alive_enemies += 1
-                print(f"Level {game_state.current_level}: Enemy respawned, total enemies: {len([e for e in game_state.enemy_group if not e.dying])}")
+    # Handle item pickup
+    handle_item_pickup()
+    
+    # Handle speed boost timer
+    handle_speed_boost()
+    
+    # Handle key collection
+    handle_key_collection()
+    
+    # Check victory condition
+    if check_victory_condition():
+        return "main_menu"
+    
+    # Handle enemy collision
+    if handle_enemy_collision() or handle_horde_collision():
+        return "main_menu"
+    return None
 
-        # Handle item pickup
-        handle_item_pickup()
-        
-        # Handle speed boost timer
-        handle_speed_boost()
-        
-        # Handle key collection
-        handle_key_collection()
-        
-        # Check victory condition
-        if check_victory_condition():
-            return "main_menu"
-        
-        # Handle enemy collision
-        if handle_enemy_collision():
-            return "main_menu"
+def remember_positions(game_state):
+    """Store where every moving sprite is before a step, for render interpolation"""
+    game_state.player.previous_pos = game_state.player.rect.topleft
+    for enemy in game_state.enemy_group:
+        enemy.previous_pos = enemy.rect.topleft
 
-        # Draw everything
-        draw_game_screen()
-    
-    return "main_menu"
+def player_tile(player):
+    """Get the (col, row) tile under the player's center"""
+    grid_x, grid_y = player.get_grid_position()
+    return (grid_x // constants.TILE_SIZE, grid_y // constants.TILE_SIZE)
+
+def collect(group, pool):
+    """Release to pool and return the sprites of group whose colliders touched the player in the last world.update"""
+    collected = [collider.owner for collider in world.collisions if collider.owner in group]
+    for sprite in collected:
+        pool.release(sprite)
+    return collected
 
 def handle_item_pickup():
     """Handle item pickup logic"""
     game_state = get_game_state()
-    for item in pygame.sprite.spritecollide(game_state.player, game_state.item_group, True):
+    for item in collect(game_state.item_group, item_pool):
         pickUp_sound.play()
         if item.type == 'red':
             game_state.player.conditional_effect_active_red = True
@@ -231,7 +297,7 @@ def handle_speed_boost():
 def handle_key_collection():
     """Handle key collection"""
     game_state = get_game_state()
-    collected_keys = pygame.sprite.spritecollide(game_state.player, game_state.key_group, True)
+    collected_keys = collect(game_state.key_group, key_pool)
     if collected_keys:
         game_state.has_key = True
         constants.HATE_VALUE += 1
@@ -336,4 +402,38 @@ def handle_enemy_collision():
             hit_sound.play()
             show_game_over_screen()
             return True
-    return False
\ No newline at end of file
+    return False
+
+def handle_horde_collision():
+    """Handle horde pursuers touching the player (same rules as enemies, applied to every pursuer hit)"""
+    game_state = get_game_state()
+    if game_state.horde is None:
+        return False
+    show_pause_menu, show_victory_screen, show_game_over_screen = get_menu_functions()
+    
+    hits = game_state.horde.collide(game_state.player.rect)
+    if len(hits) == 0 or game_state.player.invincible:
+        return False
+    
+    now = game_state.get_adjusted_time()
+    if game_state.player.conditional_effect_active_red:
+        # Red item effect - Slash every pursuer touching the player
+        sword_sound.play()
+        game_state.horde.kill(hits)
+        constants.HATE_VALUE += 1
+        game_state.player.conditional_effect_active_red = False
+    elif game_state.player.conditional_effect_active_blue:
+        # Blue item effect - Freeze every pursuer touching the player
+        freeze_sound.play()
+        game_state.horde.freeze(hits, now + constants.FREEZE_DURATION)
+        constants.HATE_VALUE += 1
+        game_state.player.conditional_effect_active_blue = False
+    else:
+        # Game over - No Any Protect Effect
+        hit_sound.play()
+        show_game_over_screen()
+        return True
+    
+    game_state.player.invincible = True
+    game_state.player.invincible_start_time = now
+    return False
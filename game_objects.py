@@ -3,28 +3,17 @@ import time
 import random
 import os
 import constants
-from maze import a_star, is_path
+import collision
+from animations import load_frame_variants, effect_animation, animation_timing
+from ecs import world, Transform, Motion, Renderable, Animated, Effects, Collider
+from pools import SpritePool
+from path_worker import path_worker
+from maze import find_path, is_path, flow_field, next_hop_table, path_scheduler, IncrementalPlanner
 
 def get_game_state():
     from game_state import game_state
     return game_state
 
-def get_maze_walls():
-    """Get current maze walls"""
-    from maze import walls
-    return walls
-
-def load_frames_safely(base_path, count, start_from=1):
-    """Safely load animation frames, skip if the file does not exist"""
-    frames = []
-    for i in range(start_from, start_from + count):
-        file_path = f"{base_path}/frame-{i}.png"
-        if os.path.exists(file_path):
-            frames.append(pygame.image.load(file_path).convert_alpha())
-        else:
-            print(f"Warning: {file_path} not found, skipping...")
-    return frames if frames else [pygame.Surface((40, 40))]  # Returns a blank image if no frame is found
-
 def find_nearest_walkable_position(target_pos):
     """Find the nearest accessible location near the target location"""
     x, y = target_pos
@@ -52,37 +41,82 @@ def find_nearest_walkable_position(target_pos):
     # If not found, return to the original location
     return target_pos
 
+def effect_flag(name):
+    """Facade property: whether a timed effect in the entity's Effects record is active"""
+    def get(self):
+        return name in self.effects.active
+    def set(self, active):
+        if active:
+            self.effects.active.add(name)
+        else:
+            self.effects.active.discard(name)
+    return property(get, set)
+
+def effect_start_time(name):
+    """Facade property: when a timed effect in the entity's Effects record last started"""
+    def get(self):
+        return self.effects.starts.get(name, 0)
+    def set(self, start_time):
+        self.effects.starts[name] = start_time
+    return property(get, set)
+
 class Player(pygame.sprite.Sprite):
+    # Timed effects live in the player's Effects record and expire in ecs.effects_system
+    conditional_effect_active_red = effect_flag("red")
+    conditional_effect_start_time_red = effect_start_time("red")
+    conditional_effect_active_blue = effect_flag("blue")
+    conditional_effect_start_time_blue = effect_start_time("blue")
+    invincible = effect_flag("invincible")
+    invincible_start_time = effect_start_time("invincible")
+
     def __init__(self, pos):
         super().__init__()
-        # Load animation frames safely
-        self.frames = load_frames_safely("assets/img/player", 13, 1)
-        self.current_frame = 0
-        self.image = self.frames[self.current_frame]
+        # Load animation frames safely (shared; index frame_variants with facing_right)
+        self.frame_variants = load_frame_variants("assets/img/player", 13, 1)
+        self.frames = self.frame_variants[True]
+        self.image = self.frames[0]
         self.rect = self.image.get_rect(topleft=pos)
         self.collision_rect = self.rect.inflate(-20, -20)
+        self.animation_speed = animation_timing("assets/img/player", 3)
+
+        # Entity: position and wall-sliding movement (ecs.movement_system), timed effects (ecs.effects_system)
+        self.transform = Transform(self.rect)
+        self.motion = Motion(body=self.collision_rect)
+        self.effects = Effects({
+            "red": lambda: constants.RED_DURATION,
+            "blue": lambda: constants.BLUE_DURATION,
+            "invincible": lambda: 3000,
+        })
+
+        # Boost effect
+        self.boost_frames = effect_animation("assets/img/items/bolt_effect", 7, 1)  # Decoded on first boost
+        self.boost_animation_speed = animation_timing("assets/img/items/bolt_effect", 35)
+        self.reset(pos)
+
+    def reset(self, pos):
+        """Put the player back in its starting state at pos and register its entity again (reused across runs)"""
+        self.current_frame = 0
+        self.image = self.frames[0]
+        self.rect.topleft = pos
+        self.previous_pos = pos  # Position before the last simulation step (for render interpolation)
+        self.collision_rect.center = self.rect.center
         self.speed = constants.PLAYER_SPEED
         self.base_speed = constants.PLAYER_SPEED
         self.facing_right = True
 
         # Animation properties
         self.animation_timer = 0
-        self.animation_speed = 3
         self.is_moving = False
 
-        # Effect properties
-        self.conditional_effect_active_red = False
-        self.conditional_effect_start_time_red = 0
-        self.conditional_effect_active_blue = False
-        self.conditional_effect_start_time_blue = 0
-        self.invincible = False
-        self.invincible_start_time = 0
+        # Movement and timed effects
+        self.motion.dx = self.motion.dy = 0
+        self.effects.active.clear()
+        self.effects.starts.clear()
+        self.entity = world.create(self.transform, self.motion, self.effects)
 
         # Boost effect
-        self.boost_frames = load_frames_safely("assets/img/items/bolt_effect", 7, 1)
         self.boost_current_frame = 0
         self.boost_animation_timer = 0
-        self.boost_animation_speed = 35
         self.is_boost = False
         
         # Stamina System
@@ -136,33 +170,9 @@ class Player(pygame.sprite.Sprite):
 
         self.is_moving = (dx != 0 or dy != 0)
 
-        # Handle horizontal collision
-        if dx != 0:
-            walls = get_maze_walls()
-            new_rect = self.collision_rect.move(dx, 0)
-            for wall in walls:
-                if new_rect.colliderect(wall):
-                    if dx > 0:
-                        new_rect.right = wall.left
-                    else:
-                        new_rect.left = wall.right
-                    break
-            self.collision_rect.x = new_rect.x
-
-        # Handle vertical collision
-        if dy != 0:
-            walls = get_maze_walls()
-            new_rect = self.collision_rect.move(0, dy)
-            for wall in walls:
-                if new_rect.colliderect(wall):
-                    if dy > 0:
-                        new_rect.bottom = wall.top
-                    else:
-                        new_rect.top = wall.bottom
-                    break
-            self.collision_rect.y = new_rect.y
-
-        self.rect.center = self.collision_rect.center
+        # Applied with wall collision by ecs.movement_system in the next world.update
+        self.motion.dx = dx
+        self.motion.dy = dy
     
     def handle_sprint(self, shift_pressed):
         """Processing running logic"""
@@ -205,49 +215,37 @@ class Player(pygame.sprite.Sprite):
             self.current_frame = 0  # Standing frame
 
         # Apply facing direction
-        frame_image = self.frames[self.current_frame]
-        self.image = frame_image if self.facing_right else pygame.transform.flip(frame_image, True, False)
-
-    def update_effects(self):
-        """Update player effects and timers"""
-        game_state = get_game_state()
-        current_time = game_state.get_adjusted_time()
-
-        # Handle invincibility
-        if self.invincible and current_time - self.invincible_start_time > 3000:
-            self.invincible = False
-
-        # Handle red effect
-        if self.conditional_effect_active_red and current_time - self.conditional_effect_start_time_red > constants.RED_DURATION:
-            self.conditional_effect_active_red = False
-
-        # Handle blue effect
-        if self.conditional_effect_active_blue and current_time - self.conditional_effect_start_time_blue > constants.BLUE_DURATION:
-            self.conditional_effect_active_blue = False
+        self.image = self.frame_variants[self.facing_right][self.current_frame]
 
     def update(self, keys):
-        """Main update method"""
+        """Main update method (movement and effect timers are then run by world.update)"""
         self.handle_movement(keys)
         self.update_animation()
-        self.update_effects()
 
-    def draw(self, surface):
-        """Draw player with boost effect if active"""
+    def kill(self):
+        """Remove from all groups and destroy the entity"""
+        super().kill()
+        world.destroy(self.entity)
+
+    def draw(self, surface, pos=(0, 0)):
+        """Draw player with boost effect if active, with its top-left corner at pos"""
         # Draw the player first
-        surface.blit(self.image, (0, 0))
+        surface.blit(self.image, pos)
         
         # Draw acceleration effect (if activated)
         if self.is_boost and len(self.boost_frames) > 0:
-            surface.blit(self.boost_frames[self.boost_current_frame], (0, 0))
+            surface.blit(self.boost_frames[self.boost_current_frame], pos)
 
-    def draw_stamina_bar_at_top(self, surface):
-        """Draw stamina bar at the top of the surface"""
+    def draw_stamina_bar_at_top(self, surface, pos=(0, 0), width=None):
+        """Draw stamina bar centered at the top of the area of the given width starting at pos (defaults to the whole surface)"""
         if True:
             bar_width = 30
             bar_height = 4
             
-            bar_x = (surface.get_width() // 2) - (bar_width // 2)
-            bar_y = 5
+            if width is None:
+                width = surface.get_width()
+            bar_x = pos[0] + (width // 2) - (bar_width // 2)
+            bar_y = pos[1] + 5
             
             # Background strips (gray)
             bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
@@ -275,50 +273,70 @@ class Player(pygame.sprite.Sprite):
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, pos):
         super().__init__()
-        # Load enemy frames safely
-        self.frames = load_frames_safely("assets/img/enemy", 8, 1)
-        self.current_frame = 0
-        self.image = self.frames[self.current_frame]
+        # Load enemy frames safely (shared; index frame_variants with facing_right)
+        self.frame_variants = load_frame_variants("assets/img/enemy", 8, 1)
+        self.frames = self.frame_variants[True]
+        self.image = self.frames[0]
         self.rect = self.image.get_rect(topleft=pos)
+        self.animation_speed = animation_timing("assets/img/enemy", 25)
+        self.path_update_interval = 500  # Update path every 500ms
+        self.planner = IncrementalPlanner()  # Used when ENEMY_PATHFINDING is "incremental"
+        
+        # Attack effects
+        self.attack_frames = effect_animation("assets/img/hit/slash", 12, 0)  # Decoded on first attack
+        self.attack_animation_speed = animation_timing("assets/img/hit/slash", 50)
+        
+        # Death animation
+        self.death_duration = len(self.attack_frames) * self.attack_animation_speed if self.attack_frames else 500
+        
+        # Freeze effect
+        self.freeze_frames = effect_animation("assets/img/hit/freeze", 62, 1)  # Decoded on first freeze
+        self.freeze_animation_speed = animation_timing("assets/img/hit/freeze", 10)
+        
+        self.max_stuck_count = 10
+        self.reset(pos)
+
+    def reset(self, pos):
+        """Put the enemy back in its just-spawned state at pos (used by enemy_pool to recycle it)"""
+        self.current_frame = 0
+        self.image = self.frames[0]
+        self.rect.topleft = pos
+        self.previous_pos = pos  # Position before the last simulation step (for render interpolation)
         
         # Enemy properties
         self.speed = constants.ENEMY_SPEED
         self.path = []
         self.path_index = 0
         self.animation_timer = 0
-        self.animation_speed = 25
         self.last_target_pos = None
         self.path_update_timer = 0
-        self.path_update_interval = 500  # Update path every 500ms
         
         # Direction tracking for sprite flipping
         self.facing_right = True
         self.last_position = pos
         
         # Attack effects
-        self.attack_frames = load_frames_safely("assets/img/hit/slash", 12, 0)
         self.attack_current_frame = 0
         self.attack_animation_timer = 0
-        self.attack_animation_speed = 50
         self.attacking = False
         
-        # Death state and animation
+        # Death state
         self.dying = False
         self.death_animation_complete = False
         self.death_start_time = 0
-        self.death_duration = len(self.attack_frames) * self.attack_animation_speed if self.attack_frames else 500
         
         # Freeze effect
         self.frozen = False
         self.freeze_current_frame = 0
-        self.freeze_frames = load_frames_safely("assets/img/hit/freeze", 62, 1) 
         self.freeze_animation_timer = 0
-        self.freeze_animation_speed = 10
         
         # Direct chase mode (Backup plan when path cannot be found)
         self.direct_chase_mode = False
         self.stuck_counter = 0
-        self.max_stuck_count = 10
+        
+        # A recycled enemy must not pick up a search its previous life asked for
+        path_scheduler.cancel(self)
+        path_worker.cancel(self)
 
     def start_dying(self):
         """Start death animation"""
@@ -413,8 +431,7 @@ class Enemy(pygame.sprite.Sprite):
                 self.current_frame = (self.current_frame + 1) % len(self.frames)
             
             # Set the main image
-            base_image = self.frames[self.current_frame]
-            self.image = base_image if self.facing_right else pygame.transform.flip(base_image, True, False)
+            self.image = self.frame_variants[self.facing_right][self.current_frame]
 
     def update_attack_animation(self):
         """Updated attack animations (attacks in non-death states)"""
@@ -432,27 +449,75 @@ class Enemy(pygame.sprite.Sprite):
         target_grid_pos = target.get_grid_position()
         target_pos = find_nearest_walkable_position(target_grid_pos)
         
+        if constants.ENEMY_PATHFINDING == "flow_field":
+            self.update_flow_path(target_pos)
+            return
+        if constants.ENEMY_PATHFINDING == "next_hop" and next_hop_table.ready():
+            self.update_next_hop_path(target_pos)
+            return
+        
+        # Pick up a path finished by the worker or scheduler; until then the old path is followed
+        if path_worker.enabled():
+            scheduled_path = path_worker.result(self)
+        else:
+            scheduled_path = path_scheduler.result(self)
+        if scheduled_path is not None:
+            self.apply_new_path(scheduled_path)
+        
         # Only recalculate path if target moved significantly or enough time has passed
         if (self.last_target_pos is None or 
             abs(target_pos[0] - self.last_target_pos[0]) > constants.TILE_SIZE or
             abs(target_pos[1] - self.last_target_pos[1]) > constants.TILE_SIZE or
             current_time - self.path_update_timer > self.path_update_interval or
             not self.path or
+            self.path_index >= len(self.path) or
             self.stuck_counter > self.max_stuck_count):
             
             start_pos = (self.rect.x, self.rect.y)
-            self.path = a_star(start_pos, target_pos)
-            self.path_index = 0
+            if constants.ENEMY_PATHFINDING == "incremental":
+                self.apply_new_path(self.planner.plan(start_pos, target_pos))
+            elif path_worker.enabled():
+                if not path_worker.submit(self, start_pos, target_pos):
+                    return  # Request already with the worker; ask again once its result is in
+            elif path_scheduler.enabled():
+                if not path_scheduler.request(self, start_pos, target_pos):
+                    return  # Search already running; ask again once its result is in
+            else:
+                self.apply_new_path(find_path(start_pos, target_pos))
             self.last_target_pos = target_pos
             self.path_update_timer = current_time
-            
-            if self.path:
-                self.stuck_counter = 0
-                self.direct_chase_mode = False
-            else:
-                self.stuck_counter += 1
-                if self.stuck_counter > self.max_stuck_count:
-                    self.direct_chase_mode = True
+
+    def apply_new_path(self, path):
+        """Start following a freshly computed path"""
+        self.path = path
+        self.path_index = 0
+        
+        if self.path:
+            self.stuck_counter = 0
+            self.direct_chase_mode = False
+        else:
+            self.stuck_counter += 1
+            if self.stuck_counter > self.max_stuck_count:
+                self.direct_chase_mode = True
+
+    def update_flow_path(self, target_pos):
+        """Take the next step from the shared flow field once the current step is reached"""
+        # Rebuilds only when the player enters a new tile, no matter how many enemies ask
+        flow_field.update((target_pos[0] // constants.TILE_SIZE, target_pos[1] // constants.TILE_SIZE))
+        
+        if self.path_index < len(self.path) and self.stuck_counter <= self.max_stuck_count:
+            return
+        
+        self.apply_new_path(flow_field.path_from((self.rect.x, self.rect.y), max_steps=1))
+        self.last_target_pos = target_pos
+
+    def update_next_hop_path(self, target_pos):
+        """Take the next step from the level's next-hop table once the current step is reached"""
+        if self.path_index < len(self.path) and self.stuck_counter <= self.max_stuck_count:
+            return
+        
+        self.apply_new_path(next_hop_table.path_from((self.rect.x, self.rect.y), target_pos, max_steps=1))
+        self.last_target_pos = target_pos
 
     def move_along_path(self):
         """Move enemy along calculated path"""
@@ -516,15 +581,9 @@ class Enemy(pygame.sprite.Sprite):
             new_y = self.rect.y + dy
             
             # Simple wall detection
-            walls = get_maze_walls()
             test_rect = pygame.Rect(new_x, new_y, self.rect.width, self.rect.height)
-            collision = False
-            for wall in walls:
-                if test_rect.colliderect(wall):
-                    collision = True
-                    break
             
-            if not collision:
+            if not collision.collides(test_rect):
                 self.rect.x = new_x
                 self.rect.y = new_y
 
@@ -536,48 +595,91 @@ class Enemy(pygame.sprite.Sprite):
             self.attack_animation_timer = pygame.time.get_ticks()  # Reset Timer
             print(f"Enemy started attack animation, frames available: {len(self.attack_frames)}")  # For Debugging
 
-    def draw(self, surface):
-        """Draw enemy with attack effects"""
+    def draw(self, surface, pos=(0, 0)):
+        """Draw enemy with attack effects, with its top-left corner at pos"""
         # Draw the enemy first
-        surface.blit(self.image, (0, 0))
+        surface.blit(self.image, pos)
         
         # Draw attack effects (if attacking and there is an attack frame)
         if self.attacking and len(self.attack_frames) > 0:
             # Attack effects based on direction flip
-            attack_image = self.attack_frames[self.attack_current_frame]
-            flipped_attack = attack_image if self.facing_right else pygame.transform.flip(attack_image, True, False)
-            surface.blit(flipped_attack, (0, 0))
+            surface.blit(self.attack_frames.variants()[self.facing_right][self.attack_current_frame], pos)
         
         # Draws a freeze effect (if frozen and has a freeze frame)
         if self.frozen and len(self.freeze_frames) > 0:
-            freeze_image = self.freeze_frames[self.freeze_current_frame]
-            flipped_freeze = freeze_image if self.facing_right else pygame.transform.flip(freeze_image, True, False)
-            surface.blit(flipped_freeze, (0, 0))
+            surface.blit(self.freeze_frames.variants()[self.facing_right][self.freeze_current_frame], pos)
 
 class Item(pygame.sprite.Sprite):
+    """Facade over an item entity (Transform, Renderable and a Collider of the item's type)"""
     def __init__(self, image, pos, item_type):
         super().__init__()
-        self.image = image
-        self.rect = self.image.get_rect(topleft=pos)
-        self.type = item_type
+        self.rect = image.get_rect(topleft=pos)
+        self.renderable = Renderable(image)
+        self.collider = Collider(item_type, self.rect, self)
+        self.transform = Transform(self.rect)
+        self.reset(image, pos, item_type)
+
+    def reset(self, image, pos, item_type):
+        """Place the item and register its entity again (used by item_pool to recycle it)"""
+        self.rect.size = image.get_size()
+        self.rect.topleft = pos
+        self.renderable.image = image
+        self.type = self.collider.kind = item_type
+        self.entity = world.create(self.transform, self.renderable, self.collider)
+
+    @property
+    def image(self):
+        return self.renderable.image
+
+    def kill(self):
+        """Remove from all groups and destroy the entity"""
+        super().kill()
+        world.destroy(self.entity)
 
 class Key(pygame.sprite.Sprite):
+    """Facade over the key entity, animated by ecs.animation_system"""
     def __init__(self, images, pos):
         super().__init__()
+        self.rect = pygame.Rect(pos, (40, 40))
+        self.renderable = Renderable(None)
+        self.collider = Collider("key", self.rect, self)
+        self.transform = Transform(self.rect)
+        self.animation = None
+        self.blank = None
+        self.reset(images, pos)
+
+    def reset(self, images, pos):
+        """Place the key and register its entity again (used by key_pool to recycle it)"""
         self.images = images
-        self.current_frame = 0
-        self.image = self.images[self.current_frame] if images else pygame.Surface((40, 40))
-        self.rect = self.image.get_rect(topleft=pos)
-        self.animation_timer = 0
-        self.animation_speed = 200
-
-    def update(self):
-        """Update key animation"""
-        if not self.images:
-            return
-            
-        now = pygame.time.get_ticks()
-        if now - self.animation_timer > self.animation_speed:
-            self.animation_timer = now
-            self.current_frame = (self.current_frame + 1) % len(self.images)
-            self.image = self.images[self.current_frame]
\ No newline at end of file
+        if not images and self.blank is None:
+            self.blank = pygame.Surface((40, 40))
+        image = self.images[0] if images else self.blank
+        self.rect.size = image.get_size()
+        self.rect.topleft = pos
+        self.renderable.image = image
+        self.entity = world.create(self.transform, self.renderable, self.collider)
+        if images:
+            if self.animation is None or self.animation.frames is not images:
+                self.animation = Animated(images, 200)
+            self.animation.index = 0
+            self.animation.next_ms = 0
+            world.add(self.entity, self.animation)
+
+    @property
+    def image(self):
+        return self.renderable.image
+
+    def kill(self):
+        """Remove from all groups and destroy the entity"""
+        super().kill()
+        world.destroy(self.entity)
+
+# Recycled sprites (see pools.SpritePool)
+enemy_pool = SpritePool(Enemy)
+item_pool = SpritePool(Item)
+key_pool = SpritePool(Key)
+
+def pool_report():
+    """Describe the sprite pools' hits and misses, for logs"""
+    pools = (("enemies", enemy_pool), ("items", item_pool), ("keys", key_pool))
+    return "Sprite pools: " + ", ".join(f"{name} {pool.hits} hits / {pool.misses} misses" for name, pool in pools)
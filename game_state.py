@@ -3,11 +3,16 @@ import constants
 from maze import random_walkable_position, get_non_overlapping_positions
 from difficulty import difficulty_parameter_setting
 from camera import Camera
+from ecs import world
 
 def get_game_objects():
     from game_objects import Player, Item, Key
     return Player, Item, Key
 
+def get_pools():
+    from game_objects import enemy_pool, item_pool, key_pool
+    return enemy_pool, item_pool, key_pool
+
 def get_assets():
     from assets import item_images, key_images
     return item_images, key_images
@@ -27,16 +32,25 @@ class GameState:
         current_game_mode = getattr(self, 'game_mode', "random")
         current_level = getattr(self, 'current_level', 1)
         
-        # Sprite groups
-        self.player = Player((constants.TILE_SIZE, constants.TILE_SIZE))
+        # Recycle the previous run's sprites; their entities go with it
+        if hasattr(self, 'player'):
+            self.release_sprites()
+        world.clear()
+        
+        # Sprite groups (the player and the groups are reused from run to run)
+        if hasattr(self, 'player'):
+            self.player.reset((constants.TILE_SIZE, constants.TILE_SIZE))
+        else:
+            self.player = Player((constants.TILE_SIZE, constants.TILE_SIZE))
+            self.player_group = pygame.sprite.Group()
+            self.enemy_group = pygame.sprite.Group()
+            self.item_group = pygame.sprite.Group()
+            self.key_group = pygame.sprite.Group()
 
         self.player.base_speed = constants.PLAYER_SPEED
         self.player.speed = constants.PLAYER_SPEED
-
-        self.player_group = pygame.sprite.Group(self.player)
-        self.enemy_group = pygame.sprite.Group()
-        self.item_group = pygame.sprite.Group()
-        self.key_group = pygame.sprite.Group()
+        self.player_group.add(self.player)
+        self.horde = None  # horde.Horde in horde mode
         
         # Game objects
         self.key_pos = (0, 0)
@@ -66,11 +80,11 @@ class GameState:
         
         # Reset camera position
         if hasattr(self, 'camera'):
-            self.camera.update(self.player)
+            self.update_camera()
     
-    def update_camera(self):
-        """Update camera position"""
-        self.camera.update(self.player)
+    def update_camera(self, alpha=1.0):
+        """Update camera position (alpha: how far between the last two simulation steps, see renderer.draw_game_screen)"""
+        self.camera.update(self.player, alpha)
     
     def pause_game(self):
         """Pause the game and start tracking pause time"""
@@ -107,7 +121,6 @@ class GameState:
         self.spawn_items()
         
         # Create key and exit
-        Player, Item, Key = get_game_objects()
         item_images, key_images = get_assets()
         
         # Use fixed positions for level mode, random for random mode
@@ -116,8 +129,13 @@ class GameState:
             self.key_pos, self.exit_pos = get_level_positions(self.current_level)
         else:
             self.key_pos, self.exit_pos = get_non_overlapping_positions()
+        
+        if self.game_mode == "horde":
+            from horde import Horde
+            self.horde = Horde()
             
-        self.key = Key(key_images, self.key_pos)
+        enemy_pool, item_pool, key_pool = get_pools()
+        self.key = key_pool.acquire(key_images, self.key_pos)
         self.key_group.add(self.key)
         self.game_exit_rect = pygame.Rect(self.exit_pos[0], self.exit_pos[1], constants.TILE_SIZE, constants.TILE_SIZE)
         
@@ -125,15 +143,15 @@ class GameState:
     
     def spawn_boss_enemies(self):
         """Spawn 2 enemies for boss level (Level 5)"""
-        from game_objects import Enemy
+        from game_objects import enemy_pool
         
         # Spawn first enemy at a safe distance from player (not at starting position)
-        enemy1 = Enemy((5 * constants.TILE_SIZE, 5 * constants.TILE_SIZE))  # Away from player spawn
+        enemy1 = enemy_pool.acquire((5 * constants.TILE_SIZE, 5 * constants.TILE_SIZE))  # Away from player spawn
         enemy1.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy1)
         
         # Spawn second enemy at opposite corner
-        enemy2 = Enemy((39 * constants.TILE_SIZE, 39 * constants.TILE_SIZE))  # Boss level is 41x41
+        enemy2 = enemy_pool.acquire((39 * constants.TILE_SIZE, 39 * constants.TILE_SIZE))  # Boss level is 41x41
         enemy2.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy2)
         
@@ -141,20 +159,20 @@ class GameState:
     
     def spawn_final_boss_enemies(self):
         """Spawn 3 enemies for final boss level (Level 10)"""
-        from game_objects import Enemy
+        from game_objects import enemy_pool
         
         # Spawn first enemy at a safe distance from player (not at starting position)
-        enemy1 = Enemy((7 * constants.TILE_SIZE, 7 * constants.TILE_SIZE))  # Away from player spawn
+        enemy1 = enemy_pool.acquire((7 * constants.TILE_SIZE, 7 * constants.TILE_SIZE))  # Away from player spawn
         enemy1.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy1)
         
         # Spawn second enemy at opposite corner
-        enemy2 = Enemy((43 * constants.TILE_SIZE, 43 * constants.TILE_SIZE))  # Final boss level is 51x51
+        enemy2 = enemy_pool.acquire((43 * constants.TILE_SIZE, 43 * constants.TILE_SIZE))  # Final boss level is 51x51
         enemy2.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy2)
         
         # Spawn third enemy at another corner
-        enemy3 = Enemy((7 * constants.TILE_SIZE, 43 * constants.TILE_SIZE))  # Third enemy position
+        enemy3 = enemy_pool.acquire((7 * constants.TILE_SIZE, 43 * constants.TILE_SIZE))  # Third enemy position
         enemy3.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy3)
         
@@ -162,25 +180,25 @@ class GameState:
     
     def spawn_ultimate_boss_enemies(self):
         """Spawn 4 enemies for ultimate boss level (Level 15)"""
-        from game_objects import Enemy
+        from game_objects import enemy_pool
         
         # Spawn first enemy at a safe distance from player (not at starting position)
-        enemy1 = Enemy((9 * constants.TILE_SIZE, 9 * constants.TILE_SIZE))  # Away from player spawn
+        enemy1 = enemy_pool.acquire((9 * constants.TILE_SIZE, 9 * constants.TILE_SIZE))  # Away from player spawn
         enemy1.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy1)
         
         # Spawn second enemy at opposite corner
-        enemy2 = Enemy((51 * constants.TILE_SIZE, 51 * constants.TILE_SIZE))  # Ultimate boss level is 61x61
+        enemy2 = enemy_pool.acquire((51 * constants.TILE_SIZE, 51 * constants.TILE_SIZE))  # Ultimate boss level is 61x61
         enemy2.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy2)
         
         # Spawn third enemy at another corner
-        enemy3 = Enemy((9 * constants.TILE_SIZE, 51 * constants.TILE_SIZE))  # Third enemy position
+        enemy3 = enemy_pool.acquire((9 * constants.TILE_SIZE, 51 * constants.TILE_SIZE))  # Third enemy position
         enemy3.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy3)
         
         # Spawn fourth enemy at the remaining corner
-        enemy4 = Enemy((51 * constants.TILE_SIZE, 9 * constants.TILE_SIZE))  # Fourth enemy position
+        enemy4 = enemy_pool.acquire((51 * constants.TILE_SIZE, 9 * constants.TILE_SIZE))  # Fourth enemy position
         enemy4.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy4)
         
@@ -188,12 +206,12 @@ class GameState:
     
     def spawn_single_enemy(self):
         """Spawn single enemy for levels 6-9"""
-        from game_objects import Enemy
+        from game_objects import enemy_pool
         
         # Spawn enemy at a safe distance from player starting position (1,1)
         # Choose a position far from the starting point
         enemy_pos = (35 * constants.TILE_SIZE, 35 * constants.TILE_SIZE)  # Far corner for 41x41 maps
-        enemy = Enemy(enemy_pos)
+        enemy = enemy_pool.acquire(enemy_pos)
         enemy.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy)
         
@@ -201,15 +219,15 @@ class GameState:
     
     def spawn_level_11_14_enemies(self):
         """Spawn 2 enemies for levels 11-14 (51x51 maps)"""
-        from game_objects import Enemy
+        from game_objects import enemy_pool
         
         # Spawn first enemy at a safe distance from player (not at starting position)
-        enemy1 = Enemy((7 * constants.TILE_SIZE, 7 * constants.TILE_SIZE))  # Away from player spawn
+        enemy1 = enemy_pool.acquire((7 * constants.TILE_SIZE, 7 * constants.TILE_SIZE))  # Away from player spawn
         enemy1.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy1)
         
         # Spawn second enemy at opposite corner
-        enemy2 = Enemy((43 * constants.TILE_SIZE, 43 * constants.TILE_SIZE))  # For 51x51 maps
+        enemy2 = enemy_pool.acquire((43 * constants.TILE_SIZE, 43 * constants.TILE_SIZE))  # For 51x51 maps
         enemy2.speed = constants.ENEMY_SPEED + constants.HATE_VALUE
         self.enemy_group.add(enemy2)
         
@@ -217,20 +235,26 @@ class GameState:
     
     def spawn_items(self):
         """Spawn items on the map"""
-        Player, Item, Key = get_game_objects()
+        enemy_pool, item_pool, key_pool = get_pools()
         item_images, key_images = get_assets()
         
         for _ in range(constants.SPAWN_ITEMS_TIMES):
             for item_type in ['red', 'yellow', 'blue']:
                 pos = random_walkable_position(self.current_level)
-                self.item_group.add(Item(item_images[item_type], pos, item_type))
+                self.item_group.add(item_pool.acquire(item_images[item_type], pos, item_type))
+    
+    def release_sprites(self):
+        """Put every enemy, item and key back in its pool (this empties their groups)"""
+        enemy_pool, item_pool, key_pool = get_pools()
+        enemy_pool.release_all(self.enemy_group)
+        item_pool.release_all(self.item_group)
+        key_pool.release_all(self.key_group)
     
     def kill_all_sprites(self):
         """Clear all sprite groups"""
+        self.release_sprites()
         self.player_group.empty()
-        self.enemy_group.empty()
-        self.item_group.empty()
-        self.key_group.empty()
+        world.clear()
 
 game_state = GameState()
 
@@ -258,6 +282,12 @@ def initialize_game_state(regenerate_maze_flag=True, game_mode="random", level_n
     game_state.reset()
     game_state.initialize_level()
 
+    if constants.DEBUG_REPORTS:
+        from animations import memory_report
+        from game_objects import pool_report
+        print(memory_report())
+        print(pool_report())
+
 def kill_all_sprite():
     """Legacy function for compatibility"""
     game_state.kill_all_sprites()
\ No newline at end of file
@@ -0,0 +1,241 @@
+import time
+import constants
+from animations import load_frame_variants, effect_animation, animation_timing
+from maze import flow_field, FLOW_STEPS
+
+# NumPy is optional: without it the game runs as before and horde mode is hidden
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("Warning: NumPy not available, horde mode is disabled")
+
+# Pursuer states
+HORDE_CHASING = 0
+HORDE_FROZEN = 1
+
+class Horde:
+    """
+    Hundreds of pursuers held as NumPy arrays (one array per field) instead of Enemy sprites
+
+    Pursuers walk tile to tile like flow-field enemies: standing on a tile,
+    each reads its next step from the shared maze.flow_field (one reverse BFS
+    from the player, rebuilt only when the player changes tile), then moves
+    toward it by its speed per simulation step. The whole horde is stepped
+    with a few array operations per step and drawn with one Surface.blits
+    call, so the Python cost per frame barely grows with the number of pursuers.
+
+    Pursuers have no per-instance path, timers or sprite; the animation
+    frame is derived from the game time and a per-pursuer phase.
+
+    Instrumentation: steps, draws, time spent in each and pursuers drawn; see stats().
+    """
+    # Per-pursuer arrays, resized and compacted together
+    FIELDS = ("x", "y", "prev_x", "prev_y", "target_x", "target_y", "speed", "state", "frozen_until", "phase", "frame", "facing_right")
+
+    def __init__(self, capacity=None):
+        capacity = capacity or constants.HORDE_SIZE
+        self.count = 0
+        self.x = np.zeros(capacity, np.int32)  # Top-left pixel position
+        self.y = np.zeros(capacity, np.int32)
+        self.prev_x = np.zeros(capacity, np.int32)  # Position before the last step (for render interpolation)
+        self.prev_y = np.zeros(capacity, np.int32)
+        self.target_x = np.zeros(capacity, np.int32)  # Top-left of the tile being walked to
+        self.target_y = np.zeros(capacity, np.int32)
+        self.speed = np.zeros(capacity, np.int32)  # Pixels per step
+        self.state = np.zeros(capacity, np.uint8)  # HORDE_CHASING or HORDE_FROZEN
+        self.frozen_until = np.zeros(capacity, np.int64)  # Game time (ms) at which a frozen pursuer thaws
+        self.phase = np.zeros(capacity, np.int32)  # Animation offset, so the horde does not walk in step
+        self.frame = np.zeros(capacity, np.int32)  # Current animation frame index
+        self.facing_right = np.ones(capacity, np.bool_)
+
+        # Shared, read-only frames (index frame_variants with facing_right)
+        self.frame_variants = load_frame_variants("assets/img/enemy", 8, 1)
+        self.animation_speed = animation_timing("assets/img/enemy", 25)
+        self.freeze_frames = effect_animation("assets/img/hit/freeze", 62, 1)
+        self.freeze_animation_speed = animation_timing("assets/img/hit/freeze", 10)
+        self.width, self.height = self.frame_variants[True][0].get_size()
+        self.now = 0
+
+        # Instrumentation
+        self.steps = 0
+        self.step_ms = 0.0
+        self.draws = 0
+        self.draw_ms = 0.0
+        self.drawn = 0
+
+    def grow(self, capacity):
+        """Make room for at least capacity pursuers"""
+        if capacity <= len(self.x):
+            return
+        capacity = max(capacity, 2 * len(self.x))
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, tiles, speed=None):
+        """
+        Add pursuers standing on the given tiles
+        Args:
+            tiles: Sequence of (col, row) tiles (or an N x 2 array)
+            speed: Pixels per step (defaults to HORDE_SPEED)
+        """
+        tiles = np.asarray(tiles, np.int32).reshape(-1, 2)
+        first, last = self.count, self.count + len(tiles)
+        self.grow(last)
+        self.x[first:last] = self.prev_x[first:last] = self.target_x[first:last] = tiles[:, 0] * constants.TILE_SIZE
+        self.y[first:last] = self.prev_y[first:last] = self.target_y[first:last] = tiles[:, 1] * constants.TILE_SIZE
+        self.speed[first:last] = constants.HORDE_SPEED if speed is None else speed
+        self.state[first:last] = HORDE_CHASING
+        self.frozen_until[first:last] = 0
+        self.phase[first:last] = np.random.randint(0, len(self.frame_variants[True]), len(tiles))
+        self.frame[first:last] = 0
+        self.facing_right[first:last] = True
+        self.count = last
+
+    def spawn_away(self, amount, target_tile):
+        """
+        Add pursuers on random reachable tiles at least HORDE_SPAWN_DISTANCE steps from target_tile
+        Returns:
+            Number of pursuers added (fewer when the maze has no tile far enough away)
+        """
+        flow_field.update(target_tile)
+        if flow_field.grid is None or amount <= 0:
+            return 0
+        distances = np.frombuffer(flow_field.distances, np.intc)
+        candidates = np.flatnonzero(distances >= constants.HORDE_SPAWN_DISTANCE)
+        if len(candidates) == 0:
+            return 0
+        cells = np.random.choice(candidates, amount)
+        width = flow_field.grid.width
+        self.spawn(np.stack([cells % width, cells // width], axis=1))
+        return amount
+
+    def update(self, target_tile, now):
+        """
+        Move every pursuer one simulation step toward target_tile
+        Args:
+            target_tile: (col, row) tile the horde chases (the player's)
+            now: Game time in milliseconds (drives thawing and animation)
+        """
+        started = time.perf_counter()
+        self.now = now
+        flow_field.update(target_tile)
+        count = self.count
+        if count == 0 or flow_field.grid is None:
+            return
+
+        x, y = self.x[:count], self.y[:count]
+        self.prev_x[:count] = x
+        self.prev_y[:count] = y
+        target_x, target_y = self.target_x[:count], self.target_y[:count]
+        state = self.state[:count]
+        tile_size = constants.TILE_SIZE
+
+        # Thaw pursuers whose freeze ran out
+        state[(state == HORDE_FROZEN) & (self.frozen_until[:count] <= now)] = HORDE_CHASING
+        moving = state == HORDE_CHASING
+
+        # Pursuers standing on their waypoint read the next one from the flow field
+        # (direction code 0 means they are on the player's tile or cut off from it)
+        arrived = np.flatnonzero(moving & (x == target_x) & (y == target_y))
+        if len(arrived):
+            directions = np.frombuffer(flow_field.directions, np.uint8)
+            codes = directions[(y[arrived] // tile_size) * flow_field.grid.width + x[arrived] // tile_size]
+            target_x[arrived] += STEP_COLS[codes] * tile_size
+            target_y[arrived] += STEP_ROWS[codes] * tile_size
+
+        # Step toward the waypoint by at most speed on each axis, landing exactly on it
+        speed = self.speed[:count] * moving
+        dx = np.clip(target_x - x, -speed, speed)
+        dy = np.clip(target_y - y, -speed, speed)
+        x += dx
+        y += dy
+
+        facing_right = self.facing_right[:count]
+        facing_right[dx > 0] = True
+        facing_right[dx < 0] = False
+        self.frame[:count] = (now // self.animation_speed + self.phase[:count]) % len(self.frame_variants[True])
+
+        self.steps += 1
+        self.step_ms += (time.perf_counter() - started) * 1000
+
+    def collide(self, rect):
+        """Get the indices of the pursuers overlapping rect"""
+        count = self.count
+        x, y = self.x[:count], self.y[:count]
+        return np.flatnonzero((x < rect.right) & (x + self.width > rect.left) &
+                              (y < rect.bottom) & (y + self.height > rect.top))
+
+    def freeze(self, indices, until):
+        """Stop the given pursuers until game time until (ms)"""
+        self.state[indices] = HORDE_FROZEN
+        self.frozen_until[indices] = until
+
+    def kill(self, indices):
+        """Remove the given pursuers, keeping the others in order"""
+        keep = np.ones(self.count, np.bool_)
+        keep[indices] = False
+        remaining = int(keep.sum())
+        for name in self.FIELDS:
+            values = getattr(self, name)
+            values[:remaining] = values[:self.count][keep]
+        self.count = remaining
+
+    def clear(self):
+        """Remove every pursuer"""
+        self.count = 0
+
+    def draw(self, surface, camera, alpha=1.0):
+        """
+        Draw the pursuers inside the camera's view (and their freeze effect) with one blits call
+        alpha places each pursuer that far along its last step (see renderer.draw_game_screen)
+        """
+        started = time.perf_counter()
+        count = self.count
+        x, y = self.x[:count], self.y[:count]
+        if alpha < 1.0:
+            prev_x, prev_y = self.prev_x[:count], self.prev_y[:count]
+            x = prev_x + np.rint((x - prev_x) * alpha).astype(np.int32)
+            y = prev_y + np.rint((y - prev_y) * alpha).astype(np.int32)
+        screen_x = x - camera.x
+        screen_y = y - camera.y
+        visible = np.flatnonzero((screen_x > -self.width) & (screen_x < surface.get_width()) &
+                                 (screen_y > -self.height) & (screen_y < surface.get_height()))
+        positions = list(zip(screen_x[visible].tolist(), screen_y[visible].tolist()))
+        variants = self.frame_variants
+        sequence = [(variants[facing][frame], position) for facing, frame, position in
+                    zip(self.facing_right[visible].tolist(), self.frame[visible].tolist(), positions)]
+
+        # Frozen pursuers get the freeze effect on top, all on the same animation frame
+        frozen = np.flatnonzero(self.state[visible] == HORDE_FROZEN)
+        if len(frozen):
+            freeze_variants = self.freeze_frames.variants()
+            freeze_frame = (self.now // self.freeze_animation_speed) % len(self.freeze_frames)
+            sequence.extend((freeze_variants[facing][freeze_frame], positions[index]) for facing, index in
+                            zip(self.facing_right[visible][frozen].tolist(), frozen.tolist()))
+
+        surface.blits(sequence, doreturn=False)
+        self.drawn = len(visible)
+        self.draws += 1
+        self.draw_ms += (time.perf_counter() - started) * 1000
+
+    def stats(self):
+        """Get horde counters"""
+        return {
+            "pursuers": self.count,
+            "frozen": int((self.state[:self.count] == HORDE_FROZEN).sum()),
+            "drawn": self.drawn,
+            "steps": self.steps,
+            "avg_step_ms": self.step_ms / self.steps if self.steps else 0.0,
+            "draws": self.draws,
+            "avg_draw_ms": self.draw_ms / self.draws if self.draws else 0.0,
+        }
+
+if NUMPY_AVAILABLE:
+    # Tile offsets of each flow field direction code (FLOW_STEPS as arrays; code 0 stays put)
+    STEP_COLS = np.array([0] + [step[0] for step in FLOW_STEPS[1:]], np.int32)
+    STEP_ROWS = np.array([0] + [step[1] for step in FLOW_STEPS[1:]], np.int32)
@@ -1,4 +1,5 @@
 import pygame
+import multiprocessing
 import constants
 
 from config import load_config
@@ -54,4 +55,5 @@ def main():
 
 	
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # Needed by the pathfinding worker in frozen builds
     main()
\ No newline at end of file
@@ -1,7 +1,12 @@
 import pygame
 import random
 import heapq
+import hashlib
+import os
 import sys
+import time
+from array import array
+from collections import deque
 
 # Try to import PIL, but handle the case where it's not available
 try:
@@ -813,6 +818,156 @@ LEVEL_DATA = {
     }
 }
 
+# === Maze Grid ===
+
+# Neighbor mask bits used by MazeGrid.neighbor_masks()
+NEIGHBOR_NORTH = 1
+NEIGHBOR_EAST = 2
+NEIGHBOR_SOUTH = 4
+NEIGHBOR_WEST = 8
+
+# Byte translation tables (tile value -> mask value)
+_WALKABLE_TABLE = bytes([1] + [0] * 255)
+_WALL_TABLE = bytes([0, 1] + [0] * 254)
+
+class MazeGrid:
+    """
+    Compact maze storage: one byte per tile (0=path, 1=wall) in a row-major bytearray
+
+    Tiles are addressed as cells[row * width + col]. Width and height are cached,
+    so lookups never call len() on nested lists.
+
+    Indexing the grid by row (grid[row][col]) returns a writable memoryview of that
+    row, so code written for the old list-of-lists MAZE keeps working unchanged.
+    Use to_rows() when a real list-of-lists copy is needed.
+    """
+    __slots__ = ("width", "height", "cells", "_view")
+
+    def __init__(self, width, height, cells=None):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(cells) if cells is not None else bytearray([1]) * (width * height)
+        if len(self.cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(self.cells)}")
+        self._view = memoryview(self.cells)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a grid from a list-of-lists maze"""
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        cells = bytearray()
+        for line in rows:
+            cells.extend(line)
+        return cls(width, height, cells)
+
+    def to_rows(self):
+        """Get a list-of-lists copy of the grid"""
+        width = self.width
+        return [list(self.cells[row * width:(row + 1) * width]) for row in range(self.height)]
+
+    # --- Compatibility view (MAZE[row][col], len(MAZE), for row in MAZE) ---
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.height:
+            raise IndexError("maze row out of range")
+        start = row * self.width
+        return self._view[start:start + self.width]
+
+    def __iter__(self):
+        for row in range(self.height):
+            yield self[row]
+
+    # --- Tile access ---
+
+    def index(self, col, row):
+        """Get the flat cell index of a tile"""
+        return row * self.width + col
+
+    def in_bounds(self, col, row):
+        """Check if a tile is inside the grid"""
+        return 0 <= col < self.width and 0 <= row < self.height
+
+    def get(self, col, row):
+        """Get the value of a tile"""
+        return self.cells[row * self.width + col]
+
+    def set(self, col, row, value):
+        """Set the value of a tile"""
+        self.cells[row * self.width + col] = value
+
+    def is_walkable(self, col, row):
+        """Check if a tile is inside the grid and walkable"""
+        return 0 <= col < self.width and 0 <= row < self.height and self.cells[row * self.width + col] == 0
+
+    def is_wall(self, col, row):
+        """Check if a tile is inside the grid and a wall"""
+        return 0 <= col < self.width and 0 <= row < self.height and self.cells[row * self.width + col] == 1
+
+    # --- Whole-grid helpers ---
+
+    def adjacency(self):
+        """
+        Get the walkable orthogonal neighbors of every tile
+        Returns:
+            List indexed by cell id; each entry is a tuple of neighbor cell ids in N, E, S, W order
+            (empty for walls)
+        """
+        width, height = self.width, self.height
+        cells = self.cells
+        adjacency = []
+        for index, tile in enumerate(cells):
+            if tile != 0:
+                adjacency.append(())
+                continue
+            col = index % width
+            neighbors = []
+            if index >= width and cells[index - width] == 0:
+                neighbors.append(index - width)
+            if col < width - 1 and cells[index + 1] == 0:
+                neighbors.append(index + 1)
+            if index < (height - 1) * width and cells[index + width] == 0:
+                neighbors.append(index + width)
+            if col > 0 and cells[index - 1] == 0:
+                neighbors.append(index - 1)
+            adjacency.append(tuple(neighbors))
+        return adjacency
+
+    def walkable_count(self):
+        """Count walkable tiles"""
+        return self.cells.count(0)
+
+    def wall_mask(self):
+        """Get a bytes mask with 1 for every wall tile and 0 elsewhere"""
+        return self.cells.translate(_WALL_TABLE)
+
+    def walkable_mask(self):
+        """Get a bytes mask with 1 for every walkable tile and 0 elsewhere"""
+        return self.cells.translate(_WALKABLE_TABLE)
+
+    def neighbor_masks(self):
+        """
+        Get a bytearray with one NEIGHBOR_* bit set per walkable orthogonal neighbor of each tile
+        Returns:
+            bytearray of width * height masks, indexed like cells
+        """
+        width, height = self.width, self.height
+        walkable = self.walkable_mask()
+        empty_row = bytes(width)
+        masks = bytearray()
+        for row in range(height):
+            start = row * width
+            line = walkable[start:start + width]
+            north = walkable[start - width:start] if row > 0 else empty_row
+            south = walkable[start + width:start + 2 * width] if row < height - 1 else empty_row
+            east = line[1:] + b"\x00"
+            west = b"\x00" + line[:-1]
+            masks.extend(bytes(n | (e << 1) | (s << 2) | (w << 3) for n, e, s, w in zip(north, east, south, west)))
+        return masks
+
 # === Maze Map ===
 
 def generate_maze(width, height, loop_chance=0.1):
@@ -945,22 +1100,23 @@ def generate_maze(width, height, loop_chance=0.1):
     return maze
 
 # Global maze variables
-MAZE = None
+MAZE = None  # MazeGrid of the current maze
 walls = []
+wall_spans = []  # (col, row, cols, rows) tile span of each rect in walls
+
+# Merge neighbouring wall tiles into larger rects in update_walls()
+MERGE_WALLS = True
 
 def regenerate_maze():
     """Generate a new random maze and update all related data"""
     global MAZE, walls
-    MAZE = generate_maze(MAZE_COLS, MAZE_ROWS)
+    MAZE = MazeGrid.from_rows(generate_maze(MAZE_COLS, MAZE_ROWS))
     update_walls()
+    prepare_pathfinding()
     
     # Debug: Count walkable tiles
-    walkable_count = 0
-    total_tiles = MAZE_COLS * MAZE_ROWS
-    for row in MAZE:
-        for tile in row:
-            if tile == 0:
-                walkable_count += 1
+    walkable_count = MAZE.walkable_count()
+    total_tiles = MAZE.width * MAZE.height
     
     print(f"Maze generated: {walkable_count}/{total_tiles} walkable tiles ({walkable_count/total_tiles*100:.1f}%)")
     
@@ -991,14 +1147,43 @@ def load_level_maze(level_number):
     }
     
     if level_number in level_mazes:
-        MAZE = [row[:] for row in level_mazes[level_number]]  # Deep copy
+        MAZE = MazeGrid.from_rows(level_mazes[level_number])  # Copies the level data
         update_walls()
+        prepare_pathfinding(level_number)
         print(f"Loaded level {level_number} maze")
         return MAZE
     else:
         print(f"Level {level_number} not found, generating random maze")
         return regenerate_maze()
 
+def prepare_pathfinding(level_number=None):
+    """Run the per-maze precomputation needed by the selected enemy pathfinder (level_number is None for random mazes)"""
+    if MAZE is None:
+        return
+    path_scheduler.clear()
+    if constants.PATHFINDING_WORKER:
+        # The worker builds its own copy; building here as well would stall the level load for nothing.
+        # Should the worker die, hpa and alt build on first use and next_hop uses NEXT_HOP_FALLBACK.
+        from path_worker import path_worker
+        next_hop_table.clear()
+        path_worker.publish_maze(MAZE, level_number)
+        return
+    if constants.ENEMY_PATHFINDING == "hpa":
+        hpa_pathfinder.build(MAZE)
+        stats = hpa_pathfinder.stats()
+        print(f"HPA* graph built: {stats['clusters']} clusters, {stats['abstract_nodes']} nodes in {stats['build_ms']:.1f} ms")
+    elif constants.ENEMY_PATHFINDING == "alt":
+        alt_engine.prepare(MAZE)
+        stats = alt_engine.landmarks.stats()
+        print(f"ALT landmarks built: {stats['landmarks']} landmarks, {stats['memory_bytes'] / 1024:.1f} KB in {stats['build_ms']:.1f} ms")
+    elif constants.ENEMY_PATHFINDING == "next_hop":
+        if level_number is None:
+            next_hop_table.clear()  # Random mazes use NEXT_HOP_FALLBACK
+        elif next_hop_table.prepare(MAZE, level_number):
+            stats = next_hop_table.stats()
+            source = "loaded" if stats["from_cache"] else "built"
+            print(f"Next-hop table {source}: {stats['walkable_tiles']} tiles, {stats['memory_bytes'] / 1048576:.2f} MB in {stats['build_ms']:.1f} ms")
+
 def get_level_positions(level_number):
     """Get fixed key and exit positions for a specific level"""
     if level_number in LEVEL_DATA:
@@ -1008,15 +1193,80 @@ def get_level_positions(level_number):
         # Fallback to random positions for undefined levels
         return get_non_overlapping_positions()
 
-def update_walls():
-    """Update walls list based on current MAZE"""
-    global walls
+def merge_wall_tiles(grid):
+    """
+    Greedily fold runs of wall tiles into as few axis-aligned rectangles as possible
+    Each rectangle grows right along its row first, then down while the whole span is still wall.
+    Args:
+        grid: MazeGrid to scan
+    Returns:
+        List of (col, row, cols, rows) tile spans covering every wall tile exactly once
+    """
+    width, height = grid.width, grid.height
+    cells = grid.cells
+    used = bytearray(width * height)
+    spans = []
+
+    for row in range(height):
+        row_start = row * width
+        for col in range(width):
+            index = row_start + col
+            if cells[index] != 1 or used[index]:
+                continue
+
+            # Extend to the right
+            span_cols = 1
+            while (col + span_cols < width and cells[index + span_cols] == 1
+                   and not used[index + span_cols]):
+                span_cols += 1
+
+            # Extend downwards while the whole row span is unused wall
+            span_rows = 1
+            while row + span_rows < height:
+                below = index + span_rows * width
+                if (cells[below:below + span_cols].count(1) != span_cols
+                        or used[below:below + span_cols].count(0) != span_cols):
+                    break
+                span_rows += 1
+
+            for r in range(span_rows):
+                start = index + r * width
+                used[start:start + span_cols] = b"\x01" * span_cols
+            spans.append((col, row, span_cols, span_rows))
+
+    return spans
+
+def update_walls(merge=None):
+    """
+    Update walls list based on current MAZE
+    Args:
+        merge: Fold neighbouring wall tiles into larger rects (defaults to MERGE_WALLS)
+    """
+    global walls, wall_spans
     if MAZE is None:
         walls = []
+        wall_spans = []
         return
-    walls = [pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-             for row, line in enumerate(MAZE)
-             for col, tile in enumerate(line) if tile == 1]
+    if merge is None:
+        merge = MERGE_WALLS
+
+    width = MAZE.width
+    if merge:
+        wall_spans = merge_wall_tiles(MAZE)
+    else:
+        wall_spans = [(index % width, index // width, 1, 1)
+                      for index, tile in enumerate(MAZE.cells) if tile == 1]
+    walls = [pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, cols * TILE_SIZE, rows * TILE_SIZE)
+             for col, row, cols, rows in wall_spans]
+
+    if merge and constants.DEBUG_REPORTS:
+        wall_tiles = MAZE.cells.count(1)
+        print(f"Walls merged: {wall_tiles} tiles -> {len(walls)} rects")
+
+def get_wall_tiles(wall_index):
+    """Get the (col, row) tiles covered by walls[wall_index]"""
+    col, row, cols, rows = wall_spans[wall_index]
+    return [(c, r) for r in range(row, row + rows) for c in range(col, col + cols)]
 
 def load_gif_frames(filename):
     """Load GIF frames, with fallback for environments without PIL"""
@@ -1047,80 +1297,1541 @@ def is_path(x, y):
     """Check if position is walkable"""
     if MAZE is None:
         return False
-    col, row = x // TILE_SIZE, y // TILE_SIZE
-    return 0 <= row < len(MAZE) and 0 <= col < len(MAZE[0]) and MAZE[row][col] == 0
+    return MAZE.is_walkable(x // TILE_SIZE, y // TILE_SIZE)
 
 def heuristic(a, b):
     """Manhattan distance heuristic for A* algorithm"""
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-def a_star(start, goal):
+class AStarEngine:
+    """
+    Allocation-light A* over the current MazeGrid
+
+    Nodes are flat cell ids (row * width + col). Cost, parent and bookkeeping
+    arrays are allocated once per maze and reused between searches; a
+    generation counter marks which entries belong to the current search, so
+    nothing has to be cleared. Each tile is expanded at most once (closed set).
+
+    Ties on f-cost are broken by the smaller heuristic (the node closer to the
+    goal) and then by the smaller node id, so identical queries always return
+    identical paths.
+
+    Instrumentation: queries, nodes_expanded (total), last_nodes_expanded and
+    total_time_us; see stats().
+    """
+    MAX_GENERATION = 0xFFFFFFFF
+
+    def __init__(self):
+        self.grid = None
+        self.cells = b""  # Snapshot of its tiles, in case the grid is edited in place
+        self.adjacency = []
+        self.g_cost = array('i')
+        self.parent = array('i')
+        self.seen = array('I')
+        self.closed = array('I')
+        self.generation = 0
+
+        # Instrumentation
+        self.queries = 0
+        self.nodes_expanded = 0
+        self.last_nodes_expanded = 0
+        self.total_time_us = 0.0
+
+    def changed(self, grid):
+        """Check whether grid is a different maze, or its tiles changed, since the last prepare()"""
+        return grid is not self.grid or self.cells != grid.cells
+
+    def prepare(self, grid):
+        """(Re)allocate the search arrays when the maze changes"""
+        if not self.changed(grid):
+            return
+        size = grid.width * grid.height
+        self.grid = grid
+        self.cells = bytes(grid.cells)
+        self.adjacency = grid.adjacency()
+        self.g_cost = array('i', [0]) * size
+        self.parent = array('i', [-1]) * size
+        self.seen = array('I', [0]) * size
+        self.closed = array('I', [0]) * size
+        self.generation = 0
+
+    def next_generation(self):
+        """Start a new search without clearing the arrays"""
+        if self.generation >= self.MAX_GENERATION:
+            size = len(self.seen)
+            self.seen = array('I', [0]) * size
+            self.closed = array('I', [0]) * size
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+    def search(self, start, goal, max_expansions=None):
+        """
+        Find a path between two pixel positions
+        Args:
+            start: (x, y) in pixel coordinates
+            goal: (x, y) in pixel coordinates
+            max_expansions: Optional early exit. When the budget runs out, the path to the
+                expanded tile closest to the goal is returned instead.
+        Returns:
+            List of (x, y) positions in pixel coordinates (start tile excluded)
+        """
+        started = time.perf_counter()
+        path = self._search(start, goal, max_expansions)
+        self.queries += 1
+        self.total_time_us += (time.perf_counter() - started) * 1000000
+        return path
+
+    def _search(self, start, goal, max_expansions):
+        return run_search_steps(self.search_steps(start, goal, max_expansions))
+
+    def search_steps(self, start, goal, max_expansions=None, slice_expansions=0):
+        """
+        Resumable form of search(): a generator that pauses after every slice_expansions
+        expanded tiles (never when 0) and returns the path when done (see run_search_steps).
+        The engine's arrays belong to the paused search until it finishes, so an engine
+        must not run another search while one is paused.
+        """
+        grid = MAZE
+        if grid is None:
+            return []
+
+        start_col, start_row = start[0] // TILE_SIZE, start[1] // TILE_SIZE
+        goal_col, goal_row = goal[0] // TILE_SIZE, goal[1] // TILE_SIZE
+        if not grid.is_walkable(start_col, start_row) or not grid.is_walkable(goal_col, goal_row):
+            self.last_nodes_expanded = 0
+            return []
+
+        self.prepare(grid)
+        generation = self.next_generation()
+        width = grid.width
+        adjacency = self.adjacency
+        g_cost, parent, seen, closed = self.g_cost, self.parent, self.seen, self.closed
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        start_id = start_row * width + start_col
+        goal_id = goal_row * width + goal_col
+        g_cost[start_id] = 0
+        parent[start_id] = -1
+        seen[start_id] = generation
+
+        estimate = self.heuristic_for(start_id, goal_id, width)
+        if estimate is None:
+            start_h = abs(start_col - goal_col) + abs(start_row - goal_row)
+        else:
+            start_h = estimate(start_id)
+        frontier = [(start_h, start_h, start_id)]
+        best_id, best_h = start_id, start_h
+        expanded = 0
+        end_id = -1
+
+        while frontier:
+            _, h, current = heappop(frontier)
+            if closed[current] == generation:
+                continue  # Stale duplicate entry
+            closed[current] = generation
+
+            if current == goal_id:
+                end_id = goal_id
+                break
+
+            expanded += 1
+            if h < best_h:
+                best_id, best_h = current, h
+            if max_expansions is not None and expanded >= max_expansions:
+                end_id = best_id
+                break
+            if slice_expansions and expanded % slice_expansions == 0:
+                yield expanded
+
+            next_cost = g_cost[current] + 1
+            for neighbor in adjacency[current]:
+                if closed[neighbor] == generation:
+                    continue
+                if seen[neighbor] != generation or next_cost < g_cost[neighbor]:
+                    seen[neighbor] = generation
+                    g_cost[neighbor] = next_cost
+                    parent[neighbor] = current
+                    if estimate is None:
+                        neighbor_h = abs(neighbor % width - goal_col) + abs(neighbor // width - goal_row)
+                    else:
+                        neighbor_h = estimate(neighbor)
+                    heappush(frontier, (next_cost + neighbor_h, neighbor_h, neighbor))
+
+        self.last_nodes_expanded = expanded
+        self.nodes_expanded += expanded
+
+        # Reconstruct path
+        path = []
+        current = end_id
+        while current != -1 and current != start_id:
+            path.append(((current % width) * TILE_SIZE, (current // width) * TILE_SIZE))
+            current = parent[current]
+        path.reverse()
+        return path
+
+    def heuristic_for(self, start_id, goal_id, width):
+        """Get the heuristic for one query as a function of a cell id, or None for the inline Manhattan distance"""
+        return None
+
+    def stats(self):
+        """Get search counters"""
+        return {
+            "queries": self.queries,
+            "nodes_expanded": self.nodes_expanded,
+            "last_nodes_expanded": self.last_nodes_expanded,
+            "us_per_query": self.total_time_us / self.queries if self.queries else 0.0,
+        }
+
+    def reset_stats(self):
+        """Reset search counters"""
+        self.queries = 0
+        self.nodes_expanded = 0
+        self.last_nodes_expanded = 0
+        self.total_time_us = 0.0
+
+def run_search_steps(steps):
+    """Run a search_steps() generator to the end and return its path"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+# A* engine shared by all a_star() callers
+a_star_engine = AStarEngine()
+
+def a_star(start, goal, max_expansions=None):
     """
     A* pathfinding algorithm
     Args:
         start: (x, y) in pixel coordinates
         goal: (x, y) in pixel coordinates
+        max_expansions: Optional limit on expanded tiles (returns a partial path when reached)
     Returns:
         List of (x, y) positions in pixel coordinates representing the path
     """
-    # Check if maze is available
-    if MAZE is None:
-        return []
-        
-    # Convert pixel coordinates to tile coordinates
-    start_tile = (start[0] // TILE_SIZE, start[1] // TILE_SIZE)
-    goal_tile = (goal[0] // TILE_SIZE, goal[1] // TILE_SIZE)
-    
-    # Bounds checking
-    if (start_tile[1] < 0 or start_tile[1] >= len(MAZE) or 
-        start_tile[0] < 0 or start_tile[0] >= len(MAZE[0]) or
-        goal_tile[1] < 0 or goal_tile[1] >= len(MAZE) or 
-        goal_tile[0] < 0 or goal_tile[0] >= len(MAZE[0])):
-        return []
-    
-    # Check if start or goal is a wall
-    if (MAZE[start_tile[1]][start_tile[0]] == 1 or 
-        MAZE[goal_tile[1]][goal_tile[0]] == 1):
-        return []
-    
-    frontier = [(0, start_tile)]
-    came_from = {start_tile: None}
-    cost_so_far = {start_tile: 0}
+    return a_star_engine.search(start, goal, max_expansions)
 
-    while frontier:
-        _, current = heapq.heappop(frontier)
-        
-        if current == goal_tile:
-            break
+# === Jump Point Search ===
 
-        # Check all 4 directions
-        for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-            neighbor = (current[0] + dx, current[1] + dy)
-            
-            # Bounds checking
-            if (0 <= neighbor[1] < len(MAZE) and 
-                0 <= neighbor[0] < len(MAZE[0]) and 
-                MAZE[neighbor[1]][neighbor[0]] == 0):
-                
-                new_cost = cost_so_far[current] + 1
-                
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    cost_so_far[neighbor] = new_cost
-                    priority = new_cost + heuristic(goal_tile, neighbor)
-                    heapq.heappush(frontier, (priority, neighbor))
-                    came_from[neighbor] = current
-
-    # Reconstruct path
-    path = []
-    if goal_tile in came_from:
-        current = goal_tile
-        while current != start_tile:
-            # Convert back to pixel coordinates
-            path.append((current[0] * TILE_SIZE, current[1] * TILE_SIZE))
-            current = came_from[current]
+class JumpPointSearch(AStarEngine):
+    """
+    Jump Point Search for the 4-connected, uniform-cost tile grid
+
+    Runs A* over jump points only: from each point the search "jumps" in a
+    straight line and stops only where the path could turn (a forced
+    neighbor), at the goal, or - for vertical jumps - where a horizontal jump
+    would find such a point. Straight corridors and open areas are then
+    crossed without pushing every tile onto the heap.
+
+    The goal-independent part of every jump is precomputed once per maze
+    (JPS+ style tables), so a jump is a couple of array lookups instead of a
+    tile-by-tile scan; only "does this jump pass the goal" is checked per query.
+
+    Results use the same pixel format as a_star: jump points are expanded
+    back into one waypoint per tile. Shares AStarEngine's arrays, generation
+    counter and instrumentation (nodes_expanded counts expanded jump points).
+    """
+    def prepare(self, grid):
+        """(Re)allocate the search arrays and jump tables when the maze changes"""
+        if not self.changed(grid):
+            return
+        super().prepare(grid)
+        self.build_jump_tables(grid)
+
+    def build_jump_tables(self, grid):
+        """Precompute straight runs and the next jump point in each direction for every tile"""
+        width, height = grid.width, grid.height
+        cells = grid.cells
+        size = width * height
+
+        def walkable(col, row):
+            return 0 <= col < width and 0 <= row < height and cells[row * width + col] == 0
+
+        # Ids of straight walkable runs (-1 for walls): same run id means a straight, unblocked line
+        h_run = array('i', [-1]) * size
+        v_run = array('i', [-1]) * size
+        run = -1
+        for row in range(height):
+            for col in range(width):
+                if walkable(col, row):
+                    if not walkable(col - 1, row):
+                        run += 1
+                    h_run[row * width + col] = run
+        for col in range(width):
+            for row in range(height):
+                if walkable(col, row):
+                    if not walkable(col, row - 1):
+                        run += 1
+                    v_run[row * width + col] = run
+
+        # Next horizontal jump point (forced neighbor) starting at each tile, -1 if a wall comes first
+        h_jump_east = array('i', [-1]) * size
+        h_jump_west = array('i', [-1]) * size
+        for row in range(height):
+            for dx, table, cols in ((1, h_jump_east, range(width - 1, -1, -1)), (-1, h_jump_west, range(width))):
+                next_point = -1
+                for col in cols:
+                    index = row * width + col
+                    if not walkable(col, row):
+                        next_point = -1
+                        continue
+                    if (walkable(col, row - 1) and not walkable(col - dx, row - 1) or
+                            walkable(col, row + 1) and not walkable(col - dx, row + 1)):
+                        next_point = index
+                    table[index] = next_point
+
+        # Next vertical jump point: a forced neighbor, or a tile from which a horizontal jump succeeds
+        v_jump_south = array('i', [-1]) * size
+        v_jump_north = array('i', [-1]) * size
+        for col in range(width):
+            for dy, table, rows in ((1, v_jump_south, range(height - 1, -1, -1)), (-1, v_jump_north, range(height))):
+                next_point = -1
+                for row in rows:
+                    index = row * width + col
+                    if not walkable(col, row):
+                        next_point = -1
+                        continue
+                    if (walkable(col - 1, row) and not walkable(col - 1, row - dy) or
+                            walkable(col + 1, row) and not walkable(col + 1, row - dy) or
+                            col + 1 < width and h_jump_east[index + 1] >= 0 or
+                            col > 0 and h_jump_west[index - 1] >= 0):
+                        next_point = index
+                    table[index] = next_point
+
+        self.h_run, self.v_run = h_run, v_run
+        self.h_jump = {1: h_jump_east, -1: h_jump_west}
+        self.v_jump = {1: v_jump_south, -1: v_jump_north}
+
+    def _search(self, start, goal, max_expansions):
+        grid = MAZE
+        if grid is None:
+            return []
+
+        start_col, start_row = start[0] // TILE_SIZE, start[1] // TILE_SIZE
+        goal_col, goal_row = goal[0] // TILE_SIZE, goal[1] // TILE_SIZE
+        if not grid.is_walkable(start_col, start_row) or not grid.is_walkable(goal_col, goal_row):
+            self.last_nodes_expanded = 0
+            return []
+
+        self.prepare(grid)
+        generation = self.next_generation()
+        width, height = grid.width, grid.height
+        g_cost, parent, seen, closed = self.g_cost, self.parent, self.seen, self.closed
+        h_run, v_run, h_jump, v_jump = self.h_run, self.v_run, self.h_jump, self.v_jump
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        start_id = start_row * width + start_col
+        goal_id = goal_row * width + goal_col
+        goal_h_run = h_run[goal_id]
+
+        def jump_horizontal(index, dx):
+            """Jump from index (inclusive) along its row"""
+            run = h_run[index]
+            if run < 0:
+                return -1
+            jump_point = h_jump[dx][index]
+            # Stop at the goal if it comes before the precomputed jump point
+            if run == goal_h_run and (goal_id - index) * dx >= 0 and (jump_point < 0 or (jump_point - goal_id) * dx > 0):
+                return goal_id
+            return jump_point
+
+        def jump_vertical(index, dy):
+            """Jump from index (inclusive) along its column"""
+            run = v_run[index]
+            if run < 0:
+                return -1
+            jump_point = v_jump[dy][index]
+            # The tile of this column in the goal's row stops the jump if the goal is in
+            # line with it, either vertically (it is the goal) or horizontally
+            candidate = goal_row * width + index % width
+            if (v_run[candidate] == run and (candidate - index) * dy >= 0 and
+                    (candidate == goal_id or h_run[candidate] == goal_h_run) and
+                    (jump_point < 0 or (jump_point - candidate) * dy > 0)):
+                return candidate
+            return jump_point
+
+        g_cost[start_id] = 0
+        parent[start_id] = -1
+        seen[start_id] = generation
+
+        start_h = abs(start_col - goal_col) + abs(start_row - goal_row)
+        frontier = [(start_h, start_h, start_id)]
+        best_id, best_h = start_id, start_h
+        expanded = 0
+        end_id = -1
+
+        while frontier:
+            _, h, current = heappop(frontier)
+            if closed[current] == generation:
+                continue
+            closed[current] = generation
+
+            if current == goal_id:
+                end_id = goal_id
+                break
+
+            expanded += 1
+            if h < best_h:
+                best_id, best_h = current, h
+            if max_expansions is not None and expanded >= max_expansions:
+                end_id = best_id
+                break
+
+            col, row = current % width, current // width
+            previous = parent[current]
+            if previous == -1:
+                directions = ((0, -1), (1, 0), (0, 1), (-1, 0))
+            else:
+                # Prune: keep going the same way, or turn
+                dx = (col > previous % width) - (col < previous % width)
+                dy = (row > previous // width) - (row < previous // width)
+                directions = ((0, -1), (0, 1), (dx, 0)) if dx else ((-1, 0), (1, 0), (0, dy))
+
+            current_cost = g_cost[current]
+            for dx, dy in directions:
+                if dx:
+                    if not 0 <= col + dx < width:
+                        continue
+                    jump_point = jump_horizontal(current + dx, dx)
+                else:
+                    if not 0 <= row + dy < height:
+                        continue
+                    jump_point = jump_vertical(current + dy * width, dy)
+                if jump_point < 0 or closed[jump_point] == generation:
+                    continue
+                jump_col, jump_row = jump_point % width, jump_point // width
+                next_cost = current_cost + abs(jump_col - col) + abs(jump_row - row)
+                if seen[jump_point] != generation or next_cost < g_cost[jump_point]:
+                    seen[jump_point] = generation
+                    g_cost[jump_point] = next_cost
+                    parent[jump_point] = current
+                    jump_h = abs(jump_col - goal_col) + abs(jump_row - goal_row)
+                    heappush(frontier, (next_cost + jump_h, jump_h, jump_point))
+
+        self.last_nodes_expanded = expanded
+        self.nodes_expanded += expanded
+
+        # Expand jump points back into per-tile waypoints
+        path = []
+        current = end_id
+        while current != -1 and current != start_id:
+            previous = parent[current]
+            col, row = current % width, current // width
+            previous_col, previous_row = previous % width, previous // width
+            step_col = (previous_col > col) - (previous_col < col)
+            step_row = (previous_row > row) - (previous_row < row)
+            while (col, row) != (previous_col, previous_row):
+                path.append((col * TILE_SIZE, row * TILE_SIZE))
+                col += step_col
+                row += step_row
+            current = previous
         path.reverse()
-    
-    return path
+        return path
+
+# JPS engine shared by all jump_point_search() callers
+jps_engine = JumpPointSearch()
+
+def jump_point_search(start, goal, max_expansions=None):
+    """
+    Jump Point Search pathfinding (drop-in alternative to a_star)
+    Args:
+        start: (x, y) in pixel coordinates
+        goal: (x, y) in pixel coordinates
+        max_expansions: Optional limit on expanded jump points (returns a partial path when reached)
+    Returns:
+        List of (x, y) positions in pixel coordinates, one per tile
+    """
+    return jps_engine.search(start, goal, max_expansions)
+
+# === Hierarchical Pathfinding (HPA*) ===
+
+class HierarchicalPathfinder:
+    """
+    HPA*: plans long routes on a small abstract graph instead of the full maze
+
+    When a maze is loaded (see prepare_pathfinding) the grid is split into
+    square clusters. Every open stretch of the border between two clusters
+    becomes an entrance with one or two transition tiles, and the distances
+    between transition tiles inside each cluster are precomputed with a BFS
+    limited to that cluster.
+
+    A query connects the start and goal to the transition tiles of their own
+    clusters, runs A* on the abstract graph and then refines only the first
+    segment(s) of that route back into tiles. The enemy replans when it has
+    walked them, so the per-query cost depends mostly on the number of
+    clusters, not on the number of tiles.
+    """
+    def __init__(self, cluster_size=None):
+        self.cluster_size = cluster_size or constants.HPA_CLUSTER_SIZE
+        self.grid = None
+        self.cells = b""  # Snapshot of its tiles, in case the grid is edited in place
+        self.adjacency = []
+        self.clusters_x = 0
+        self.clusters_y = 0
+        self.cluster_nodes = {}  # cluster id -> transition cell ids in that cluster
+        self.edges = {}  # transition cell id -> list of (cell id, cost)
+        self.build_time_ms = 0.0
+
+        # Instrumentation (since the last build)
+        self.queries = 0
+        self.nodes_expanded = 0
+
+    def cluster_of(self, index):
+        """Get the cluster id of a cell id"""
+        width = self.grid.width
+        return (index // width // self.cluster_size) * self.clusters_x + (index % width) // self.cluster_size
+
+    def cluster_bounds(self, cluster):
+        """Get the (first_col, first_row, end_col, end_row) tile bounds of a cluster (end exclusive)"""
+        size = self.cluster_size
+        first_col = (cluster % self.clusters_x) * size
+        first_row = (cluster // self.clusters_x) * size
+        return first_col, first_row, min(first_col + size, self.grid.width), min(first_row + size, self.grid.height)
+
+    def add_transition(self, a, b):
+        """Connect two tiles on either side of a cluster border"""
+        for node in (a, b):
+            if node not in self.edges:
+                self.edges[node] = []
+                self.cluster_nodes.setdefault(self.cluster_of(node), []).append(node)
+        self.edges[a].append((b, 1))
+        self.edges[b].append((a, 1))
+
+    def add_entrances(self, pairs):
+        """Turn a run of open (inside, outside) tile pairs along a border into transitions"""
+        if not pairs:
+            return
+        # Short entrances get one transition in the middle, long ones one at each end
+        if len(pairs) < 6:
+            self.add_transition(*pairs[len(pairs) // 2])
+        else:
+            self.add_transition(*pairs[0])
+            self.add_transition(*pairs[-1])
+
+    def build(self, grid):
+        """Precompute clusters, entrances and intra-cluster distances for a maze"""
+        started = time.perf_counter()
+        width, height = grid.width, grid.height
+        cells = grid.cells
+        size = self.cluster_size
+        self.grid = grid
+        self.cells = bytes(cells)
+        self.adjacency = grid.adjacency()
+        self.clusters_x = (width + size - 1) // size
+        self.clusters_y = (height + size - 1) // size
+        self.cluster_nodes = {}
+        self.edges = {}
+
+        # Entrances on vertical borders (between horizontally adjacent clusters)
+        for border_col in range(size, width, size):
+            for first_row in range(0, height, size):
+                pairs = []
+                for row in range(first_row, min(first_row + size, height)):
+                    left = row * width + border_col - 1
+                    if cells[left] == 0 and cells[left + 1] == 0:
+                        pairs.append((left, left + 1))
+                    else:
+                        self.add_entrances(pairs)
+                        pairs = []
+                self.add_entrances(pairs)
+
+        # Entrances on horizontal borders (between vertically adjacent clusters)
+        for border_row in range(size, height, size):
+            for first_col in range(0, width, size):
+                pairs = []
+                for col in range(first_col, min(first_col + size, width)):
+                    top = (border_row - 1) * width + col
+                    if cells[top] == 0 and cells[top + width] == 0:
+                        pairs.append((top, top + width))
+                    else:
+                        self.add_entrances(pairs)
+                        pairs = []
+                self.add_entrances(pairs)
+
+        # Intra-cluster distances between transitions
+        for cluster, nodes in self.cluster_nodes.items():
+            for node in nodes:
+                distances, _ = self.local_search(node, cluster)
+                for other in nodes:
+                    if other != node and other in distances:
+                        self.edges[node].append((other, distances[other]))
+
+        self.build_time_ms = (time.perf_counter() - started) * 1000
+        self.queries = 0
+        self.nodes_expanded = 0
+
+    def local_search(self, source, cluster, target=None):
+        """
+        BFS from source that never leaves the given cluster
+        Returns:
+            (distances, parents) dicts keyed by cell id
+        """
+        first_col, first_row, end_col, end_row = self.cluster_bounds(cluster)
+        width = self.grid.width
+        adjacency = self.adjacency
+        distances = {source: 0}
+        parents = {source: -1}
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            if current == target:
+                break
+            next_distance = distances[current] + 1
+            for neighbor in adjacency[current]:
+                if neighbor in distances:
+                    continue
+                col, row = neighbor % width, neighbor // width
+                if first_col <= col < end_col and first_row <= row < end_row:
+                    distances[neighbor] = next_distance
+                    parents[neighbor] = current
+                    queue.append(neighbor)
+        self.nodes_expanded += len(distances)
+        return distances, parents
+
+    def refine(self, a, b):
+        """Expand one abstract edge into the cell ids after a, up to and including b"""
+        if b in self.adjacency[a]:
+            return [b]
+        _, parents = self.local_search(a, self.cluster_of(a), b)
+        segment = []
+        current = b
+        while current != a:
+            segment.append(current)
+            current = parents[current]
+        segment.reverse()
+        return segment
+
+    def search(self, start, goal, full_path=False):
+        """
+        Find a path between two pixel positions through the abstract graph
+        Args:
+            start: (x, y) in pixel coordinates
+            goal: (x, y) in pixel coordinates
+            full_path: Refine the whole route instead of only the next segment(s)
+        Returns:
+            List of (x, y) positions in pixel coordinates. Unless full_path is set this
+            covers about one cluster of the route; plan again when it has been walked.
+        """
+        grid = MAZE
+        if grid is None:
+            return []
+        start_col, start_row = start[0] // TILE_SIZE, start[1] // TILE_SIZE
+        goal_col, goal_row = goal[0] // TILE_SIZE, goal[1] // TILE_SIZE
+        if not grid.is_walkable(start_col, start_row) or not grid.is_walkable(goal_col, goal_row):
+            return []
+        if grid is not self.grid or self.cells != grid.cells:
+            self.build(grid)
+        self.queries += 1
+
+        width = grid.width
+        start_id = start_row * width + start_col
+        goal_id = goal_row * width + goal_col
+        if start_id == goal_id:
+            return []
+        start_cluster, goal_cluster = self.cluster_of(start_id), self.cluster_of(goal_id)
+
+        # Connect start and goal to the transitions of their clusters
+        start_distances, _ = self.local_search(start_id, start_cluster)
+        start_links = [(node, start_distances[node]) for node in self.cluster_nodes.get(start_cluster, [])
+                       if node in start_distances and node != start_id]
+        if start_cluster == goal_cluster and goal_id in start_distances:
+            start_links.append((goal_id, start_distances[goal_id]))
+        goal_distances, _ = self.local_search(goal_id, goal_cluster)
+        goal_links = {node: goal_distances[node] for node in self.cluster_nodes.get(goal_cluster, [])
+                      if node in goal_distances}
+
+        route = self.abstract_search(start_id, goal_id, start_links, goal_links)
+        if not route:
+            return []
+
+        # Refine the route into tiles, stopping early unless the full path was asked for
+        path = []
+        for a, b in zip(route, route[1:]):
+            path.extend(self.refine(a, b))
+            if not full_path and len(path) >= self.cluster_size:
+                break
+        return [((index % width) * TILE_SIZE, (index // width) * TILE_SIZE) for index in path]
+
+    def abstract_search(self, start_id, goal_id, start_links, goal_links):
+        """A* over transition tiles; returns the list of cell ids from start to goal"""
+        width = self.grid.width
+        goal_col, goal_row = goal_id % width, goal_id // width
+        edges = self.edges
+        g_cost = {start_id: 0}
+        parents = {start_id: -1}
+        closed = set()
+        frontier = [(0, 0, start_id)]
+        while frontier:
+            _, _, current = heapq.heappop(frontier)
+            if current in closed:
+                continue
+            closed.add(current)
+            if current == goal_id:
+                break
+            self.nodes_expanded += 1
+
+            neighbors = edges.get(current, [])
+            if current == start_id:
+                neighbors = start_links + neighbors
+            if current in goal_links:
+                neighbors = neighbors + [(goal_id, goal_links[current])]
+            for neighbor, cost in neighbors:
+                next_cost = g_cost[current] + cost
+                if neighbor not in g_cost or next_cost < g_cost[neighbor]:
+                    g_cost[neighbor] = next_cost
+                    parents[neighbor] = current
+                    h = abs(neighbor % width - goal_col) + abs(neighbor // width - goal_row)
+                    heapq.heappush(frontier, (next_cost + h, h, neighbor))
+
+        if goal_id not in closed:
+            return []
+        route = []
+        current = goal_id
+        while current != -1:
+            route.append(current)
+            current = parents[current]
+        route.reverse()
+        return route
+
+    def stats(self):
+        """Get abstract graph size and search counters"""
+        return {
+            "clusters": self.clusters_x * self.clusters_y,
+            "abstract_nodes": len(self.edges),
+            "abstract_edges": sum(len(links) for links in self.edges.values()),
+            "build_ms": self.build_time_ms,
+            "queries": self.queries,
+            "nodes_expanded": self.nodes_expanded,
+        }
+
+# HPA* graph for the current maze
+hpa_pathfinder = HierarchicalPathfinder()
+
+def hpa_star(start, goal):
+    """HPA* pathfinding: returns the next stretch (about one cluster) of the route, in a_star's format"""
+    return hpa_pathfinder.search(start, goal)
+
+# === Landmark (ALT) Heuristic ===
+
+class LandmarkTable:
+    """
+    BFS distances from a few well-spread landmark tiles, for the ALT heuristic
+
+    For any landmark L the triangle inequality gives
+    dist(n, goal) >= |dist(L, goal) - dist(L, n)|, so the largest of these
+    bounds (and Manhattan) is still admissible, and much tighter than Manhattan
+    alone when the corridors wind away from the straight line. Landmarks are
+    chosen by farthest-point selection, so they end up in the maze's corners
+    and dead ends. Each landmark keeps one uint16 distance per tile.
+    """
+    UNREACHABLE = 0xFFFF
+
+    def __init__(self):
+        self.grid = None
+        self.cells = b""  # Snapshot of its tiles, in case the grid is edited in place
+        self.landmarks = []  # Cell ids
+        self.distances = []  # One array('H') per landmark
+        self.build_ms = 0.0
+
+    def build(self, grid, count=None):
+        """Choose landmarks on grid and compute their distance tables"""
+        started = time.perf_counter()
+        count = constants.ALT_LANDMARKS if count is None else count
+        self.grid = grid
+        self.cells = bytes(grid.cells)
+        self.landmarks = []
+        self.distances = []
+
+        walkable = [index for index, tile in enumerate(grid.cells) if tile == 0]
+        if walkable:
+            adjacency = grid.adjacency()
+            # Seed from the first open tile; its farthest tile is the first landmark
+            seed = self.bfs(adjacency, walkable[0])
+            landmark = max(walkable, key=lambda index: (seed[index] != self.UNREACHABLE, seed[index]))
+            nearest = None
+            while len(self.landmarks) < min(count, len(walkable)):
+                table = self.bfs(adjacency, landmark)
+                self.landmarks.append(landmark)
+                self.distances.append(table)
+                # Next landmark: the reachable tile farthest from every landmark chosen so far
+                if nearest is None:
+                    nearest = array('H', table)
+                else:
+                    for index in walkable:
+                        if table[index] < nearest[index]:
+                            nearest[index] = table[index]
+                landmark = max(walkable, key=lambda index: nearest[index] if nearest[index] != self.UNREACHABLE else -1)
+                if nearest[landmark] in (0, self.UNREACHABLE):
+                    break  # Every reachable tile is already a landmark
+
+        self.build_ms = (time.perf_counter() - started) * 1000
+
+    def bfs(self, adjacency, source):
+        """Get the step distance from source to every tile (UNREACHABLE for walls and other regions)"""
+        distances = array('H', [self.UNREACHABLE]) * len(adjacency)
+        distances[source] = 0
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            next_distance = distances[current] + 1
+            for neighbor in adjacency[current]:
+                if distances[neighbor] == self.UNREACHABLE:
+                    distances[neighbor] = next_distance
+                    queue.append(neighbor)
+        return distances
+
+    def estimator(self, start_id, goal_id, width, active=None):
+        """
+        Build the ALT heuristic toward one goal
+        Args:
+            start_id: Cell id the search starts from (used to pick the most useful landmarks)
+            goal_id: Cell id of the goal
+            width: Maze width in tiles
+            active: Number of landmarks to consult per node (defaults to constants.ALT_ACTIVE_LANDMARKS)
+        Returns:
+            Function mapping a cell id to a lower bound on its distance to the goal
+        """
+        active = constants.ALT_ACTIVE_LANDMARKS if active is None else active
+        # Only the landmarks giving the tightest bound between start and goal are consulted per node
+        ranked = sorted(self.distances, key=lambda table: abs(table[goal_id] - table[start_id]), reverse=True)
+        pairs = [(table[goal_id], table) for table in ranked[:active]]
+        goal_col, goal_row = goal_id % width, goal_id // width
+
+        def estimate(node):
+            best = abs(node % width - goal_col) + abs(node // width - goal_row)
+            for goal_distance, table in pairs:
+                bound = goal_distance - table[node]
+                if bound < 0:
+                    bound = -bound
+                if bound > best:
+                    best = bound
+            return best
+        return estimate
+
+    def memory_bytes(self):
+        """Get the size of the distance tables in bytes"""
+        return sum(table.itemsize * len(table) for table in self.distances)
+
+    def stats(self):
+        """Get table statistics"""
+        return {
+            "landmarks": len(self.landmarks),
+            "memory_bytes": self.memory_bytes(),
+            "build_ms": self.build_ms,
+        }
+
+class ALTSearch(AStarEngine):
+    """A* with landmark (ALT) lower bounds instead of plain Manhattan distance"""
+    def __init__(self):
+        super().__init__()
+        self.landmarks = LandmarkTable()
+
+    def prepare(self, grid):
+        """(Re)allocate the search arrays and landmark tables when the maze changes"""
+        super().prepare(grid)
+        if self.landmarks.grid is not grid or self.landmarks.cells != grid.cells:
+            self.landmarks.build(grid)
+
+    def heuristic_for(self, start_id, goal_id, width):
+        """Use the landmark bound toward goal_id"""
+        return self.landmarks.estimator(start_id, goal_id, width)
+
+# ALT engine; landmarks are computed at level load when "alt" is selected, otherwise on first use
+alt_engine = ALTSearch()
+
+def alt_star(start, goal, max_expansions=None):
+    """A* with landmark heuristics, in a_star's format"""
+    return alt_engine.search(start, goal, max_expansions)
+
+# === Next-Hop Table ===
+
+class NextHopTable:
+    """
+    All-pairs "next tile toward the goal" table for a fixed level maze
+
+    Walkable tiles are numbered 0..N-1 and, for every goal, one reverse BFS
+    stores the next tile of a shortest path from every other tile, giving an
+    N * N uint16 table. Once built, navigation is one array lookup per step
+    with no search at all. The hand-made levels never change at runtime, so
+    tables are built once per level and saved to NEXT_HOP_CACHE_DIR; random
+    mazes do not get a table and use NEXT_HOP_FALLBACK instead.
+    """
+    NONE = 0xFFFF
+    MAGIC = b"NHOP"
+    VERSION = 1
+
+    def __init__(self):
+        self.grid = None
+        self.cells = b""  # Snapshot of its tiles, in case the grid is edited in place
+        self.level = None
+        self.size = 0  # Number of walkable tiles
+        self.node_of = array('H')  # Cell id -> walkable index (NONE for walls)
+        self.cell_of = array('I')  # Walkable index -> cell id (cell ids can pass 65535 on large mazes)
+        self.hops = array('H')  # hops[goal * size + node] = next walkable index from node toward goal
+        self.adjacency = []  # Neighbor walkable indices, only needed while building
+        self.build_ms = 0.0
+        self.loaded_from_cache = False
+
+    def ready(self):
+        """Check whether the table belongs to the current maze, tile for tile (otherwise NEXT_HOP_FALLBACK is used)"""
+        return self.grid is not None and self.grid is MAZE and self.cells == MAZE.cells
+
+    def clear(self):
+        """Drop the table (e.g. when a random maze replaces the level)"""
+        self.__init__()
+
+    def prepare(self, grid, level):
+        """
+        Get the table for a level maze, from the cache file if possible
+        Args:
+            grid: MazeGrid of the level
+            level: Level number (used in the cache file name)
+        Returns:
+            True if a table is available, False if the maze is too large for NEXT_HOP_MAX_BYTES
+        """
+        started = time.perf_counter()
+        self.clear()
+        size = grid.walkable_count()
+        if size >= self.NONE or size * size * 2 > constants.NEXT_HOP_MAX_BYTES:
+            print(f"Next-hop table skipped: {size} walkable tiles exceed the memory budget")
+            return False
+
+        self.index_tiles(grid)
+        path = self.cache_path(grid, level)
+        self.loaded_from_cache = self.load(path)
+        if not self.loaded_from_cache:
+            self.build()
+            self.save(path)
+
+        self.grid = grid
+        self.cells = bytes(grid.cells)
+        self.level = level
+        self.build_ms = (time.perf_counter() - started) * 1000
+        return True
+
+    def index_tiles(self, grid):
+        """Number the walkable tiles of grid"""
+        self.node_of = array('H', [self.NONE]) * (grid.width * grid.height)
+        self.cell_of = array('I')
+        for cell, tile in enumerate(grid.cells):
+            if tile == 0:
+                self.node_of[cell] = len(self.cell_of)
+                self.cell_of.append(cell)
+        self.size = len(self.cell_of)
+        self.adjacency = [tuple(self.node_of[neighbor] for neighbor in neighbors)
+                          for cell, neighbors in enumerate(grid.adjacency()) if grid.cells[cell] == 0]
+
+    def build(self):
+        """Run one reverse BFS per goal tile"""
+        size, adjacency, none = self.size, self.adjacency, self.NONE
+        empty = array('H', [none]) * size
+        hops = array('H')
+        for goal in range(size):
+            # row[node] is the next node toward goal; the goal points at itself to mark it visited
+            row = array('H', empty)
+            row[goal] = goal
+            queue = deque([goal])
+            popleft, append = queue.popleft, queue.append
+            while queue:
+                current = popleft()
+                for neighbor in adjacency[current]:
+                    if row[neighbor] == none:
+                        row[neighbor] = current
+                        append(neighbor)
+            hops.extend(row)
+        self.hops = hops
+
+    def cache_path(self, grid, level):
+        """Get the cache file name; it includes a hash of the maze so edited levels are rebuilt"""
+        digest = hashlib.sha1(bytes(grid.cells) + grid.width.to_bytes(4, "little")).hexdigest()[:12]
+        return os.path.join(constants.NEXT_HOP_CACHE_DIR, f"next_hop_level{level}_{digest}.bin")
+
+    def load(self, path):
+        """Read the table from a cache file. Returns True on success."""
+        try:
+            with open(path, "rb") as f:
+                header = f.read(10)
+                if header[:4] != self.MAGIC or header[4:6] != self.VERSION.to_bytes(2, "little"):
+                    return False
+                if int.from_bytes(header[6:10], "little") != self.size:
+                    return False
+                hops = array('H')
+                hops.fromfile(f, self.size * self.size)
+        except (OSError, EOFError):
+            return False
+        if sys.byteorder == "big":
+            hops.byteswap()
+        self.hops = hops
+        return True
+
+    def save(self, path):
+        """Write the table to a cache file (failures only cost a rebuild next time)"""
+        hops = self.hops
+        if sys.byteorder == "big":
+            hops = array('H', hops)
+            hops.byteswap()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(self.MAGIC + self.VERSION.to_bytes(2, "little") + self.size.to_bytes(4, "little"))
+                hops.tofile(f)
+        except OSError as e:
+            print(f"Could not write next-hop cache {path}: {e}")
+
+    def next_tile(self, col, row, goal_col, goal_row):
+        """Get the next tile from (col, row) toward the goal, or None if at the goal or unreachable"""
+        grid = self.grid
+        if not grid.in_bounds(col, row) or not grid.in_bounds(goal_col, goal_row):
+            return None
+        node = self.node_of[row * grid.width + col]
+        goal = self.node_of[goal_row * grid.width + goal_col]
+        if node == self.NONE or goal == self.NONE or node == goal:
+            return None
+        step = self.hops[goal * self.size + node]
+        if step == self.NONE:
+            return None
+        cell = self.cell_of[step]
+        return (cell % grid.width, cell // grid.width)
+
+    def path_from(self, start, goal, max_steps=None):
+        """
+        Follow the table between two pixel positions
+        Args:
+            start: (x, y) in pixel coordinates
+            goal: (x, y) in pixel coordinates
+            max_steps: Stop after this many steps (None for the whole path)
+        Returns:
+            List of (x, y) positions in pixel coordinates, in the same format as a_star
+        """
+        path = []
+        tile = (start[0] // TILE_SIZE, start[1] // TILE_SIZE)
+        goal_col, goal_row = goal[0] // TILE_SIZE, goal[1] // TILE_SIZE
+        while max_steps is None or len(path) < max_steps:
+            tile = self.next_tile(tile[0], tile[1], goal_col, goal_row)
+            if tile is None:
+                break
+            path.append((tile[0] * TILE_SIZE, tile[1] * TILE_SIZE))
+        return path
+
+    def memory_bytes(self):
+        """Get the size of the table and index arrays in bytes"""
+        return sum(table.itemsize * len(table) for table in (self.hops, self.node_of, self.cell_of))
+
+    def stats(self):
+        """Get table statistics"""
+        return {
+            "level": self.level,
+            "walkable_tiles": self.size,
+            "memory_bytes": self.memory_bytes(),
+            "build_ms": self.build_ms,
+            "from_cache": self.loaded_from_cache,
+        }
+
+# Next-hop table of the current level maze (built only for level mazes when "next_hop" is selected)
+next_hop_table = NextHopTable()
+
+def next_hop_path(start, goal):
+    """Read the whole route from the next-hop table, or use NEXT_HOP_FALLBACK when the maze has no table"""
+    if next_hop_table.ready():
+        return next_hop_table.path_from(start, goal)
+    return PATHFINDERS.get(constants.NEXT_HOP_FALLBACK, a_star)(start, goal)
+
+# Pathfinders selectable by name (see constants.ENEMY_PATHFINDING)
+PATHFINDERS = {
+    "a_star": a_star,
+    "jps": jump_point_search,
+    "hpa": hpa_star,
+    "alt": alt_star,
+    "next_hop": next_hop_path,
+}
+
+def find_path(start, goal, method=None):
+    """Find a path with the named pathfinder (defaults to constants.ENEMY_PATHFINDING, falls back to a_star)"""
+    pathfinder = PATHFINDERS.get(method or constants.ENEMY_PATHFINDING, a_star)
+    return pathfinder(start, goal)
+
+# === Path Request Scheduler ===
+
+class PathRequest:
+    """One queued path search"""
+    __slots__ = ("owner", "start", "goal", "method", "steps", "queued_at", "worked_us")
+
+    def __init__(self, owner, start, goal, method):
+        self.owner = owner
+        self.start = start
+        self.goal = goal
+        self.method = method
+        self.steps = None  # search_steps() generator once started
+        self.queued_at = time.perf_counter()
+        self.worked_us = 0.0
+
+class PathScheduler:
+    """
+    Spreads enemy path searches over frames under a per-frame time budget
+
+    Callers queue a request and keep following their old path; run() is called
+    once per frame and works through the queue (oldest first) until the budget
+    is spent. Searches are resumable and pause every
+    PATHFINDING_SLICE_EXPANSIONS tiles, so no frame goes far over the budget.
+    Finished paths wait in results until their owner collects them.
+
+    Limitation: only "a_star" and "alt" have resumable engines. "jps" and
+    "hpa" requests are searched with the "a_star" engine while the scheduler
+    is on (same path lengths, but none of their speedups), and "next_hop"
+    uses NEXT_HOP_FALLBACK's engine unless the level's table is ready (a
+    table walk, not a search, so it runs at once).
+
+    Instrumentation: queue depth, completed requests, frames that overran the
+    budget (by more than 10%) and the worst frame time; see stats().
+    """
+    def __init__(self):
+        self.queue = deque()
+        self.requests = {}  # owner -> queued or running PathRequest
+        self.results = {}  # owner -> finished path
+        # Private engines, so a paused search never shares arrays with a direct a_star() call
+        self.engines = {"a_star": AStarEngine(), "alt": ALTSearch()}
+        self.engines["alt"].landmarks = alt_engine.landmarks
+
+        # Instrumentation
+        self.frames = 0
+        self.completed = 0
+        self.overruns = 0
+        self.last_frame_us = 0.0
+        self.max_frame_us = 0.0
+        self.max_wait_ms = 0.0
+
+    def enabled(self):
+        """Check whether searches go through the scheduler (PATHFINDING_BUDGET_US > 0)"""
+        return constants.PATHFINDING_BUDGET_US > 0
+
+    def request(self, owner, start, goal, method=None):
+        """
+        Queue a path search for owner (e.g. an Enemy)
+        Args:
+            owner: Key the result is stored under; one request per owner
+            start: (x, y) in pixel coordinates
+            goal: (x, y) in pixel coordinates
+            method: Pathfinder name (defaults to constants.ENEMY_PATHFINDING)
+        Returns:
+            False if owner's search is already running (its result will arrive first), otherwise True
+        """
+        method = method or constants.ENEMY_PATHFINDING
+        pending = self.requests.get(owner)
+        if pending is not None:
+            if pending.steps is not None:
+                return False
+            # Not started yet: just retarget it, keeping its place in the queue
+            pending.start, pending.goal, pending.method = start, goal, method
+            return True
+        pending = PathRequest(owner, start, goal, method)
+        self.requests[owner] = pending
+        self.queue.append(pending)
+        return True
+
+    def pending(self, owner):
+        """Check whether owner has a queued or running search"""
+        return owner in self.requests
+
+    def result(self, owner):
+        """Collect owner's finished path, or None if it is not ready"""
+        return self.results.pop(owner, None)
+
+    def cancel(self, owner):
+        """Forget owner's request and any unclaimed result"""
+        pending = self.requests.pop(owner, None)
+        if pending is not None:
+            self.queue.remove(pending)
+        self.results.pop(owner, None)
+
+    def clear(self):
+        """Drop every request (the maze changed)"""
+        self.queue.clear()
+        self.requests.clear()
+        self.results.clear()
+
+    def run(self, budget_us=None):
+        """
+        Work on queued searches for up to budget_us microseconds (defaults to constants.PATHFINDING_BUDGET_US)
+        Returns:
+            Number of searches finished this frame
+        """
+        budget_us = constants.PATHFINDING_BUDGET_US if budget_us is None else budget_us
+        started = time.perf_counter()
+        deadline = started + budget_us / 1000000
+        finished = 0
+
+        while self.queue:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            current = self.queue[0]
+            path = self.step(current, deadline)
+            current.worked_us += (time.perf_counter() - now) * 1000000
+            if path is None:
+                continue  # Paused at the deadline; resumes next frame
+
+            self.queue.popleft()
+            del self.requests[current.owner]
+            self.results[current.owner] = path
+            self.completed += 1
+            finished += 1
+            self.max_wait_ms = max(self.max_wait_ms, (time.perf_counter() - current.queued_at) * 1000)
+
+        self.frames += 1
+        self.last_frame_us = (time.perf_counter() - started) * 1000000
+        self.max_frame_us = max(self.max_frame_us, self.last_frame_us)
+        # Searches pause between slices, so small overshoots are expected; count the ones over a tenth
+        if self.last_frame_us > budget_us * 1.1:
+            self.overruns += 1
+        return finished
+
+    def step(self, current, deadline):
+        """Advance one request until it finishes (returns its path) or the deadline passes (returns None)"""
+        method = current.method
+        if method == "next_hop":
+            if next_hop_table.ready():
+                return next_hop_table.path_from(current.start, current.goal)
+            method = constants.NEXT_HOP_FALLBACK
+        # Pathfinders without a resumable engine use a_star's, so no search runs past the deadline
+        engine = self.engines.get(method, self.engines["a_star"])
+
+        if current.steps is None:
+            current.steps = engine.search_steps(current.start, current.goal,
+                                                slice_expansions=constants.PATHFINDING_SLICE_EXPANSIONS)
+        while True:
+            try:
+                next(current.steps)
+            except StopIteration as done:
+                return done.value
+            if time.perf_counter() >= deadline:
+                return None
+
+    def stats(self):
+        """Get scheduler counters"""
+        return {
+            "queue_depth": len(self.queue),
+            "completed": self.completed,
+            "frames": self.frames,
+            "overruns": self.overruns,
+            "last_frame_us": self.last_frame_us,
+            "max_frame_us": self.max_frame_us,
+            "max_wait_ms": self.max_wait_ms,
+        }
+
+    def reset_stats(self):
+        """Reset scheduler counters"""
+        self.frames = 0
+        self.completed = 0
+        self.overruns = 0
+        self.last_frame_us = 0.0
+        self.max_frame_us = 0.0
+        self.max_wait_ms = 0.0
+
+# Scheduler for enemy path searches (run once per frame by the game loop)
+path_scheduler = PathScheduler()
+
+# === Incremental Planner ===
+
+class IncrementalPlanner:
+    """
+    Per-chaser incremental planner for a moving goal (LPA* with a fixed root)
+
+    The search tree is rooted at the tile where the chaser started planning and
+    is kept between calls. Because the maze is static, every expanded tile
+    keeps its exact distance from the root, so when the goal moves the search
+    simply continues from the existing open list instead of starting over.
+    Open-list keys are made valid for the new goal lazily with D* Lite's key
+    modifier (km): stale keys are lower bounds and are re-queued when popped.
+
+    The chaser walks along the root-to-goal path, so its path is the suffix of
+    that path after its current tile. Only when the chaser is no longer on the
+    optimal root-to-goal path is the tree re-rooted at the chaser (a fresh search).
+
+    Counters: nodes_expanded, plans, reroots.
+    """
+    def __init__(self):
+        self.grid = None
+        self.cells = b""  # Snapshot of its tiles, in case the grid is edited in place
+        self.adjacency = []
+        self.g_cost = array('i')
+        self.parent = array('i')
+        self.closed = bytearray()
+        self.frontier = []
+        self.root = -1
+        self.goal = -1
+        self.km = 0
+
+        # Instrumentation
+        self.nodes_expanded = 0
+        self.plans = 0
+        self.reroots = 0
+
+    def prepare(self, grid):
+        """(Re)allocate per-maze arrays and drop the search tree when the maze changes (or its tiles do)"""
+        if grid is self.grid and self.cells == grid.cells:
+            return
+        size = grid.width * grid.height
+        self.grid = grid
+        self.cells = bytes(grid.cells)
+        self.adjacency = grid.adjacency()
+        self.g_cost = array('i', [-1]) * size
+        self.parent = array('i', [-1]) * size
+        self.closed = bytearray(size)
+        self.frontier = []
+        self.root = -1
+        self.goal = -1
+
+    def distance(self, a, b):
+        """Manhattan distance between two cell ids"""
+        width = self.grid.width
+        return abs(a % width - b % width) + abs(a // width - b // width)
+
+    def reset(self, root, goal):
+        """Start a new search tree at root"""
+        size = len(self.g_cost)
+        self.g_cost = array('i', [-1]) * size
+        self.parent = array('i', [-1]) * size
+        self.closed = bytearray(size)
+        self.root = root
+        self.goal = goal
+        self.km = 0
+        self.g_cost[root] = 0
+        h = self.distance(root, goal)
+        self.frontier = [(h, h, root)]
+        self.reroots += 1
+
+    def compute_shortest_path(self):
+        """Expand tiles until the goal is closed or the open list is empty"""
+        goal = self.goal
+        if self.closed[goal]:
+            return
+
+        width = self.grid.width
+        goal_col, goal_row = goal % width, goal // width
+        km = self.km
+        adjacency = self.adjacency
+        g_cost, parent, closed, frontier = self.g_cost, self.parent, self.closed, self.frontier
+        heappush, heappop = heapq.heappush, heapq.heappop
+        expanded = 0
+
+        while frontier:
+            key, _, current = heappop(frontier)
+            if closed[current]:
+                continue  # Stale duplicate entry
+
+            g = g_cost[current]
+            h = abs(current % width - goal_col) + abs(current // width - goal_row)
+            if key < g + h + km:
+                # Key was computed for an older goal: re-queue with the current one
+                heappush(frontier, (g + h + km, h, current))
+                continue
+
+            # The goal is expanded too, so the tree can keep growing past it when the goal moves on
+            closed[current] = 1
+            expanded += 1
+            next_cost = g + 1
+            for neighbor in adjacency[current]:
+                if closed[neighbor]:
+                    continue
+                if g_cost[neighbor] < 0 or next_cost < g_cost[neighbor]:
+                    g_cost[neighbor] = next_cost
+                    parent[neighbor] = current
+                    neighbor_h = abs(neighbor % width - goal_col) + abs(neighbor // width - goal_row)
+                    heappush(frontier, (next_cost + neighbor_h + km, neighbor_h, neighbor))
+
+            if current == goal:
+                break
+
+        self.nodes_expanded += expanded
+
+    def path_from(self, start):
+        """Get the tree path from start to the goal as cell ids, or None if start is not on it"""
+        if not self.closed[self.goal]:
+            return None
+        path = []
+        current = self.goal
+        while current != start:
+            if current == -1:
+                return None
+            path.append(current)
+            current = self.parent[current]
+        path.reverse()
+        return path
+
+    def plan(self, start, goal):
+        """
+        Find a path between two pixel positions, reusing the previous search
+        Args:
+            start: (x, y) in pixel coordinates (the chaser)
+            goal: (x, y) in pixel coordinates (the target)
+        Returns:
+            List of (x, y) positions in pixel coordinates, in the same format as a_star
+        """
+        grid = MAZE
+        if grid is None:
+            return []
+        start_col, start_row = start[0] // TILE_SIZE, start[1] // TILE_SIZE
+        goal_col, goal_row = goal[0] // TILE_SIZE, goal[1] // TILE_SIZE
+        if not grid.is_walkable(start_col, start_row) or not grid.is_walkable(goal_col, goal_row):
+            return []
+
+        self.prepare(grid)
+        self.plans += 1
+        width = grid.width
+        start_id = start_row * width + start_col
+        goal_id = goal_row * width + goal_col
+
+        if self.root == -1:
+            self.reset(start_id, goal_id)
+        elif goal_id != self.goal:
+            # D* Lite key modifier: old keys stay lower bounds for the new goal
+            self.km += self.distance(self.goal, goal_id)
+            self.goal = goal_id
+
+        self.compute_shortest_path()
+        path = self.path_from(start_id)
+        if path is None and self.root != start_id:
+            # The chaser left the optimal root-to-goal path: search again from the chaser
+            self.reset(start_id, goal_id)
+            self.compute_shortest_path()
+            path = self.path_from(start_id)
+        if path is None:
+            return []
+
+        return [((index % width) * TILE_SIZE, (index // width) * TILE_SIZE) for index in path]
+
+    def stats(self):
+        """Get planner counters"""
+        return {
+            "plans": self.plans,
+            "reroots": self.reroots,
+            "nodes_expanded": self.nodes_expanded,
+        }
+
+# === Flow Field ===
+
+# Step direction codes stored in FlowField.directions (code -> (dx, dy) in tiles)
+FLOW_NONE = 0
+FLOW_STEPS = [None, (0, -1), (1, 0), (0, 1), (-1, 0)]
+
+class FlowField:
+    """
+    Shared "next step toward the target" field over the whole maze
+
+    One reverse BFS from the target tile stores, for every reachable tile, the
+    direction of the next step along a shortest path. Any number of chasers can
+    then move with an O(1) lookup, so pathfinding cost no longer grows with the
+    number of enemies. The field is rebuilt only when the target enters a new
+    tile or the maze (or one of its tiles) changes.
+    """
+    def __init__(self):
+        self.grid = None
+        self.cells = b""  # Snapshot of its tiles, in case the grid is edited in place
+        self.target = None
+        self.directions = bytearray()
+        self.distances = array('i')
+        self.builds = 0
+
+    def update(self, target_tile):
+        """Rebuild the field if the target tile or the maze changed. Returns True if rebuilt."""
+        if MAZE is None:
+            return False
+        if self.grid is MAZE and self.target == target_tile and self.cells == MAZE.cells:
+            return False
+        self.build(target_tile)
+        return True
+
+    def build(self, target_tile):
+        """Run a reverse BFS from target_tile over the current MAZE"""
+        grid = MAZE
+        width, height = grid.width, grid.height
+        cells = grid.cells
+        directions = bytearray(width * height)
+        distances = array('i', [-1]) * (width * height)
+
+        self.grid = grid
+        self.cells = bytes(cells)
+        self.target = target_tile
+        self.directions = directions
+        self.distances = distances
+        self.builds += 1
+
+        col, row = target_tile
+        if not grid.is_walkable(col, row):
+            return
+
+        start = row * width + col
+        distances[start] = 0
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            next_distance = distances[current] + 1
+            col = current % width
+
+            # Each neighbor stores the direction that leads back to current
+            # North neighbor steps south (3), east steps west (4), south steps north (1), west steps east (2)
+            if current >= width:
+                neighbor = current - width
+                if cells[neighbor] == 0 and distances[neighbor] < 0:
+                    distances[neighbor] = next_distance
+                    directions[neighbor] = 3
+                    queue.append(neighbor)
+            if col < width - 1:
+                neighbor = current + 1
+                if cells[neighbor] == 0 and distances[neighbor] < 0:
+                    distances[neighbor] = next_distance
+                    directions[neighbor] = 4
+                    queue.append(neighbor)
+            if current < (height - 1) * width:
+                neighbor = current + width
+                if cells[neighbor] == 0 and distances[neighbor] < 0:
+                    distances[neighbor] = next_distance
+                    directions[neighbor] = 1
+                    queue.append(neighbor)
+            if col > 0:
+                neighbor = current - 1
+                if cells[neighbor] == 0 and distances[neighbor] < 0:
+                    distances[neighbor] = next_distance
+                    directions[neighbor] = 2
+                    queue.append(neighbor)
+
+    def distance(self, col, row):
+        """Get the number of steps from a tile to the target (-1 if unreachable)"""
+        if self.grid is None or not self.grid.in_bounds(col, row):
+            return -1
+        return self.distances[row * self.grid.width + col]
+
+    def next_step(self, col, row):
+        """Get the next tile toward the target, or None if at the target or unreachable"""
+        if self.grid is None or not self.grid.in_bounds(col, row):
+            return None
+        step = FLOW_STEPS[self.directions[row * self.grid.width + col]]
+        if step is None:
+            return None
+        return (col + step[0], row + step[1])
+
+    def path_from(self, start, max_steps=None):
+        """
+        Follow the field from a pixel position
+        Args:
+            start: (x, y) in pixel coordinates
+            max_steps: Stop after this many steps (None for the whole path)
+        Returns:
+            List of (x, y) positions in pixel coordinates, in the same format as a_star
+        """
+        path = []
+        tile = (start[0] // TILE_SIZE, start[1] // TILE_SIZE)
+        while max_steps is None or len(path) < max_steps:
+            tile = self.next_step(*tile)
+            if tile is None:
+                break
+            path.append((tile[0] * TILE_SIZE, tile[1] * TILE_SIZE))
+        return path
+
+# Flow field shared by every enemy chasing the player
+flow_field = FlowField()
 
 def random_walkable_position(level_number=None):
     """Find a random walkable position in the maze"""
@@ -1135,12 +2846,15 @@ def random_walkable_position(level_number=None):
     else:
         cols, rows = constants.MAZE_COLS, constants.MAZE_ROWS
     
-    while attempts < max_attempts:
-        x = random.randint(0, cols - 1) * TILE_SIZE
-        y = random.randint(0, rows - 1) * TILE_SIZE
-        if is_path(x + TILE_SIZE // 2, y + TILE_SIZE // 2):
-            return x, y
-        attempts += 1
+    if MAZE is not None:
+        cols, rows = min(cols, MAZE.width), min(rows, MAZE.height)
+        cells, width = MAZE.cells, MAZE.width
+        while attempts < max_attempts:
+            col = random.randint(0, cols - 1)
+            row = random.randint(0, rows - 1)
+            if cells[row * width + col] == 0:
+                return col * TILE_SIZE, row * TILE_SIZE
+            attempts += 1
     
     # Fallback: return a default position if no walkable position found
     print("Warning: Could not find walkable position, using fallback")
@@ -1193,11 +2907,11 @@ def get_non_overlapping_positions():
 def test_maze():
     """Test the maze generation"""
     print("Testing maze generation...")
-    test_maze = generate_maze(21, 21)
+    test_maze = MazeGrid.from_rows(generate_maze(21, 21))
     
     # Count walkable tiles
-    walkable = sum(1 for row in test_maze for tile in row if tile == 0)
-    total = len(test_maze) * len(test_maze[0])
+    walkable = test_maze.walkable_count()
+    total = test_maze.width * test_maze.height
     print(f"Generated maze: {walkable}/{total} walkable tiles ({walkable/total*100:.1f}%)")
     
     # Test position finding
@@ -8,6 +8,7 @@ from menu_system import *
 from music_manager import setup_menu_music, setup_game_music
 from game_state import initialize_game_state, kill_all_sprite
 from config import save_config, load_config
+from text_cache import get_font
 
 config = load_config()
 
@@ -157,7 +158,7 @@ def draw_menu_background():
     screen.fill(constants.WHITE)
     
     # Draw title
-    title_font = pygame.font.Font("assets/Cubic_11.ttf", 48)
+    title_font = get_font("assets/Cubic_11.ttf", 48)
     screen_title = translations[current_language]["title"]
     draw_text_center(screen_title, title_font, constants.BLACK, screen, constants.HEIGHT // 4)
     
@@ -210,6 +211,12 @@ def handle_menu_action(action):
             initialize_game_state(regenerate_maze_flag=True, game_mode="random")
             result = main_game_loop()
             setup_menu_music()
+        elif selected_mode == "horde_mode":
+            # Horde mode - random maze chased by hundreds of pursuers
+            main_game_loop = get_game_logic()
+            initialize_game_state(regenerate_maze_flag=True, game_mode="horde")
+            result = main_game_loop()
+            setup_menu_music()
         # If user pressed back, do nothing and return to main menu
         return True  # Continue menu loop
         
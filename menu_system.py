@@ -5,6 +5,7 @@ import constants
 from assets import *
 from translations import translations, current_language
 from config import save_config, load_config
+from text_cache import render_text, get_font
 
 config = load_config()
 
@@ -24,7 +25,7 @@ def get_menu_functions():
 def draw_text_center(text, font, color, surface, y):
     if font is None:
         raise RuntimeError("Font not initialized")
-    text_surface = font.render(text, True, color)
+    text_surface = render_text(font, text, color)
     text_rect = text_surface.get_rect(center=(constants.WIDTH // 2, y))
     surface.blit(text_surface, text_rect)
     return text_rect  # Returns position to detect mouse collision
@@ -59,7 +60,7 @@ class BaseMenuHandler:
         self.background_color = background_color
         self.running = True
         self.font = font
-        self.title_font = pygame.font.Font("assets/Cubic_11.ttf", 36)
+        self.title_font = get_font("assets/Cubic_11.ttf", 36)
         
         if screen is None:
             raise RuntimeError("Screen not initialized")
@@ -171,6 +172,7 @@ class SettingsMenuHandler(BaseMenuHandler):
     def __init__(self, title, options):
         super().__init__(title, options)
         self.fullscreen_handler = FullscreenMenuHandler()
+        self.start_y = constants.HEIGHT // 2 - 50  # Seven options still fit at 800x600
     
     def get_dynamic_options(self):
         """Get options with dynamic text for fullscreen toggle"""
@@ -180,9 +182,25 @@ class SettingsMenuHandler(BaseMenuHandler):
             MenuOption(translations[current_language]["difficulty"], "difficulty"),
             MenuOption(translations[current_language]["resolution"], "resolution"),
             MenuOption(self.fullscreen_handler.get_current_mode_text(), "fullscreen"),
+            MenuOption(self.get_frame_cap_text(), "frame_cap"),
             MenuOption(translations[current_language]["back"], "back")
         ]
     
+    def get_frame_cap_text(self):
+        """Get text for the frame cap option, e.g. "Frame Cap: 60" """
+        cap = constants.FRAME_CAP
+        value = str(cap) if cap else translations[current_language]["uncapped"]
+        return f"{translations[current_language]['frame_cap']}: {value}"
+    
+    def cycle_frame_cap(self):
+        """Switch to the next frame cap in FRAME_CAP_OPTIONS and save it (applies from the next frame)"""
+        global config
+        options = constants.FRAME_CAP_OPTIONS
+        index = options.index(constants.FRAME_CAP) if constants.FRAME_CAP in options else -1
+        constants.FRAME_CAP = options[(index + 1) % len(options)]
+        config["frame_cap"] = constants.FRAME_CAP
+        save_config(config)
+    
     def get_option_rect(self, i):
         """Get the rect for a specific option"""
         start_y = constants.HEIGHT // 2 if not hasattr(self, 'start_y') else self.start_y
@@ -256,6 +274,8 @@ class SettingsMenuHandler(BaseMenuHandler):
                 game_logic.screen = new_screen
             else:
                 print("Failed to toggle fullscreen mode")
+        elif option.action == "frame_cap":
+            self.cycle_frame_cap()
         return None
 
 class LanguageMenuHandler(BaseMenuHandler):
@@ -441,7 +461,7 @@ class SoundSettingHandler:
         
         # Draw volume percentage
         vol_percent = int(volume * 100)
-        vol_text = font.render(f"{vol_percent}%", True, constants.BLACK)
+        vol_text = render_text(font, f"{vol_percent}%", constants.BLACK)
         screen.blit(vol_text, (self.slider_x + self.slider_width + 20, y_pos - font.get_height() // 2))
         
         return bar_rect, knob_rect
@@ -565,7 +585,7 @@ class ResolutionMenuHandler(BaseMenuHandler):
         
         # Display message
         message = translations[current_language]["resolution_restart_note"]
-        text_surface = self.font.render(message, True, constants.WHITE)
+        text_surface = render_text(self.font, message, constants.WHITE)
         text_rect = text_surface.get_rect(center=(constants.WIDTH//2, constants.HEIGHT//2))
         screen.blit(text_surface, text_rect)
         
@@ -577,7 +597,7 @@ class ResolutionMenuHandler(BaseMenuHandler):
         # Display current resolution
         current_res = f"{self.config['resolution_width']}x{self.config['resolution_height']}"
         current_text = f"{translations[current_language]['current_resolution']} {current_res}"
-        text_surface = self.font.render(current_text, True, constants.BLACK)
+        text_surface = render_text(self.font, current_text, constants.BLACK)
         text_rect = text_surface.get_rect(center=(constants.WIDTH//2, constants.HEIGHT//4 + 60))
         screen.blit(text_surface, text_rect)
 
@@ -665,7 +685,7 @@ class LevelSelectionMenuHandler(BaseMenuHandler):
                 prev_button_x = constants.WIDTH // 2 - 120
                 prev_hover_rect = pygame.Rect(prev_button_x - 50, nav_y - 25, 100, 50)
                 prev_color = constants.RED if prev_hover_rect.collidepoint(mouse_pos) else constants.GRAY
-                prev_text_surface = self.font.render(nav_options[0].text, True, prev_color)
+                prev_text_surface = render_text(self.font, nav_options[0].text, prev_color)
                 prev_rect = prev_text_surface.get_rect(center=(prev_button_x, nav_y))
                 screen.blit(prev_text_surface, prev_rect)
                 option_rects.append((nav_options[0], prev_hover_rect))
@@ -674,7 +694,7 @@ class LevelSelectionMenuHandler(BaseMenuHandler):
                 next_button_x = constants.WIDTH // 2 + 120
                 next_hover_rect = pygame.Rect(next_button_x - 50, nav_y - 25, 100, 50)
                 next_color = constants.RED if next_hover_rect.collidepoint(mouse_pos) else constants.GRAY
-                next_text_surface = self.font.render(nav_options[1].text, True, next_color)
+                next_text_surface = render_text(self.font, nav_options[1].text, next_color)
                 next_rect = next_text_surface.get_rect(center=(next_button_x, nav_y))
                 screen.blit(next_text_surface, next_rect)
                 option_rects.append((nav_options[1], next_hover_rect))
@@ -725,6 +745,9 @@ class GameModeMenuHandler(BaseMenuHandler):
             MenuOption(translations[current_language]["random_mode"], "random_mode"),
             MenuOption(translations[current_language]["back"], "back")
         ]
+        from horde import NUMPY_AVAILABLE
+        if NUMPY_AVAILABLE:
+            options.insert(2, MenuOption(translations[current_language]["horde_mode"], "horde_mode"))
         super().__init__(title, options, constants.WHITE)
         self.start_y = constants.HEIGHT // 2
     
@@ -739,5 +762,8 @@ class GameModeMenuHandler(BaseMenuHandler):
         elif option.action == "random_mode":
             self.running = False
             return "random_mode"
+        elif option.action == "horde_mode":
+            self.running = False
+            return "horde_mode"
         return None
 
@@ -0,0 +1,295 @@
+import os
+import time
+import atexit
+import multiprocessing
+from multiprocessing import shared_memory
+import constants
+
+# Opt-in background pathfinding (constants.PATHFINDING_WORKER).
+# The maze is written into a shared memory block whenever it is loaded or
+# regenerated, so the worker process never receives it through the pipe.
+# Enemies submit (start, goal) requests that are sent to the worker in one
+# batch per frame, and collect finished paths with a non-blocking poll.
+
+# Shared memory layout: width (4 bytes), height (4 bytes), then one byte per tile
+HEADER_SIZE = 8
+
+def write_grid(grid):
+    """Copy a MazeGrid into a new shared memory block. Returns the block."""
+    block = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + len(grid.cells))
+    block.buf[0:4] = grid.width.to_bytes(4, "little")
+    block.buf[4:8] = grid.height.to_bytes(4, "little")
+    block.buf[HEADER_SIZE:HEADER_SIZE + len(grid.cells)] = grid.cells
+    return block
+
+def read_grid(name):
+    """Build a MazeGrid from the shared memory block called name"""
+    from maze import MazeGrid
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        width = int.from_bytes(block.buf[0:4], "little")
+        height = int.from_bytes(block.buf[4:8], "little")
+        return MazeGrid(width, height, block.buf[HEADER_SIZE:HEADER_SIZE + width * height])
+    finally:
+        block.close()
+
+def worker_main(conn):
+    """
+    Worker process loop
+    Messages received:
+        ("maze", block_name, version, level_number, method): switch to a new maze
+        ("paths", version, method, [(request_id, start, goal), ...]): run a batch of searches
+        ("stop",): exit
+    Replies to each batch with ("paths", version, [(request_id, path), ...])
+    """
+    import maze
+
+    # Background work: the worker only gets the CPU the game leaves over. Otherwise, on a
+    # single core, every batch sent would wake the worker and preempt the frame that sent it
+    # (it then runs while the game waits on its frame cap; uncapped, it helps on multi-core only)
+    try:
+        if hasattr(os, "SCHED_IDLE"):
+            os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+        elif hasattr(os, "nice"):
+            os.nice(19)
+    except OSError:
+        pass
+
+    # The worker runs searches itself; it must never start another worker or queue them
+    constants.PATHFINDING_WORKER = False
+    constants.PATHFINDING_BUDGET_US = 0
+    version = None
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break  # Game closed
+        kind = message[0]
+
+        if kind == "stop":
+            break
+        elif kind == "maze":
+            _, name, new_version, level_number, method = message
+            try:
+                grid = read_grid(name)
+            except FileNotFoundError:
+                continue  # Already replaced by a newer maze
+            maze.MAZE = grid
+            constants.ENEMY_PATHFINDING = method
+            maze.prepare_pathfinding(level_number)
+            version = new_version
+        elif kind == "paths":
+            _, batch_version, method, batch = message
+            if batch_version != version:
+                results = [(request_id, []) for request_id, start, goal in batch]
+            else:
+                results = [(request_id, maze.find_path(start, goal, method)) for request_id, start, goal in batch]
+            conn.send(("paths", batch_version, results))
+
+class PathWorker:
+    """
+    Main-process side of the background pathfinding worker
+
+    Instrumentation: submitted and completed requests, batches sent, results
+    dropped because the maze changed, and request latency; see stats().
+    """
+    def __init__(self):
+        self.process = None
+        self.conn = None
+        self.block = None
+        self.version = 0
+        self.next_request_id = 0
+        self.batch = []  # (request_id, start, goal) waiting to be sent
+        self.request_of = {}  # owner -> request_id of its outstanding request
+        self.owner_of = {}  # request_id -> owner
+        self.sent_at = {}  # request_id -> perf_counter() at submit
+        self.results = {}  # owner -> finished path
+        atexit.register(self.stop)  # Once: stop() is harmless when no worker is running
+
+        # Instrumentation
+        self.submitted = 0
+        self.completed = 0
+        self.batches_sent = 0
+        self.stale_results = 0
+        self.total_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+
+    def enabled(self):
+        """
+        Check whether searches go to the worker: it is switched on (constants.PATHFINDING_WORKER)
+        and its process is alive. A worker found dead is dropped, so searches run in the game
+        process again until the next maze starts a new one.
+        """
+        if not constants.PATHFINDING_WORKER:
+            return False
+        if self.running():
+            return True
+        if self.process is not None:
+            self.lost()
+        return False
+
+    def running(self):
+        """Check whether the worker process is alive"""
+        return self.process is not None and self.process.is_alive()
+
+    def start(self):
+        """Start the worker process"""
+        if self.running():
+            return
+        # Spawn rather than fork, so the worker does not inherit the game's SDL state
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        print("Pathfinding worker started")
+
+    def stop(self):
+        """Stop the worker process and free the shared maze"""
+        if self.process is not None:
+            try:
+                self.conn.send(("stop",))
+            except (OSError, ValueError):
+                pass
+            self.process.join(timeout=1)
+            if self.process.is_alive():
+                self.process.terminate()
+            self.conn.close()
+            self.process = None
+            self.conn = None
+        self.release_block()
+        self.clear()
+
+    def lost(self):
+        """Drop a worker process that died or stopped answering, with all of its outstanding requests"""
+        print(f"Pathfinding worker lost (exit code {self.process.exitcode}), searching in the game process")
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+        self.process = None
+        self.conn = None
+        self.release_block()
+        self.clear()
+
+    def release_block(self):
+        """Free the current shared memory block"""
+        if self.block is not None:
+            self.block.close()
+            self.block.unlink()
+            self.block = None
+
+    def clear(self):
+        """Forget every outstanding request and result"""
+        self.batch.clear()
+        self.request_of.clear()
+        self.owner_of.clear()
+        self.sent_at.clear()
+        self.results.clear()
+
+    def publish_maze(self, grid, level_number=None):
+        """
+        Write a new maze to shared memory and switch the worker to it
+        Args:
+            grid: MazeGrid that was just loaded or generated
+            level_number: Level number, or None for a random maze
+        """
+        self.start()
+        old_block = self.block
+        self.block = write_grid(grid)
+        self.version += 1
+        self.clear()  # Paths for the old maze are useless now
+        self.conn.send(("maze", self.block.name, self.version, level_number, constants.ENEMY_PATHFINDING))
+        if old_block is not None:
+            # The worker copies the grid when it switches, so the old block is no longer needed
+            old_block.close()
+            old_block.unlink()
+
+    def submit(self, owner, start, goal):
+        """
+        Ask for a path for owner; it is sent with the next flush()
+        Returns:
+            False if owner already has a request outstanding, otherwise True
+        """
+        if owner in self.request_of:
+            return False
+        request_id = self.next_request_id
+        self.next_request_id += 1
+        self.request_of[owner] = request_id
+        self.owner_of[request_id] = owner
+        self.sent_at[request_id] = time.perf_counter()
+        self.batch.append((request_id, start, goal))
+        self.submitted += 1
+        return True
+
+    def pending(self, owner):
+        """Check whether owner has a request outstanding"""
+        return owner in self.request_of
+
+    def flush(self):
+        """Send the requests submitted since the last flush as one batch"""
+        if not self.batch or not self.enabled():
+            return
+        try:
+            self.conn.send(("paths", self.version, constants.ENEMY_PATHFINDING, self.batch))
+        except (OSError, ValueError):
+            self.lost()
+            return
+        self.batch = []
+        self.batches_sent += 1
+
+    def poll(self):
+        """Collect every reply that has already arrived, without blocking"""
+        if self.conn is None:
+            return
+        now = time.perf_counter()
+        try:
+            replies = []
+            while self.conn.poll():
+                replies.append(self.conn.recv())
+        except (EOFError, OSError):
+            self.lost()
+            return
+        for _, version, results in replies:
+            if version != self.version:
+                self.stale_results += len(results)
+                continue
+            for request_id, path in results:
+                owner = self.owner_of.pop(request_id, None)
+                if owner is None:
+                    continue  # Owner was cancelled
+                del self.request_of[owner]
+                latency_ms = (now - self.sent_at.pop(request_id)) * 1000
+                self.total_latency_ms += latency_ms
+                self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+                self.results[owner] = path
+                self.completed += 1
+
+    def result(self, owner):
+        """Collect owner's finished path, or None if it has not arrived yet"""
+        self.poll()
+        return self.results.pop(owner, None)
+
+    def cancel(self, owner):
+        """Forget owner's request and any unclaimed result"""
+        request_id = self.request_of.pop(owner, None)
+        if request_id is not None:
+            self.owner_of.pop(request_id, None)
+            self.sent_at.pop(request_id, None)
+        self.results.pop(owner, None)
+
+    def stats(self):
+        """Get worker counters"""
+        return {
+            "running": self.running(),
+            "outstanding": len(self.request_of),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "batches_sent": self.batches_sent,
+            "stale_results": self.stale_results,
+            "avg_latency_ms": self.total_latency_ms / self.completed if self.completed else 0.0,
+            "max_latency_ms": self.max_latency_ms,
+        }
+
+# Background pathfinding service (only started when constants.PATHFINDING_WORKER is on)
+path_worker = PathWorker()
@@ -0,0 +1,55 @@
+# Sprite pools: enemies, items and keys are recycled across respawns and
+# resets instead of being constructed again, so play allocates (almost)
+# nothing and the garbage collector has nothing to chase.
+
+class SpritePool:
+    """
+    Free list of sprites of one class
+
+    acquire(*args) hands out a released sprite after calling its
+    reset(*args), or constructs cls(*args) when the pool is empty.
+    release(sprite) kills the sprite (removing it from its groups and the
+    ECS world) and keeps it for the next acquire.
+
+    Instrumentation: hits (recycled), misses (constructed) and releases; see stats().
+    """
+    def __init__(self, cls):
+        self.cls = cls
+        self.free = []
+
+        # Instrumentation
+        self.hits = 0
+        self.misses = 0
+        self.releases = 0
+
+    def acquire(self, *args):
+        """Get a sprite in the state cls(*args) would create"""
+        if self.free:
+            self.hits += 1
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            return sprite
+        self.misses += 1
+        return self.cls(*args)
+
+    def release(self, sprite):
+        """Take a sprite out of play and keep it for reuse"""
+        sprite.kill()
+        self.free.append(sprite)
+        self.releases += 1
+
+    def release_all(self, group):
+        """Release every sprite of a group"""
+        for sprite in group.sprites():
+            self.release(sprite)
+
+    def stats(self):
+        """Get pool counters"""
+        acquires = self.hits + self.misses
+        return {
+            "free": len(self.free),
+            "hits": self.hits,
+            "misses": self.misses,
+            "releases": self.releases,
+            "hit_rate": self.hits / acquires if acquires else 0.0,
+        }
@@ -1,5 +1,9 @@
 import pygame
 import constants
+from collections import OrderedDict
+from text_cache import render_text, get_atlas
+from ecs import world
+from camera import interpolate
 from translations import translations, current_language
 
 # Global variable to be set by main.py
@@ -13,7 +17,13 @@ def get_assets():
     from assets import font, item_images, exit_image
     return font, item_images, exit_image
 
-def draw_game_screen():
+def draw_game_screen(alpha=1.0):
+    """
+    Draw all game elements with camera offset
+    Args:
+        alpha: How far rendering is between the last two simulation steps (0.0 to 1.0);
+            the player, enemies and the horde are drawn that far along their last move
+    """
     if screen is None:
         raise RuntimeError("Screen not initialized")
         
@@ -23,84 +33,158 @@ def draw_game_screen():
     # Get current maze
     from maze import MAZE
 
-    """Draw all game elements with camera offset"""
     # Update camera
-    game_state.update_camera()
+    game_state.update_camera(alpha)
     
     # Clear screen
     screen.fill(constants.BLACK)
     
-    # Draw maze with camera offset
-    visible_area = game_state.camera.get_visible_area()
-    
-    # Calculate the range of tiles that need to be rendered
-    start_col = max(0, int(visible_area.left // constants.TILE_SIZE))
-    end_col = min(len(MAZE[0]), int((visible_area.right // constants.TILE_SIZE) + 1))
-    start_row = max(0, int(visible_area.top // constants.TILE_SIZE))
-    end_row = min(len(MAZE), int((visible_area.bottom // constants.TILE_SIZE) + 1))
-    
-    for row_idx in range(start_row, end_row):
-        for col_idx in range(start_col, end_col):
-            if row_idx < len(MAZE) and col_idx < len(MAZE[0]):
-                tile = MAZE[row_idx][col_idx]
-                color = constants.GRAY if tile == 0 else constants.BLACK
-                world_rect = pygame.Rect(col_idx * constants.TILE_SIZE, row_idx * constants.TILE_SIZE, constants.TILE_SIZE, constants.TILE_SIZE)
-                screen_rect = game_state.camera.apply(world_rect)
-                pygame.draw.rect(screen, color, screen_rect)
+    # Draw maze with camera offset: one blit per pre-drawn chunk in view
+    maze_chunks.draw(screen, game_state.camera, MAZE)
 
-    # Draw sprites with camera offset
-    draw_sprites_with_camera(game_state.item_group)
-    draw_sprites_with_camera(game_state.key_group)
+    # Draw items and the key (every Renderable entity) with camera offset, in one blits call
+    world.render(screen, game_state.camera)
     
     # Draw exit
     exit_screen_rect = game_state.camera.apply(game_state.game_exit_rect)
     screen.blit(exit_image, exit_screen_rect.topleft)
 
-    # Draw enemies with special effects
-    for enemy in game_state.enemy_group:
-        enemy_screen_rect = game_state.camera.apply(enemy.rect)
-        # Only draw enemies within the visible area
-        if enemy_screen_rect.colliderect(pygame.Rect(0, 0, constants.WIDTH, constants.HEIGHT)):
-            # Create a temporary surface to draw the enemy effects
-            temp_surface = pygame.Surface((enemy.rect.width, enemy.rect.height), pygame.SRCALPHA)
-            enemy.draw(temp_surface)
-            screen.blit(temp_surface, enemy_screen_rect.topleft)
-
-    # Draw player with effects
-    player_screen_rect = game_state.camera.apply(game_state.player.rect)
-    # Create a larger temporary surface to hold the stamina bar
-    temp_surface_width = game_state.player.rect.width
-    temp_surface_height = game_state.player.rect.height + 20  # Add 20 pixels to the stamina bar
-    temp_surface = pygame.Surface((temp_surface_width, temp_surface_height), pygame.SRCALPHA)
-    
-    # Draw the player on a temporary surface (offset to the bottom)
-    temp_surface.blit(game_state.player.image, (0, 20))
-    
-    # Drawing acceleration effect
-    if game_state.player.is_boost and len(game_state.player.boost_frames) > 0:
-        temp_surface.blit(game_state.player.boost_frames[game_state.player.boost_current_frame], (0, 20))
-    
-    # Draw the stamina bar at the top
-    game_state.player.draw_stamina_bar_at_top(temp_surface)
-    
-    # Adjust drawing position
-    adjusted_rect = pygame.Rect(player_screen_rect.x, player_screen_rect.y - 20, temp_surface_width, temp_surface_height)
-    screen.blit(temp_surface, adjusted_rect.topleft)
+    # Draw enemies and player with special effects
+    draw_enemies(game_state.camera, game_state.enemy_group, alpha)
+    if game_state.horde is not None:
+        game_state.horde.draw(screen, game_state.camera, alpha)
+    draw_player(game_state.camera, game_state.player, alpha)
 
     # Draw UI (UI elements don't use camera offset)
     draw_ui()
 
     pygame.display.flip()
 
-def draw_sprites_with_camera(sprite_group):
-    """Drawing sprite groups using camera offset"""
-    game_state = get_game_state()
-    
-    for sprite in sprite_group:
-        screen_rect = game_state.camera.apply(sprite.rect)
-        # Only draw sprites within the visible area
-        if screen_rect.colliderect(pygame.Rect(0, 0, constants.WIDTH, constants.HEIGHT)):
-            screen.blit(sprite.image, screen_rect.topleft)
+class MazeChunkCache:
+    """
+    The maze floor pre-drawn into square chunk surfaces of CHUNK_TILES x CHUNK_TILES tiles
+
+    Chunks are drawn the first time they enter the camera's view and kept in
+    an LRU cache; when resident memory passes CHUNK_CACHE_BYTES the least
+    recently drawn chunks are dropped (never the ones on screen). Memory use
+    therefore follows the screen size, not the maze size. The cache is
+    cleared whenever MAZE is replaced or its tiles change.
+
+    Instrumentation: hits, misses, evictions and resident bytes; see stats().
+    """
+    def __init__(self):
+        self.chunks = OrderedDict()  # (chunk_col, chunk_row) -> Surface, least recently used first
+        self.grid = None  # MazeGrid the chunks were drawn from
+        self.cells = b""  # Snapshot of its tiles, in case the grid is edited in place
+        self.resident_bytes = 0
+        
+        # Instrumentation
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def check_grid(self, grid):
+        """Drop every chunk if the maze changed since they were drawn"""
+        if self.grid is not grid or self.cells != grid.cells:
+            self.chunks.clear()
+            self.resident_bytes = 0
+            self.grid = grid
+            self.cells = bytes(grid.cells)
+
+    def draw(self, surface, camera, grid):
+        """Blit the chunks covering the camera's visible area onto surface"""
+        self.check_grid(grid)
+        chunk_pixels = constants.CHUNK_TILES * constants.TILE_SIZE
+        world = pygame.Rect(0, 0, grid.width * constants.TILE_SIZE, grid.height * constants.TILE_SIZE)
+        visible_area = camera.get_visible_area().clip(world)
+        if visible_area.width <= 0 or visible_area.height <= 0:
+            return
+        
+        first_col, last_col = visible_area.left // chunk_pixels, (visible_area.right - 1) // chunk_pixels
+        first_row, last_row = visible_area.top // chunk_pixels, (visible_area.bottom - 1) // chunk_pixels
+        for chunk_row in range(first_row, last_row + 1):
+            for chunk_col in range(first_col, last_col + 1):
+                chunk = self.get_chunk(chunk_col, chunk_row)
+                surface.blit(chunk, camera.apply_pos((chunk_col * chunk_pixels, chunk_row * chunk_pixels)))
+        self.evict((last_col - first_col + 1) * (last_row - first_row + 1))
+
+    def get_chunk(self, chunk_col, chunk_row):
+        """Get a chunk surface, drawing it on a miss"""
+        key = (chunk_col, chunk_row)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.hits += 1
+            self.chunks.move_to_end(key)
+            return chunk
+        
+        self.misses += 1
+        chunk = self.render_chunk(chunk_col, chunk_row)
+        self.chunks[key] = chunk
+        self.resident_bytes += chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+        return chunk
+
+    def render_chunk(self, chunk_col, chunk_row):
+        """Draw the floor tiles of one chunk (walls stay the background color)"""
+        grid = self.grid
+        tile_size = constants.TILE_SIZE
+        first_col, first_row = chunk_col * constants.CHUNK_TILES, chunk_row * constants.CHUNK_TILES
+        last_col = min(grid.width, first_col + constants.CHUNK_TILES)
+        last_row = min(grid.height, first_row + constants.CHUNK_TILES)
+        
+        chunk = pygame.Surface(((last_col - first_col) * tile_size, (last_row - first_row) * tile_size))
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+        chunk.fill(constants.BLACK)
+        
+        cells, width = grid.cells, grid.width
+        for row_idx in range(first_row, last_row):
+            row_start = row_idx * width
+            for col_idx in range(first_col, last_col):
+                if cells[row_start + col_idx] == 0:
+                    chunk.fill(constants.GRAY, ((col_idx - first_col) * tile_size, (row_idx - first_row) * tile_size, tile_size, tile_size))
+        return chunk
+
+    def evict(self, keep):
+        """Drop least recently used chunks while over the memory cap, keeping the newest keep (on screen)"""
+        while self.resident_bytes > constants.CHUNK_CACHE_BYTES and len(self.chunks) > keep:
+            _, chunk = self.chunks.popitem(last=False)
+            self.resident_bytes -= chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+            self.evictions += 1
+
+    def stats(self):
+        """Get cache counters"""
+        lookups = self.hits + self.misses
+        return {
+            "chunks": len(self.chunks),
+            "resident_bytes": self.resident_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+# Floor chunks of the current maze
+maze_chunks = MazeChunkCache()
+
+def draw_enemies(camera, enemies, alpha=1.0):
+    """Draw enemies with their attack/freeze effects straight onto the screen"""
+    # The clip keeps each enemy's layers inside its rect, without a temporary surface per enemy
+    screen_bounds = screen.get_rect()
+    for enemy in enemies:
+        enemy_screen_rect = camera.apply(pygame.Rect(interpolate(enemy, alpha), enemy.rect.size))
+        # Only draw enemies within the visible area
+        if enemy_screen_rect.colliderect(screen_bounds):
+            screen.set_clip(enemy_screen_rect)
+            enemy.draw(screen, enemy_screen_rect.topleft)
+    screen.set_clip(None)
+
+def draw_player(camera, player, alpha=1.0):
+    """Draw the player, its boost effect and the stamina bar in the 20 pixels above it"""
+    player_screen_rect = camera.apply(pygame.Rect(interpolate(player, alpha), player.rect.size))
+    screen.set_clip(player_screen_rect.x, player_screen_rect.y - 20, player.rect.width, player.rect.height + 20)
+    player.draw(screen, player_screen_rect.topleft)
+    player.draw_stamina_bar_at_top(screen, (player_screen_rect.x, player_screen_rect.y - 20), player.rect.width)
+    screen.set_clip(None)
 
 def draw_ui():
     """Draw UI elements (UI is not affected by the camera)"""
@@ -110,12 +194,12 @@ def draw_ui():
     # Timer (using adjusted time)
     elapsed_time = game_state.get_elapsed_time()
     remain_time = max(0, int((constants.INVISIBLE_DURATION - elapsed_time) / 1000))
-    screen.blit(font.render(f"{translations[current_language]['invisible_time']} {remain_time}s", True, constants.YELLOW), (10, 10))
+    get_atlas(font, constants.YELLOW).draw(screen, (10, 10), f"{translations[current_language]['invisible_time']} ", remain_time, "s")
     
     # Game mode and level info (top center)
     if game_state.game_mode == "level":
         level_text = f"{translations[current_language]['level']} {game_state.current_level}"
-        level_surface = font.render(level_text, True, constants.WHITE)
+        level_surface = render_text(font, level_text, constants.WHITE)
         level_rect = level_surface.get_rect()
         level_rect.centerx = constants.WIDTH // 2
         level_rect.y = 10
@@ -123,7 +207,7 @@ def draw_ui():
     
     # Key status
     if game_state.has_key:
-        screen.blit(font.render(translations[current_language]["is_key_obtained"], True, constants.GREEN), (10, 40))
+        screen.blit(render_text(font, translations[current_language]["is_key_obtained"], constants.GREEN), (10, 40))
     
     draw_stamina_ui()
 
@@ -143,7 +227,7 @@ def draw_stamina_ui():
     bar_y = 10
     
     # Label
-    stamina_text = font.render(f"{translations[current_language]['stamina']}: ", True, constants.WHITE)
+    stamina_text = render_text(font, f"{translations[current_language]['stamina']}: ", constants.WHITE)
     screen.blit(stamina_text, (bar_x - stamina_text.get_width() - 5, bar_y - 2))
     
     # Background strips (gray)
@@ -179,31 +263,26 @@ def draw_effects_ui():
     y_start = 70
     line_height = font.get_height() + 25
     icon_size = 40
+    red_text = get_atlas(font, constants.RED)  # Countdowns are drawn from pre-rendered glyphs
     
     current_time = game_state.get_adjusted_time()
 
     # Invincibility
     if game_state.player.invincible:
         left = 3 - (current_time - game_state.player.invincible_start_time) / 1000
-        msg = f"{translations[current_language]['invincible_time']}{max(0,int(left))}s"
-        text_surface = font.render(msg, True, constants.RED)
-        screen.blit(text_surface, (10, y_start))
+        red_text.draw(screen, (10, y_start), translations[current_language]['invincible_time'], max(0, int(left)), "s")
 
     y_next = y_start + line_height
 
     # Red effect
     if game_state.player.conditional_effect_active_red:
         left = constants.RED_DURATION / 1000 - (current_time - game_state.player.conditional_effect_start_time_red) / 1000
-        msg = f"{translations[current_language]['red_time']}{max(0,int(left))}s"
-        text_surface = font.render(msg, True, constants.RED)
         screen.blit(red_icon, (10, y_next))
-        screen.blit(text_surface, (10 + icon_size + 5, y_next))
+        red_text.draw(screen, (10 + icon_size + 5, y_next), translations[current_language]['red_time'], max(0, int(left)), "s")
         y_next += line_height
 
     # Blue effect
     if game_state.player.conditional_effect_active_blue:
         left = constants.BLUE_DURATION / 1000 - (current_time - game_state.player.conditional_effect_start_time_blue) / 1000
-        msg = f"{translations[current_language]['blue_time']}{max(0,int(left))}s"
-        text_surface = font.render(msg, True, constants.RED)
         screen.blit(blue_icon, (10, y_next))
-        screen.blit(text_surface, (10 + icon_size + 5, y_next))
\ No newline at end of file
+        red_text.draw(screen, (10 + icon_size + 5, y_next), translations[current_language]['blue_time'], max(0, int(left)), "s")
\ No newline at end of file
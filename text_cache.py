@@ -0,0 +1,152 @@
+import pygame
+from collections import OrderedDict
+import constants
+
+# Rendered text is cached because font.render is slow (especially for CJK
+# strings in Cubic_11) and most HUD and menu text is identical from frame
+# to frame. Cached surfaces are shared: blit them, never draw on them.
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces keyed by (font, text, color, antialias)
+
+    Eviction starts from the least recently used entry once the cached
+    surfaces take more than TEXT_CACHE_BYTES.
+
+    Instrumentation: hits, misses, evictions and cached bytes; see stats().
+    """
+    def __init__(self):
+        self.surfaces = OrderedDict()  # key -> Surface, least recently used first
+        self.cached_bytes = 0
+
+        # Instrumentation
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Get the surface font.render(text, antialias, color) would return"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.cached_bytes += surface_bytes(surface)
+        while self.cached_bytes > constants.TEXT_CACHE_BYTES and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.cached_bytes -= surface_bytes(evicted)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+        self.cached_bytes = 0
+
+    def stats(self):
+        """Get cache counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "cached_bytes": self.cached_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+def surface_bytes(surface):
+    """Get the pixel memory of a surface"""
+    return surface.get_pitch() * surface.get_height()
+
+# Text cache shared by the HUD and menus
+text_cache = TextCache()
+
+def render_text(font, text, color, antialias=True):
+    """Render text through the shared cache (use instead of font.render for per-frame text)"""
+    return text_cache.render(font, text, color, antialias)
+
+# Fonts loaded by get_font, by (path, size)
+fonts = {}
+
+def get_font(path, size):
+    """Load a font once and reuse it, so its text stays cached"""
+    key = (path, size)
+    if key not in fonts:
+        fonts[key] = pygame.font.Font(path, size)
+    return fonts[key]
+
+class GlyphAtlas:
+    """
+    Pre-rendered glyphs and labels of one font and color, for numbers that change every second
+
+    Digits and unit characters are rendered once when the atlas is created and
+    labels the first time they are drawn. Drawing a value is then a single
+    Surface.blits call, with no font.render, so countdowns never fill the text
+    cache with strings that are shown for one second.
+    """
+    GLYPHS = "0123456789s%:.-/ "
+
+    def __init__(self, font, color, antialias=True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.glyphs = {}  # char -> (Surface, advance)
+        self.labels = {}  # text -> Surface
+        for char in self.GLYPHS:
+            self.add_glyph(char)
+
+    def add_glyph(self, char):
+        """Render one character and remember how far it moves the pen"""
+        surface = self.font.render(char, self.antialias, self.color)
+        self.glyphs[char] = (surface, surface.get_width())
+        return self.glyphs[char]
+
+    def label(self, text):
+        """Get a label surface, rendering it the first time"""
+        surface = self.labels.get(text)
+        if surface is None:
+            surface = self.labels[text] = self.font.render(text, self.antialias, self.color)
+        return surface
+
+    def draw(self, surface, pos, label, value, unit=""):
+        """
+        Draw label followed by value and unit, e.g. draw(screen, (10, 10), "Time ", 12, "s")
+        Args:
+            surface: Surface to draw on
+            pos: (x, y) top-left position
+            label: Fixed text drawn first (may be empty)
+            value: Number (or other short text) drawn glyph by glyph
+            unit: Text drawn glyph by glyph after the value
+        Returns:
+            Width of the drawn text in pixels
+        """
+        x, y = pos
+        sequence = []
+        if label:
+            label_surface = self.label(label)
+            sequence.append((label_surface, (x, y)))
+            x += label_surface.get_width()
+        glyphs = self.glyphs
+        for char in f"{value}{unit}":
+            glyph = glyphs.get(char) or self.add_glyph(char)
+            sequence.append((glyph[0], (x, y)))
+            x += glyph[1]
+        surface.blits(sequence, doreturn=False)
+        return x - pos[0]
+
+# Glyph atlases, by (font, color, antialias)
+atlases = {}
+
+def get_atlas(font, color, antialias=True):
+    """Get the glyph atlas of a font and color, building it on first use"""
+    key = (font, tuple(color), antialias)
+    atlas = atlases.get(key)
+    if atlas is None:
+        atlas = atlases[key] = GlyphAtlas(font, color, antialias)
+    return atlas
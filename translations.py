@@ -42,6 +42,8 @@ translations = {
         "fullscreen": "全螢幕模式",
         "switch_to_windowed": "切換至視窗模式",
         "switch_to_fullscreen": "切換至全螢幕模式",
+        "frame_cap": "幀率上限",
+        "uncapped": "無上限",
         "back": "返回",
         "select_language": "選擇語言",
         "select_language_note" : "更換語言後請重啟遊戲",
@@ -71,6 +73,7 @@ translations = {
         "select_mode": "選擇模式",
         "level_mode": "關卡模式",
         "random_mode": "隨機模式",
+        "horde_mode": "屍潮模式",
         "level": "關卡",
         "select_level": "選擇關卡",
         "locked": "未解鎖",
@@ -99,6 +102,8 @@ translations = {
         "fullscreen": "全屏模式",
         "switch_to_windowed": "切换至窗口模式",
         "switch_to_fullscreen": "切换至全屏模式",
+        "frame_cap": "帧率上限",
+        "uncapped": "无上限",
         "back": "返回",
         "select_language": "选择语言",
         "select_language_note" : "更换语言后请重启游戏",
@@ -128,6 +133,7 @@ translations = {
         "select_mode": "选择模式",
         "level_mode": "关卡模式",
         "random_mode": "随机模式",
+        "horde_mode": "尸潮模式",
         "level": "关卡",
         "select_level": "选择关卡",
         "locked": "未解锁",
@@ -155,6 +161,8 @@ translations = {
         "fullscreen": "Fullscreen Mode",
         "switch_to_windowed": "Switch to Windowed",
         "switch_to_fullscreen": "Switch to Fullscreen",
+        "frame_cap": "Frame Cap",
+        "uncapped": "Uncapped",
         "back": "Back",
         "select_language": "Select Language",
         "select_language_note" : "Please restart game when you change the language",
@@ -184,6 +192,7 @@ translations = {
         "select_mode": "Select Mode",
         "level_mode": "Level Mode",
         "random_mode": "Random Mode",
+        "horde_mode": "Horde Mode",
         "level": "Level",
         "select_level": "Select Level",
         "locked": "Locked",